@@ -1,7 +1,12 @@
 __version__ = '0.7.0'
 
-from .sampling import sample
-from .counting import count
+from .sampling import sample, sample_iter
+from .pool import SamplePool
+from .counting import count, count_stream, CountingState
 from .ranking import rank
 from .utils import (to_scipy, add_dok, adjustscore)
 from .maxdiff import scoring_orme
+from .vocab import Vocabulary, PairCounter
+from . import retention
+from . import storage
+from . import adaptive
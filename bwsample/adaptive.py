@@ -0,0 +1,550 @@
+import heapq
+import numpy as np
+from .vocab import Vocabulary, PairCounter
+from typing import Dict, Tuple, List, Optional, Iterable
+ItemID = str
+
+
+def comparison_counts(dok: Dict[Tuple[ItemID, ItemID], int],
+                      vocab: Optional[Vocabulary] = None
+                      ) -> Dict[ItemID, int]:
+    """The number of pairwise comparisons of each item
+
+    Parameters:
+    -----------
+    dok : Dict[Tuple[ItemID, ItemID], int]
+        Count/Frequency data as Dictionary of Keys (DoK), a `PairCounter`,
+          or a `CountingState` object (also with `backend='pairs'`)
+
+    vocab : Optional[Vocabulary]
+        The item IDs of the `PairCounter` indices
+
+    Returns:
+    --------
+    counts : Dict[ItemID, int]
+        The sum of the `(i, j)` and `(j, i)` frequencies of each item `i`
+    """
+    vocab = getattr(dok, "vocab", vocab)
+    dok = getattr(dok, "agg_dok", dok)
+    if isinstance(dok, PairCounter):
+        if vocab is None:
+            raise Exception("A PairCounter requires its `vocab`.")
+        rows, cols, cnts = dok.coo()
+        n_dim = len(vocab)
+        total = np.bincount(rows, weights=cnts, minlength=n_dim)
+        total += np.bincount(cols, weights=cnts, minlength=n_dim)
+        idx = np.flatnonzero(total)
+        return dict(zip(vocab.decode(idx), total[idx].astype(int).tolist()))
+    counts = {}
+    for (i, j), c in dok.items():
+        counts[i] = counts.get(i, 0) + c
+        counts[j] = counts.get(j, 0) + c
+    return counts
+
+
+class AdaptiveSampler(object):
+    """Compose new BWS sets from items with close scores and few comparisons
+
+    Each new BWS set is anchored at the item with the fewest comparisons.
+      The other items are picked from the `window * (n_items - 1)` items
+      with the closest scores to the anchor, preferring items with fewer
+      comparisons. Sampled items are counted as compared until the next
+      `update_counts`, i.e. subsequent BWS sets move on to other items.
+
+    The items with the fewest comparisons are looked up in a min-heap
+      (with lazy deletion), and the items with close scores in an array of
+      items sorted by score, i.e. a BWS set costs O(n_items log n).
+
+    Parameters:
+    -----------
+    ids : Iterable[ItemID]
+        The item IDs to sample from
+
+    n_items : int
+        Number items per BWS set
+
+    window : Optional[int] = 2
+        Multiple of `n_items - 1` items with close scores to choose from
+
+    seed : Optional[int]
+        Seed to shuffle the items of each BWS set
+
+    Example:
+    --------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+        sampler = bws.adaptive.AdaptiveSampler(examples, n_items=4)
+        samples = sampler.sample(n_sets=5)
+        # ... annotate and count the BWS sets
+        agg_dok, _, _, _, _ = bws.count(evaluations)
+        sampler.update_counts(agg_dok)
+        sampler.update_rank(bws.rank(agg_dok, method='ratio'))
+        samples = sampler.sample(n_sets=5)
+    """
+    def __init__(self, ids: Iterable[ItemID], n_items: int,
+                 window: Optional[int] = 2,
+                 seed: Optional[int] = None):
+        self.n_items = n_items
+        self.window = window
+        self.rng = np.random.default_rng(seed)
+        self.vocab = Vocabulary(ids)
+        n = len(self.vocab)
+        self.counts = np.zeros(n, dtype=np.int64)
+        self.scores = np.zeros(n, dtype=np.float64)
+        self._build_order()
+        self._build_heap()
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    def _grow(self, ids: Iterable[ItemID]) -> np.ndarray:
+        """Intern new item IDs, and return the indices of all `ids`"""
+        n = len(self.vocab)
+        idx = self.vocab.encode(ids)
+        n_new = len(self.vocab) - n
+        if n_new > 0:
+            fill = np.median(self.scores) if n > 0 else 0.0
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(n_new, dtype=np.int64)])
+            self.scores = np.concatenate(
+                [self.scores, np.full(n_new, fill)])
+        return idx
+
+    def _build_order(self):
+        # items sorted by score, and the position of each item
+        self.order = np.argsort(self.scores, kind="stable")
+        self.position = np.empty_like(self.order)
+        self.position[self.order] = np.arange(len(self.order))
+
+    def _build_heap(self):
+        self.heap = list(zip(self.counts.tolist(), range(len(self.counts))))
+        heapq.heapify(self.heap)
+
+    def _push(self, idx: int):
+        heapq.heappush(self.heap, (int(self.counts[idx]), idx))
+        # drop stale heap entries
+        if len(self.heap) > 4 * len(self.counts) + 64:
+            self._build_heap()
+
+    def _pop_anchor(self) -> int:
+        """The item with the fewest comparisons"""
+        while True:
+            cnt, idx = self.heap[0]
+            if cnt == self.counts[idx]:
+                return idx
+            heapq.heappop(self.heap)
+
+    def update_scores(self, ids: Iterable[ItemID],
+                      scores: Iterable[float]) -> 'AdaptiveSampler':
+        """Set the scores of items. Items without score keep their score.
+
+        Parameters:
+        -----------
+        ids : Iterable[ItemID]
+            The item IDs, e.g. `sortedids` of `bws.rank`
+
+        scores : Iterable[float]
+            The score of each item ID
+        """
+        idx = self._grow(list(ids))
+        self.scores[idx] = np.asarray(scores, dtype=np.float64)
+        self._build_order()
+        self._build_heap()
+        return self
+
+    def update_rank(self, ranked: tuple) -> 'AdaptiveSampler':
+        """Set the scores of items from the output of `bws.rank`"""
+        _, sortedids, _, scores, _ = ranked
+        return self.update_scores(sortedids, scores)
+
+    def update_counts(self, dok: Dict[Tuple[ItemID, ItemID], int]
+                      ) -> 'AdaptiveSampler':
+        """Set the comparison counts of items (see `comparison_counts`)
+
+        Parameters:
+        -----------
+        dok : Dict[Tuple[ItemID, ItemID], int]
+            Count/Frequency data as Dictionary of Keys (DoK), e.g. `agg_dok`
+              of `bws.count`, or a `CountingState` object. The pending
+              counts of sampled but not yet counted BWS sets are reset.
+        """
+        counts = comparison_counts(dok)
+        n = len(self.vocab)
+        idx = self._grow(list(counts.keys()))
+        if len(self.vocab) > n:
+            self._build_order()
+        self.counts[:] = 0
+        self.counts[idx] = np.fromiter(
+            counts.values(), dtype=np.int64, count=len(counts))
+        self._build_heap()
+        return self
+
+    def _neighbors(self, anchor: int) -> List[int]:
+        """Items with the closest scores to the anchor item"""
+        n_cand = min(self.window * (self.n_items - 1), len(self.order) - 1)
+        target = self.scores[anchor]
+        pos = lo = hi = int(self.position[anchor])
+        out = []
+        while len(out) < n_cand:
+            # the closer side, or alternate sides if equally close
+            if lo == 0:
+                take_lo = False
+            elif hi + 1 == len(self.order):
+                take_lo = True
+            else:
+                dist_lo = target - self.scores[self.order[lo - 1]]
+                dist_hi = self.scores[self.order[hi + 1]] - target
+                take_lo = (dist_lo, pos - lo) <= (dist_hi, hi - pos)
+            if take_lo:
+                lo -= 1
+                out.append(int(self.order[lo]))
+            else:
+                hi += 1
+                out.append(int(self.order[hi]))
+        return out
+
+    def sample_indices(self) -> List[int]:
+        """The interned item IDs of the next BWS set"""
+        if len(self.vocab) < self.n_items:
+            raise Exception(
+                f"Less than n_items={self.n_items} items available.")
+        anchor = self._pop_anchor()
+        # prefer few comparisons, then close scores
+        candidates = self._neighbors(anchor)
+        chosen = sorted(
+            range(len(candidates)),
+            key=lambda k: (self.counts[candidates[k]], k)
+        )[:self.n_items - 1]
+        bwsset = [anchor] + [candidates[k] for k in chosen]
+        # count the sampled items as compared
+        for idx in bwsset:
+            self.counts[idx] += self.n_items - 1
+            self._push(idx)
+        return self.rng.permutation(bwsset).tolist()
+
+    def sample(self, n_sets: Optional[int] = 1) -> List[List[ItemID]]:
+        """Generate `n_sets` new BWS sets
+
+        Returns:
+        --------
+        samples: List[List[ItemID]]
+            A list of BWS sets. Each BWS set is a list of n_items item IDs.
+        """
+        return [self.vocab.decode(self.sample_indices())
+                for _ in range(n_sets)]
+
+
+class CoverageSampler(object):
+    """Compose new BWS sets from the least covered items without repeating
+        pairs of items
+
+    The number of appearances of each item is stored in a min-heap (with
+      lazy deletion), and the co-occurrences of item pairs in a hash map.
+      A new BWS set pops the least covered items from the heap, and skips
+      items that already co-occurred with a picked item. At most
+      `max_skip` items are skipped, i.e. a BWS set costs O(n_items log n).
+      The new BWS set is registered immediately, i.e. subsequent BWS sets
+      move on to other items.
+
+    Parameters:
+    -----------
+    ids : Iterable[ItemID]
+        The item IDs to sample from
+
+    n_items : int
+        Number items per BWS set
+
+    max_skip : Optional[int]
+        The maximum number of skipped items per BWS set
+          (Default: `4 * n_items`)
+
+    seed : Optional[int]
+        Seed to break ties between equally covered items, and to shuffle
+          the items of each BWS set
+
+    Example:
+    --------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+        sampler = bws.adaptive.CoverageSampler(examples, n_items=4)
+        samples = sampler.sample(n_sets=20)
+        # register BWS sets that were evaluated elsewhere
+        sampler.update(evaluations)
+    """
+    def __init__(self, ids: Iterable[ItemID], n_items: int,
+                 max_skip: Optional[int] = None,
+                 seed: Optional[int] = None):
+        self.n_items = n_items
+        self.max_skip = 4 * n_items if max_skip is None else max_skip
+        self.rng = np.random.default_rng(seed)
+        self.vocab = Vocabulary()
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.tiebreak = np.zeros(0, dtype=np.int64)
+        self.pairs = {}
+        self.heap = []
+        self._grow(list(ids))
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    def _grow(self, ids: Iterable[ItemID]) -> np.ndarray:
+        """Intern new item IDs, and return the indices of all `ids`"""
+        n = len(self.vocab)
+        idx = self.vocab.encode(ids)
+        n_new = len(self.vocab) - n
+        if n_new > 0:
+            self.counts = np.concatenate(
+                [self.counts, np.zeros(n_new, dtype=np.int64)])
+            self.tiebreak = np.concatenate(
+                [self.tiebreak, n + self.rng.permutation(n_new)])
+            for i in range(n, n + n_new):
+                self._push(i)
+        return idx
+
+    def _push(self, idx: int):
+        heapq.heappush(
+            self.heap, (int(self.counts[idx]), int(self.tiebreak[idx]), idx))
+
+    def _pop(self) -> Optional[int]:
+        """Remove the least covered item from the heap"""
+        while self.heap:
+            cnt, _, idx = heapq.heappop(self.heap)
+            if cnt == self.counts[idx]:
+                return idx
+        return None
+
+    @staticmethod
+    def _key(i: int, j: int) -> int:
+        return (i << 32) | j if i < j else (j << 32) | i
+
+    def n_cooccur(self, i: ItemID, j: ItemID) -> int:
+        """The number of BWS sets with both items"""
+        if i not in self.vocab or j not in self.vocab:
+            return 0
+        return self.pairs.get(
+            self._key(self.vocab.lookup[i], self.vocab.lookup[j]), 0)
+
+    def _register(self, bwsset: List[int]):
+        for a, i in enumerate(bwsset):
+            self.counts[i] += 1
+            for j in bwsset[a + 1:]:
+                key = self._key(i, j)
+                self.pairs[key] = self.pairs.get(key, 0) + 1
+        # drop stale heap entries
+        if len(self.heap) > 4 * len(self.counts) + 64:
+            self.heap = [(int(c), int(t), i) for i, (c, t) in enumerate(
+                zip(self.counts.tolist(), self.tiebreak.tolist()))]
+            heapq.heapify(self.heap)
+        else:
+            for i in bwsset:
+                self._push(i)
+
+    def update(self, evaluations: Iterable[tuple]) -> 'CoverageSampler':
+        """Register BWS sets, e.g. evaluations from another source
+
+        Parameters:
+        -----------
+        evaluations : Iterable[Tuple[List[ItemState], List[ItemID]]]
+            The BWS sets (see `bws.count`). Unknown item IDs are added.
+        """
+        for _, ids in evaluations:
+            self._register(self._grow(ids).tolist())
+        return self
+
+    def sample_indices(self) -> List[int]:
+        """The interned item IDs of the next BWS set"""
+        if len(self.vocab) < self.n_items:
+            raise Exception(
+                f"Less than n_items={self.n_items} items available.")
+        bwsset, skipped = [], []
+        while len(bwsset) < self.n_items:
+            idx = self._pop()
+            if idx is None:
+                break
+            if len(skipped) < self.max_skip and any(
+                    self._key(idx, j) in self.pairs for j in bwsset):
+                skipped.append(idx)
+            else:
+                bwsset.append(idx)
+        # fill up with skipped items, and put back the others
+        n_fill = self.n_items - len(bwsset)
+        bwsset.extend(skipped[:n_fill])
+        for idx in skipped[n_fill:]:
+            self._push(idx)
+        self._register(bwsset)
+        return self.rng.permutation(bwsset).tolist()
+
+    def sample(self, n_sets: Optional[int] = 1) -> List[List[ItemID]]:
+        """Generate `n_sets` new BWS sets
+
+        Returns:
+        --------
+        samples: List[List[ItemID]]
+            A list of BWS sets. Each BWS set is a list of n_items item IDs.
+        """
+        return [self.vocab.decode(self.sample_indices())
+                for _ in range(n_sets)]
+
+
+class UnionFind(object):
+    """Disjoint sets of interned item IDs (union by size, path halving)
+
+    Example:
+    --------
+        import bwsample as bws
+        uf = bws.adaptive.UnionFind(4)
+        uf.union(0, 1)
+        uf.find(1) == uf.find(0)  # True
+        uf.n_components  # 3
+    """
+    def __init__(self, n: Optional[int] = 0):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.n_components = n
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def grow(self, n: int):
+        """Add singletons until there are `n` elements"""
+        for i in range(len(self.parent), n):
+            self.parent.append(i)
+            self.size.append(1)
+            self.n_components += 1
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> int:
+        """Merge the sets of `i` and `j`, and return the new root"""
+        i, j = self.find(i), self.find(j)
+        if i == j:
+            return i
+        if self.size[i] < self.size[j]:
+            i, j = j, i
+        self.parent[j] = i
+        self.size[i] += self.size[j]
+        self.n_components -= 1
+        return i
+
+    def roots(self) -> List[int]:
+        """The root of each element"""
+        return [self.find(i) for i in range(len(self.parent))]
+
+
+class ConnectivitySampler(object):
+    """Compose the minimum number of BWS sets that connect all items
+
+    Ranking methods based on pairwise comparisons (e.g. 'btl', 'eigen',
+      'trans') require a connected comparison graph. The components of
+      the graph are tracked with a union-find data structure. A BWS set
+      with `n_items` items of different components merges these
+      components, i.e. `ceil((n_components - 1) / (n_items - 1))` BWS sets
+      connect all items.
+
+    Parameters:
+    -----------
+    ids : Iterable[ItemID]
+        The item IDs that must be connected
+
+    n_items : int
+        Number items per BWS set
+
+    seed : Optional[int]
+        Seed to shuffle the items of each BWS set
+
+    Example:
+    --------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+        sampler = bws.adaptive.ConnectivitySampler(examples, n_items=4)
+        sampler.update(evaluations)
+        bridges = sampler.bridge()  # sample these BWS sets first
+        sampler.n_components  # 1
+    """
+    def __init__(self, ids: Iterable[ItemID], n_items: int,
+                 seed: Optional[int] = None):
+        self.n_items = n_items
+        self.rng = np.random.default_rng(seed)
+        self.vocab = Vocabulary()
+        self.components = UnionFind()
+        self._grow(list(ids))
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    @property
+    def n_components(self) -> int:
+        return self.components.n_components
+
+    def _grow(self, ids: Iterable[ItemID]) -> np.ndarray:
+        idx = self.vocab.encode(ids)
+        self.components.grow(len(self.vocab))
+        return idx
+
+    def _register(self, bwsset: List[int]):
+        for j in bwsset[1:]:
+            self.components.union(bwsset[0], j)
+
+    def update(self, evaluations: Iterable[tuple]) -> 'ConnectivitySampler':
+        """Link the items of evaluated or sampled BWS sets
+
+        Parameters:
+        -----------
+        evaluations : Iterable[Tuple[List[ItemState], List[ItemID]]]
+            The BWS sets (see `bws.count`). Unknown item IDs are added.
+        """
+        for _, ids in evaluations:
+            self._register(self._grow(ids).tolist())
+        return self
+
+    def bridge_indices(self) -> List[List[int]]:
+        """The interned item IDs of the bridging BWS sets"""
+        n = len(self.vocab)
+        if self.n_components <= 1:
+            return []
+        if n < self.n_items:
+            raise Exception(
+                f"Less than n_items={self.n_items} items available.")
+        # one representative of each component
+        roots = self.components.roots()
+        first = {}
+        for i, r in enumerate(roots):
+            first.setdefault(r, i)
+        reps = list(first.values())
+        # chain the components: each BWS set contains one item of the
+        #   components that previous BWS sets have merged
+        bwssets = []
+        pos = 1
+        while pos < len(reps):
+            bwsset = [reps[0]] + reps[pos:pos + self.n_items - 1]
+            pos += self.n_items - 1
+            # fill up the last BWS set with other items
+            if len(bwsset) < self.n_items:
+                members = set(bwsset)
+                for i in range(n):
+                    if i not in members:
+                        bwsset.append(i)
+                        if len(bwsset) == self.n_items:
+                            break
+            self._register(bwsset)
+            bwssets.append(self.rng.permutation(bwsset).tolist())
+        return bwssets
+
+    def bridge(self) -> List[List[ItemID]]:
+        """Generate the minimum number of BWS sets to connect all items
+
+        The new BWS sets are registered immediately.
+
+        Returns:
+        --------
+        samples: List[List[ItemID]]
+            A list of BWS sets. Each BWS set is a list of n_items item IDs.
+              Empty if all items are connected.
+        """
+        return [self.vocab.decode(bwsset)
+                for bwsset in self.bridge_indices()]
@@ -1,5 +1,15 @@
-from .utils import add_dok
+from .utils import add_dok, add_dok_inplace
+from .vocab import Vocabulary, PairCounter, detail_to_pairs, pairs_to_detail
+from .retention import RetentionPolicy
+from .storage import read_evaluations, chunked
 from typing import List, Optional, Dict, Tuple
+import itertools
+import bisect
+import collections.abc
+import concurrent.futures
+import os
+import numpy as np
+import scipy.sparse
 ItemState = int
 ItemID = str
 
@@ -11,6 +21,7 @@ def count(evaluations: List[Tuple[List[ItemState], List[ItemID]]],
           logical_dok: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
           logical_detail: Optional[dict] = None,
           logical_database: List[Tuple[List[ItemState], List[ItemID]]] = None,
+          n_jobs: Optional[int] = None
           ) -> (
               Dict[Tuple[ItemID, ItemID], int],
               Dict[Tuple[ItemID, ItemID], int],
@@ -46,6 +57,10 @@ def count(evaluations: List[Tuple[List[ItemState], List[ItemID]]],
     logical_database : List[Tuple[List[ItemState], List[ItemID]]]
         A database of previously processed BWS sets
 
+    n_jobs : Optional[int]
+        (default: None) Number of worker processes for logical inference
+          (see `logical_infer_update`)
+
     Returns:
     --------
     logical_dok: Optional[Dict[Tuple[ItemID, ItemID], int]]
@@ -69,7 +84,7 @@ def count(evaluations: List[Tuple[List[ItemState], List[ItemID]]],
     if use_logical:
         logical_dok, logical_detail = logical_infer_update(
             evaluations, database=logical_database,
-            dok=logical_dok, detail=logical_detail)
+            dok=logical_dok, detail=logical_detail, n_jobs=n_jobs)
 
     # merge agg_dok=direct_dok+logical_dok
     if use_logical:
@@ -282,11 +297,232 @@ def direct_extract_batch(
     return dok, detail
 
 
+def to_state_matrix(
+        evaluations: List[Tuple[List[ItemState], List[ItemID]]],
+        vocab: Optional[Vocabulary] = None) -> (
+            np.ndarray, np.ndarray, Vocabulary):
+    """Convert fixed-size BWS sets into a state matrix and an ID matrix
+
+    Parameters:
+    -----------
+    evaluations : List[Tuple[List[ItemState], List[ItemID]]]
+        A list of BWS sets with the same number of items.
+
+    vocab : Optional[Vocabulary]
+        An existing vocabulary to intern the item IDs.
+
+    Returns:
+    --------
+    states : np.ndarray[int8] with the shape (n_sets, n_items)
+        The item states of each BWS set
+
+    ids : np.ndarray[int32] with the shape (n_sets, n_items)
+        The interned item IDs of each BWS set
+
+    vocab : Vocabulary
+        The vocabulary to decode the interned item IDs
+
+    Example:
+    --------
+        import bwsample as bws
+        evaluations = (
+            ([0, 0, 2, 1], ['id1', 'id2', 'id3', 'id4']),
+            ([0, 1, 0, 2], ['id4', 'id5', 'id6', 'id1']) )
+        states, ids, vocab = bws.counting.to_state_matrix(evaluations)
+    """
+    if vocab is None:
+        vocab = Vocabulary()
+    evaluations = list(evaluations)
+    n_items = len(evaluations[0][0]) if evaluations else 0
+    states = np.empty((len(evaluations), n_items), dtype=np.int8)
+    ids = np.empty((len(evaluations), n_items), dtype=np.int32)
+    for r, (combostates, stateids) in enumerate(evaluations):
+        if len(combostates) != n_items or len(stateids) != n_items:
+            raise Exception("All BWS sets must have the same number of items")
+        states[r] = combostates
+        ids[r] = vocab.encode(stateids)
+    return states, ids, vocab
+
+
+def direct_extract_matrix(
+        states: np.ndarray,
+        ids: np.ndarray,
+        n_dim: Optional[int] = None,
+        cnt: Optional[scipy.sparse.csr_matrix] = None,
+        detail: Optional[dict] = None) -> (scipy.sparse.csr_matrix, dict):
+    """Extract ">" pairs from a batch of fixed-size BWS sets at once
+
+    Parameters:
+    -----------
+    states : np.ndarray[int8] with the shape (n_sets, n_items)
+        The item states of each BWS set (0: NOT, 1: BEST, 2: WORST)
+
+    ids : np.ndarray[int32] with the shape (n_sets, n_items)
+        The interned item IDs of each BWS set (see `to_state_matrix`)
+
+    n_dim : Optional[int]
+        The number of rows/columns of the sparse matrices, e.g.
+          `len(vocab)`. (Default: `ids.max() + 1`)
+
+    cnt : Optional[scipy.sparse.csr_matrix]
+        Previously recorded frequencies for all directly extracted pairs.
+
+    detail : Optional[dict]
+        Previously recorded frequencies for each type of pair:
+          "BEST>WORST" (bw), "BEST>NOT" (bn), "NOT>WORST" (nw)
+
+    Returns:
+    --------
+    cnt : scipy.sparse.csr_matrix
+        The new/updated frequencies for directly extracted pairs, i.e.
+          `cnt[i, j]` is the number of `i>j` pairs.
+
+    detail : dict
+        The new/updated frequencies for the types of directly extracted
+          pairs: "BEST>WORST" (bw), "BEST>NOT" (bn), "NOT>WORST" (nw)
+
+    Example:
+    --------
+        import bwsample as bws
+        evaluations = (
+            ([0, 0, 2, 1], ['id1', 'id2', 'id3', 'id4']),
+            ([0, 1, 0, 2], ['id4', 'id5', 'id6', 'id1']) )
+        states, ids, vocab = bws.counting.to_state_matrix(evaluations)
+        cnt, detail = bws.counting.direct_extract_matrix(
+            states, ids, n_dim=len(vocab))
+
+    Notes:
+    ------
+    Same results as `direct_extract_batch`, i.e. BWS sets without BEST or
+      WORST item are skipped, and only the first BEST and WORST item of a
+      BWS set are used.
+    """
+    states = np.asarray(states, dtype=np.int8)
+    ids = np.asarray(ids, dtype=np.int32)
+    if states.shape != ids.shape:
+        raise Exception("IDs and states matrices must have the same shape")
+    if n_dim is None:
+        n_dim = int(ids.max(initial=-1)) + 1
+
+    # find the first BEST and WORST position of each BWS set
+    isbest, isworst = states == 1, states == 2
+    valid = isbest.any(axis=1) & isworst.any(axis=1)
+    ids = ids[valid]
+    best_pos = isbest[valid].argmax(axis=1)
+    worst_pos = isworst[valid].argmax(axis=1)
+    rng = np.arange(len(ids))
+    best_id, worst_id = ids[rng, best_pos], ids[rng, worst_pos]
+
+    # all other items are NOT
+    middle = np.ones(ids.shape, dtype=bool)
+    middle[rng, best_pos] = False
+    middle[rng, worst_pos] = False
+    middle_id = ids[middle]
+    n_middle = middle.sum(axis=1)
+
+    # "BEST > WORST", "BEST > NOT", "NOT > WORST"
+    pairs = {
+        "bw": (best_id, worst_id),
+        "bn": (np.repeat(best_id, n_middle), middle_id),
+        "nw": (middle_id, np.repeat(worst_id, n_middle))
+    }
+
+    # grow to the size of previous counts
+    if detail is None:
+        detail = {}
+    for mat in [cnt] + list(detail.values()):
+        if mat is not None:
+            n_dim = max(n_dim, mat.shape[0])
+
+    # accumulate duplicate pairs in sparse matrices
+    newcnt = scipy.sparse.csr_matrix((n_dim, n_dim), dtype=np.int64)
+    for key, (rows, cols) in pairs.items():
+        mat = scipy.sparse.coo_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+            shape=(n_dim, n_dim)).tocsr()
+        newcnt = newcnt + mat
+        if key in detail:
+            mat = _resize_sparse(detail[key], n_dim) + mat
+        detail[key] = mat
+    if cnt is not None:
+        newcnt = _resize_sparse(cnt, n_dim) + newcnt
+    return newcnt, detail
+
+
+def _resize_sparse(mat: scipy.sparse.spmatrix,
+                   n_dim: int) -> scipy.sparse.csr_matrix:
+    """Enlarge a quadratic sparse matrix with zeros"""
+    mat = mat.tocsr(copy=True)
+    if mat.shape != (n_dim, n_dim):
+        mat.resize((n_dim, n_dim))
+    return mat
+
+
 def find_by_state(ids, states, s_):
     """Find indices of a certain state"""
     return [i for i, s in zip(*(ids, states)) if s in s_]
 
 
+class ParsedEvaluation(object):
+    """An evaluated BWS set that is partitioned by item states once
+
+    Parameters:
+    -----------
+    states : List[ItemState]
+        The item states (0: NOT, 1: BEST, 2: WORST)
+
+    ids : List[ItemID]
+        The item IDs
+
+    Attributes:
+    -----------
+    best, worst : List[ItemID]
+        The IDs with the state BEST (1) or WORST (2)
+
+    notbest, notworst : List[ItemID]
+        The IDs with the states NOT/WORST (0, 2) or NOT/BEST (0, 1)
+
+    pos : Dict[ItemID, int]
+        The (first) position of each ID
+
+    Example:
+    --------
+        import bwsample as bws
+        parsed = bws.counting.ParsedEvaluation([1, 0, 2], ['D', 'E', 'F'])
+        states, ids = parsed  # unpacks like an evaluation tuple
+    """
+    __slots__ = ("states", "ids", "best", "worst", "notbest", "notworst",
+                 "pos")
+
+    def __init__(self, states: List[ItemState], ids: List[ItemID]):
+        self.states = states
+        self.ids = ids
+        self.best = find_by_state(ids, states, [1])
+        self.worst = find_by_state(ids, states, [2])
+        self.notbest = find_by_state(ids, states, [0, 2])
+        self.notworst = find_by_state(ids, states, [0, 1])
+        self.pos = {}
+        for p, uid in enumerate(ids):
+            self.pos.setdefault(uid, p)
+
+    def __iter__(self):
+        return iter((self.states, self.ids))
+
+    def __getstate__(self):
+        return (self.states, self.ids)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+
+def parse_evaluation(evaluation: Tuple[List[ItemState], List[ItemID]]
+                     ) -> ParsedEvaluation:
+    """Convert an evaluated BWS set into a `ParsedEvaluation` (if required)"""
+    if isinstance(evaluation, ParsedEvaluation):
+        return evaluation
+    return ParsedEvaluation(*evaluation)
+
+
 def logical_rules(
         ids1: List[ItemID],
         ids2: List[ItemID],
@@ -353,6 +589,38 @@ def logical_rules(
       from Best-Worst Scaling Surveys by Logical Inference.
       https://doi.org/10.31219/osf.io/qkxej
     """
+    return logical_rules_parsed(
+        ParsedEvaluation(states1, ids1), ParsedEvaluation(states2, ids2),
+        s1, s2, dok=dok, dok_nn=dok_nn, dok_nb=dok_nb, dok_nw=dok_nw,
+        dok_bn=dok_bn, dok_bw=dok_bw, dok_wn=dok_wn, dok_wb=dok_wb)
+
+
+def logical_rules_parsed(
+        e1: ParsedEvaluation,
+        e2: ParsedEvaluation,
+        s1: ItemState,
+        s2: ItemState,
+        dok: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nb: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nw: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_bn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_bw: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_wn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_wb: Optional[Dict[Tuple[ItemID, ItemID], int]] = None):
+    """Logical Inference rules for two parsed BWS sets (see `logical_rules`)
+
+    Parameters:
+    -----------
+    e1, e2 : ParsedEvaluation
+        Two BWS sets partitioned by item states
+
+    s1, s2 : ItemState or int
+        The item state of the overlapping item
+
+    dok, dok_nn, dok_nb, dok_nw, dok_bn, dok_bw, dok_wn, dok_wb
+        see `logical_rules`
+    """
     if dok is None:
         dok = {}
     if dok_nn is None:
@@ -373,57 +641,57 @@ def logical_rules(
     if s1 == 0:  # 0:NOT
         if s2 == 0:  # 0:NOT
             # nn: D>Z
-            for i in find_by_state(ids1, states1, [1]):
-                for j in find_by_state(ids2, states2, [2]):
+            for i in e1.best:
+                for j in e2.worst:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_nn[(i, j)] = 1 + dok_nn.get((i, j), 0)
             # nn: X>F
-            for i in find_by_state(ids2, states2, [1]):
-                for j in find_by_state(ids1, states1, [2]):
+            for i in e2.best:
+                for j in e1.worst:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_nn[(i, j)] = 1 + dok_nn.get((i, j), 0)
 
         elif s2 == 1:  # 1:BEST
             # nb: D>Y, D>Z
-            for i in find_by_state(ids1, states1, [1]):
-                for j in find_by_state(ids2, states2, [0, 2]):
+            for i in e1.best:
+                for j in e2.notbest:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_nb[(i, j)] = 1 + dok_nb.get((i, j), 0)
 
         elif s2 == 2:  # 2:WORST
             # nw: X>F, Y>F
-            for j in find_by_state(ids1, states1, [2]):
-                for i in find_by_state(ids2, states2, [0, 1]):
+            for j in e1.worst:
+                for i in e2.notworst:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_nw[(i, j)] = 1 + dok_nw.get((i, j), 0)
 
     elif s1 == 1:  # 1:BEST
         if s2 == 0:
             # bn: X>E, X>F
-            for i in find_by_state(ids2, states2, [1]):
-                for j in find_by_state(ids1, states1, [0, 2]):
+            for i in e2.best:
+                for j in e1.notbest:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_bn[(i, j)] = 1 + dok_bn.get((i, j), 0)
 
         elif s2 == 2:
             # bw: X>E, X>F, Y>E, Y>F
-            for j in find_by_state(ids1, states1, [0, 2]):
-                for i in find_by_state(ids2, states2, [0, 1]):
+            for j in e1.notbest:
+                for i in e2.notworst:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_bw[(i, j)] = 1 + dok_bw.get((i, j), 0)
 
     elif s1 == 2:  # 2:WORST
         if s2 == 0:
             # wn: D>Z, E>Z
-            for i in find_by_state(ids1, states1, [0, 1]):
-                for j in find_by_state(ids2, states2, [2]):
+            for i in e1.notworst:
+                for j in e2.worst:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_wn[(i, j)] = 1 + dok_wn.get((i, j), 0)
 
         elif s2 == 1:
             # wb: D>Y, D>Z, E>Y, E>Z
-            for i in find_by_state(ids1, states1, [0, 1]):
-                for j in find_by_state(ids2, states2, [0, 2]):
+            for i in e1.notworst:
+                for j in e2.notbest:
                     dok[(i, j)] = 1 + dok.get((i, j), 0)
                     dok_wb[(i, j)] = 1 + dok_wb.get((i, j), 0)
     # done
@@ -483,6 +751,33 @@ def logical_infer(
         dok, nn, nb, nw, bn, bw, wn, wb = bws.counting.logical_infer(
             ids1, ids2, states1, states2)
     """
+    return logical_infer_parsed(
+        ParsedEvaluation(states1, ids1), ParsedEvaluation(states2, ids2),
+        dok=dok, dok_nn=dok_nn, dok_nb=dok_nb, dok_nw=dok_nw,
+        dok_bn=dok_bn, dok_bw=dok_bw, dok_wn=dok_wn, dok_wb=dok_wb)
+
+
+def logical_infer_parsed(
+        e1: ParsedEvaluation,
+        e2: ParsedEvaluation,
+        dok: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nb: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_nw: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_bn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_bw: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_wn: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
+        dok_wb: Optional[Dict[Tuple[ItemID, ItemID], int]] = None):
+    """Logical Inference between 2 parsed BWS sets (See `logical_infer`)
+
+    Parameters:
+    -----------
+    e1, e2 : ParsedEvaluation
+        Two BWS sets partitioned by item states
+
+    dok, dok_nn, dok_nb, dok_nw, dok_bn, dok_bw, dok_wn, dok_wb
+        see `logical_infer`
+    """
     if dok is None:
         dok = {}
     if dok_nn is None:
@@ -501,33 +796,78 @@ def logical_infer(
         dok_wb = {}
 
     # find common IDs, and loop over them
-    for uid in set(ids1).intersection(ids2):
-        try:
-            # find positions of the ID
-            p1, p2 = ids1.index(uid), ids2.index(uid)
-            # lookup states of the ID
-            s1, s2 = states1[p1], states2[p2]
-            # apply rules
-            (
-                dok, dok_nn, dok_nb, dok_nw,
-                dok_bn, dok_bw, dok_wn, dok_wb
-            ) = logical_rules(
-                ids1, ids2, states1, states2, s1, s2,
-                dok=dok, dok_nn=dok_nn, dok_nb=dok_nb, dok_nw=dok_nw,
-                dok_bn=dok_bn, dok_bw=dok_bw, dok_wn=dok_wn, dok_wb=dok_wb)
-        except ValueError as err:
-            print(err)
+    for uid, p1 in e1.pos.items():
+        p2 = e2.pos.get(uid)
+        if p2 is None:
             continue
+        # lookup states of the ID, and apply rules
+        (
+            dok, dok_nn, dok_nb, dok_nw,
+            dok_bn, dok_bw, dok_wn, dok_wb
+        ) = logical_rules_parsed(
+            e1, e2, e1.states[p1], e2.states[p2],
+            dok=dok, dok_nn=dok_nn, dok_nb=dok_nb, dok_nw=dok_nw,
+            dok_bn=dok_bn, dok_bw=dok_bw, dok_wn=dok_wn, dok_wb=dok_wb)
 
     # done
     return dok, dok_nn, dok_nb, dok_nw, dok_bn, dok_bw, dok_wn, dok_wb
 
 
+def index_database(
+        database: List[Tuple[List[ItemState], List[ItemID]]],
+        index: Optional[Dict[ItemID, List[int]]] = None,
+        offset: Optional[int] = 0) -> Dict[ItemID, List[int]]:
+    """Build an inverted index that maps each item ID to the positions of
+        the BWS sets in the database that contain the item
+
+    Parameters:
+    -----------
+    database: List[Tuple[List[ItemState], List[ItemID]]]
+        A database of previously processed BWS sets. If `database` is a
+          dict, then its keys are indexed instead of the positions.
+
+    index: Optional[Dict[ItemID, List[int]]]
+        An existing inverted index that is updated here.
+
+    offset: Optional[int] = 0
+        The position of the first BWS set of `database`, e.g. if new BWS
+          sets are appended to an already indexed database, then
+          `offset=len(old_database)`. Not used if `database` is a dict.
+
+    Returns:
+    --------
+    index: Dict[ItemID, List[int]]
+        The item ID to database positions mapping. The positions of
+          each item are in ascending order.
+
+    Example:
+    --------
+        import bwsample as bws
+        database = (
+            ([0, 0, 2, 1], ['A', 'B', 'C', 'D']),
+            ([0, 1, 0, 2], ['D', 'E', 'F', 'A']) )
+        index = bws.counting.index_database(database)
+        # {'A': [0, 1], 'B': [0], 'C': [0], 'D': [0, 1], ...}
+    """
+    if index is None:
+        index = {}
+    if isinstance(database, collections.abc.Mapping):
+        entries = database.items()
+    else:
+        entries = enumerate(database, start=offset)
+    for pos, (_, ids) in entries:
+        for uid in set(ids):
+            index.setdefault(uid, []).append(pos)
+    return index
+
+
 def logical_infer_update(
         evaluations: List[Tuple[List[ItemState], List[ItemID]]],
         database: List[Tuple[List[ItemState], List[ItemID]]] = None,
         dok: Optional[Dict[Tuple[ItemID, ItemID], int]] = None,
-        detail: Optional[dict] = None) -> (
+        detail: Optional[dict] = None,
+        index: Optional[Dict[ItemID, List[int]]] = None,
+        n_jobs: Optional[int] = None) -> (
             Dict[Tuple[ItemID, ItemID], int], dict):
     """Run logical inference from a batch/list of BWS sets against ad database
 
@@ -537,7 +877,11 @@ def logical_infer_update(
         A list of new BWS sets to be evaluated.
 
     database: List[Tuple[List[ItemState], List[ItemID]]]
-        A database of previously processed BWS sets
+        A database of previously processed BWS sets, or a dictionary of
+          BWS sets with integer keys. If None, then the new
+          BWS sets are joined with each other, i.e. each pair of BWS sets
+          is visited once and the pairs of both directions are counted,
+          but no BWS set is joined with itself.
 
     dok: Optional[Dict[Tuple[ItemID, ItemID], int]]
         The previous counts/frequencies of logical inferred pairs
@@ -547,6 +891,20 @@ def logical_infer_update(
         A dictionary of previously stored DOKs for each variant of
           logically inferred pairs.
 
+    index: Optional[Dict[ItemID, List[int]]]
+        An inverted index of `database` (see `index_database`), i.e. the
+          positions or keys of the BWS sets of each item. Each new
+          BWS set is only joined with database entries that share at
+          least one item. The index is built if not provided.
+
+    n_jobs: Optional[int]
+        (default: None) Number of worker processes. The database and its
+          index are sent once to each worker process. The new BWS sets are
+          split into `n_jobs` consecutive shards with similar numbers of
+          joins (see `_shard_bounds`), and the counts of each shard are
+          merged in order, i.e. the results are identical to the serial
+          run. Use `n_jobs=-1` for all CPUs.
+
     Returns:
     --------
     dok: Optional[Dict[Tuple[ItemID, ItemID], int]]
@@ -561,6 +919,130 @@ def logical_infer_update(
         dok = {}
     if detail is None:
         detail = {}
+    for key in ("nn", "nb", "nw", "bn", "bw", "wn", "wb"):
+        detail.setdefault(key, {})
+
+    # Create new database, i.e. join the new BWS sets with each other
+    evaluations = list(evaluations)
+    halfjoin = database is None
+    if database is None:
+        database = evaluations
+    elif not isinstance(database, (collections.abc.Sequence, dict)):
+        database = list(database)
+    if index is None:
+        index = index_database(database)
+
+    # Visit each pair of new BWS sets only once, and count the pairs
+    #   of both directions at the end
+    if halfjoin:
+        outdok, outdetail = {}, {}
+    else:
+        outdok, outdetail = dok, detail
+
+    # split the new BWS sets into shards for each worker process
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs is not None and n_jobs > 1 and len(evaluations) > 1:
+        n_jobs = min(n_jobs, len(evaluations))
+        bounds = _shard_bounds(evaluations, index, n_jobs, halfjoin)
+        shards = [range(a, b) for a, b in zip(bounds[:-1], bounds[1:])]
+        # the half-join's BWS sets are already in the workers' database
+        if halfjoin:
+            parts = itertools.repeat(None)
+        else:
+            parts = ([evaluations[k] for k in keys] for keys in shards)
+        with concurrent.futures.ProcessPoolExecutor(
+                n_jobs, initializer=_init_join_worker,
+                initargs=(database, index)) as executor:
+            for shard_dok, shard_detail in executor.map(
+                    _logical_join_worker, shards, parts,
+                    itertools.repeat(halfjoin)):
+                add_dok_inplace(outdok, shard_dok)
+                for key, val in shard_detail.items():
+                    add_dok_inplace(outdetail.setdefault(key, {}), val)
+    else:
+        outdok, outdetail = _logical_join(
+            evaluations, database, index, halfjoin=halfjoin,
+            dok=outdok, detail=outdetail)
+
+    # count the pairs of both directions
+    if halfjoin:
+        _add_both_directions(dok, detail, outdok, outdetail)
+
+    # done
+    return dok, detail
+
+
+def _add_both_directions(dok, detail, joindok, joindetail):
+    """Add the counts of joins `(ids1, ids2)` and of the reversed joins
+
+    The reversed join `(ids2, ids1)` infers the same pairs as
+      `(ids1, ids2)` but swaps the variants, e.g. "nb" and "bn"
+    """
+    for _ in range(2):
+        add_dok_inplace(dok, joindok)
+        add_dok_inplace(detail["nn"], joindetail.get("nn", {}))
+    for key1, key2 in (("nb", "bn"), ("nw", "wn"), ("bw", "wb")):
+        for key in (key1, key2):
+            add_dok_inplace(detail[key], joindetail.get(key1, {}))
+            add_dok_inplace(detail[key], joindetail.get(key2, {}))
+
+
+def _shard_bounds(evaluations, index, n_jobs, halfjoin):
+    """Split the new BWS sets into `n_jobs` consecutive shards with similar
+        numbers of joins, i.e. database entries with overlapping items.
+
+    The half-join only visits the subsequent database entries, i.e. the
+      first BWS sets need more joins than the last ones.
+    """
+    n_joins = np.empty(len(evaluations), dtype=np.float64)
+    for k, (_, ids) in enumerate(evaluations):
+        positions = [index.get(uid, []) for uid in set(ids)]
+        if halfjoin:
+            n_joins[k] = sum(
+                len(pos) - bisect.bisect_right(pos, k) for pos in positions)
+        else:
+            n_joins[k] = sum(len(pos) for pos in positions)
+    cumsum = np.cumsum(n_joins + 1.0)
+    cuts = np.searchsorted(
+        cumsum, cumsum[-1] * np.arange(1, n_jobs) / n_jobs, side='right')
+    return [0] + cuts.tolist() + [len(evaluations)]
+
+
+# the database and index of a worker process (see `_init_join_worker`)
+_worker_data = {}
+
+
+def _init_join_worker(database, index):
+    """Store the database and its index once per worker process"""
+    _worker_data["database"] = database
+    _worker_data["index"] = index
+
+
+def _logical_join_worker(keys, evaluations, halfjoin):
+    """Run `_logical_join` with the worker's database and index"""
+    database = _worker_data["database"]
+    if evaluations is None:
+        evaluations = [database[k] for k in keys]
+    return _logical_join(evaluations, database, _worker_data["index"],
+                         keys=keys, halfjoin=halfjoin)
+
+
+def _logical_join(evaluations, database, index, keys=None, halfjoin=False,
+                  dok=None, detail=None):
+    """Join each BWS set of `evaluations` with the overlapping BWS sets in
+        `database` (see `logical_infer_update`)
+
+    If `halfjoin=True`, then `evaluations[i]` is the `keys[i]`-th entry of
+      `database` (Default: `keys=range(len(evaluations))`), and only
+      joined with the subsequent database entries.
+    """
+    if dok is None:
+        dok = {}
+    if detail is None:
+        detail = {}
+    if keys is None:
+        keys = range(len(evaluations))
 
     # query `detail` object
     dok_nn = detail.get("nn", {})
@@ -571,18 +1053,28 @@ def logical_infer_update(
     dok_wn = detail.get("wn", {})
     dok_wb = detail.get("wb", {})
 
-    # Create new database
-    if database is None:
-        database = list(evaluations)
+    # parse each visited database entry only once
+    parsed = {}
 
     # start searching for logical inferences
-    for states1, ids1 in evaluations:
-        for states2, ids2 in database:
+    for k, evaluation in zip(keys, evaluations):
+        e1 = parse_evaluation(evaluation)
+        if halfjoin:
+            parsed[k] = e1
+        # only database entries with overlapping items
+        positions = sorted(set(itertools.chain(
+            *[index.get(uid, []) for uid in e1.pos])))
+        if halfjoin:
+            positions = [pos for pos in positions if pos > k]
+        for pos in positions:
+            e2 = parsed.get(pos)
+            if e2 is None:
+                e2 = parsed[pos] = parse_evaluation(database[pos])
             (
                 dok, dok_nn, dok_nb, dok_nw,
                 dok_bn, dok_bw, dok_wn, dok_wb
-            ) = logical_infer(
-                ids1, ids2, states1, states2,
+            ) = logical_infer_parsed(
+                e1, e2,
                 dok=dok, dok_nn=dok_nn, dok_nb=dok_nb, dok_nw=dok_nw,
                 dok_bn=dok_bn, dok_bw=dok_bw, dok_wn=dok_wn, dok_wb=dok_wb)
 
@@ -597,3 +1089,278 @@ def logical_infer_update(
 
     # done
     return dok, detail
+
+
+class CountingState(object):
+    """Incremental counting that keeps the database of processed BWS sets,
+        its inverted item index and all counts in memory
+
+    Parameters:
+    -----------
+    use_logical : Optional[bool] = True
+        flag to deactivate logical inference
+
+    direct_dok, direct_detail, logical_dok, logical_detail,
+    logical_database
+        (default: None) Previously recorded counts and BWS sets
+          (see `count`), e.g. to continue from a stateless `count` call.
+
+    retention : Optional[RetentionPolicy]
+        (default: None) A policy to bound the size of the database, e.g.
+          `bws.retention.WindowRetention(10000)` (see `bwsample.retention`).
+          All BWS sets are kept if None.
+
+    symmetric : Optional[bool] = True
+        Count the logically inferred pairs of a join between a new and a
+          retained BWS set in both directions, i.e. the counts are
+          identical to `bws.count(all_evaluations)`. If False, each join
+          is counted once like
+          `bws.count(new_evaluations, logical_database=retained)`, i.e.
+          the logical counts are halved.
+
+    backend : Optional[str] = 'dok'
+        The data structure of the stored counts
+        - 'dok': Dictionary of Keys (DOK) with item ID pairs as keys
+        - 'pairs': `bws.vocab.PairCounter` arrays of interned item IDs
+            (see `vocab`) that need less memory. The counts are
+            converted to DOKs by `counts()`.
+
+    Attributes:
+    -----------
+    agg_dok : Dict[Tuple[ItemID, ItemID], int]
+        The aggregated counts `direct_dok + logical_dok`
+
+    direct_dok, direct_detail, logical_dok, logical_detail
+        The counts (see `count`). If `backend='pairs'`, then each DOK is
+          stored as `PairCounter`.
+
+    vocab : Vocabulary
+        The interned item IDs of the `PairCounter` objects (only if
+          `backend='pairs'`)
+
+    database : Dict[int, ParsedEvaluation]
+        The retained BWS sets (see `ParsedEvaluation`) with increasing
+          integer keys (slots)
+
+    index : Dict[ItemID, Dict[int, None]]
+        The inverted index of `database`, i.e. the slots of each item
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.CountingState()
+        state.update([([0, 0, 2, 1], ['A', 'B', 'C', 'D'])])
+        state.update([([0, 1, 0, 2], ['D', 'E', 'F', 'A'])])
+        positions, sortedids, metrics, scores, info = bws.rank(
+            state.agg_dok, method='ratio')
+
+        # array-backed counts
+        state = bws.CountingState(backend='pairs')
+        state.update([([0, 0, 2, 1], ['A', 'B', 'C', 'D'])])
+        cnt = state.agg_dok.to_scipy(len(state.vocab))
+        agg_dok, _, _, _, _ = state.counts()
+
+    Notes:
+    ------
+    Each new BWS set is joined once with every retained BWS set (incl. the
+      preceding sets of the same batch), i.e. the counts do not depend on
+      how the BWS sets are split into `update` calls. Without retention
+      policy and `symmetric=True`, the counts are the same as of the
+      stateless `bws.count` for all BWS sets. The costs
+      of each `update` call scale with the number of new pairs and not
+      with the total number of pairs.
+    """
+    def __init__(self,
+                 use_logical: Optional[bool] = True,
+                 direct_dok: Optional[dict] = None,
+                 direct_detail: Optional[dict] = None,
+                 logical_dok: Optional[dict] = None,
+                 logical_detail: Optional[dict] = None,
+                 logical_database: List[
+                     Tuple[List[ItemState], List[ItemID]]] = None,
+                 retention: Optional[RetentionPolicy] = None,
+                 symmetric: Optional[bool] = True,
+                 backend: Optional[str] = 'dok'):
+        if backend not in ('dok', 'pairs'):
+            raise Exception(f"backend='{backend}' not available.")
+        self.use_logical = use_logical
+        self.symmetric = symmetric
+        self.backend = backend
+        self.direct_dok = {} if direct_dok is None else direct_dok
+        self.direct_detail = {} if direct_detail is None else direct_detail
+        self.logical_dok = {} if logical_dok is None else logical_dok
+        self.logical_detail = {} if logical_detail is None else logical_detail
+        for key in ("bw", "bn", "nw"):
+            self.direct_detail.setdefault(key, {})
+        for key in ("nn", "nb", "nw", "bn", "bw", "wn", "wb"):
+            self.logical_detail.setdefault(key, {})
+        self.agg_dok = add_dok(self.logical_dok, self.direct_dok)
+        if backend == 'pairs':
+            self.vocab = Vocabulary()
+            self.agg_dok = PairCounter.from_dok(self.agg_dok, self.vocab)
+            self.direct_dok = PairCounter.from_dok(
+                self.direct_dok, self.vocab)
+            self.direct_detail = detail_to_pairs(
+                self.direct_detail, self.vocab)
+            self.logical_dok = PairCounter.from_dok(
+                self.logical_dok, self.vocab)
+            self.logical_detail = detail_to_pairs(
+                self.logical_detail, self.vocab)
+        self.retention = retention
+        self.database = {}
+        self.index = {}
+        self._next_slot = 0
+        if logical_database is not None:
+            for evaluation in logical_database:
+                self._insert(parse_evaluation(evaluation))
+
+    def _insert(self, evaluation: ParsedEvaluation):
+        """Add a BWS set to the database, and apply the retention policy"""
+        slot = self._next_slot
+        self._next_slot += 1
+        self.database[slot] = evaluation
+        for uid in evaluation.pos:
+            self.index.setdefault(uid, {})[slot] = None
+        if self.retention is not None:
+            for evicted in self.retention.insert(slot, evaluation):
+                self._remove(evicted)
+
+    def _remove(self, slot: int):
+        """Delete a BWS set from the database and the index"""
+        evaluation = self.database.pop(slot)
+        for uid in evaluation.pos:
+            slots = self.index[uid]
+            del slots[slot]
+            if not slots:
+                del self.index[uid]
+
+    def update(self, evaluations: List[Tuple[List[ItemState], List[ItemID]]]
+               ) -> 'CountingState':
+        """Count the pairs of new BWS sets, and add them to the database
+
+        Parameters:
+        -----------
+        evaluations : List[Tuple[List[ItemState], List[ItemID]]]
+            A list of new BWS sets to be evaluated.
+
+        Returns:
+        --------
+        self : CountingState
+        """
+        evaluations = list(evaluations)
+
+        # extract from each BWS set
+        new_dok, new_detail = direct_extract_batch(evaluations)
+        self._add_counts(self.direct_dok, self.direct_detail,
+                         new_dok, new_detail)
+
+        # join each new BWS set with the previous ones
+        if self.use_logical:
+            new_dok, new_detail = {}, {}
+            for evaluation in evaluations:
+                evaluation = parse_evaluation(evaluation)
+                new_dok, new_detail = logical_infer_update(
+                    [evaluation], database=self.database,
+                    dok=new_dok, detail=new_detail, index=self.index)
+                if self.retention is not None and self.retention.track_usage:
+                    used = set(itertools.chain(
+                        *[self.index.get(uid, {}) for uid in evaluation.pos]))
+                    for slot in used:
+                        self.retention.touch(slot)
+                self._insert(evaluation)
+            if self.symmetric:
+                joindok, joindetail = new_dok, new_detail
+                new_dok = {}
+                new_detail = {key: {} for key in self.logical_detail}
+                _add_both_directions(new_dok, new_detail, joindok, joindetail)
+            self._add_counts(self.logical_dok, self.logical_detail,
+                             new_dok, new_detail)
+
+        # done
+        return self
+
+    def _add_counts(self, dok, detail, new_dok, new_detail):
+        """Add the counts of new pairs to the stored counts and `agg_dok`"""
+        if self.backend == 'pairs':
+            new_pairs = PairCounter.from_dok(new_dok, self.vocab)
+            dok.update(new_pairs)
+            self.agg_dok.update(new_pairs)
+            for key, val in new_detail.items():
+                detail[key].update(PairCounter.from_dok(val, self.vocab))
+        else:
+            add_dok_inplace(dok, new_dok)
+            add_dok_inplace(self.agg_dok, new_dok)
+            for key, val in new_detail.items():
+                add_dok_inplace(detail[key], val)
+
+    def counts(self) -> (
+            Dict[Tuple[ItemID, ItemID], int],
+            Dict[Tuple[ItemID, ItemID], int],
+            dict,
+            Dict[Tuple[ItemID, ItemID], int],
+            dict):
+        """Return the counts in the same order as `count`"""
+        if self.backend == 'pairs':
+            return (self.agg_dok.to_dok(self.vocab),
+                    self.direct_dok.to_dok(self.vocab),
+                    pairs_to_detail(self.direct_detail, self.vocab),
+                    self.logical_dok.to_dok(self.vocab),
+                    pairs_to_detail(self.logical_detail, self.vocab))
+        return (self.agg_dok, self.direct_dok, self.direct_detail,
+                self.logical_dok, self.logical_detail)
+
+
+def count_stream(source,
+                 chunk_size: Optional[int] = 10000,
+                 state: Optional[CountingState] = None,
+                 fmt: Optional[str] = None,
+                 **kwargs) -> CountingState:
+    """Count pairs of BWS sets from a file or an iterable chunk by chunk
+
+    Parameters:
+    -----------
+    source : str or Iterable[Tuple[List[ItemState], List[ItemID]]]
+        A JSONL/JSON/CSV file path (see `bwsample.storage.read_evaluations`),
+          or an iterable (e.g. generator) of BWS sets.
+
+    chunk_size : Optional[int] = 10000
+        The number of BWS sets that are read and counted at once.
+
+    state : Optional[CountingState]
+        An existing counting state that is updated.
+
+    fmt : Optional[str]
+        The file format 'jsonl', 'json' or 'csv' (Default: the file
+          extension)
+
+    **kwargs
+        Arguments to create a new `CountingState`, e.g. `use_logical`
+          or `retention`
+
+    Returns:
+    --------
+    state : CountingState
+        The updated counting state
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.count_stream(
+            "evaluations.jsonl", chunk_size=10000,
+            retention=bws.retention.ItemCapRetention(max_sets=5))
+        agg_dok, direct_dok, direct_detail, logical_dok, logical_detail = \
+            state.counts()
+
+    Notes:
+    ------
+    Only one chunk of BWS sets is in memory at a time. However, logical
+      inference stores all BWS sets in the database of `state` unless a
+      retention policy bounds the database, or `use_logical=False`.
+    """
+    if state is None:
+        state = CountingState(**kwargs)
+    if isinstance(source, str):
+        source = read_evaluations(source, fmt=fmt)
+    for chunk in chunked(source, chunk_size):
+        state.update(chunk)
+    return state
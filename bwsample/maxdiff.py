@@ -1,4 +1,5 @@
 import numpy as np
+from .storage import ColumnarEvaluations
 from typing import List, Tuple
 ItemState = int
 ItemID = str
@@ -37,6 +38,10 @@ def scoring_orme(evaluations: List[Tuple[List[ItemState], List[ItemID]]]):
     Orme, B., 2009. MaxDiff Analysis: Simple Counting, Individual-Level
       Logit, and HB. https://api.semanticscholar.org/CorpusID:202605777
     """
+    # vectorized scoring of memory-mapped BWS sets
+    if isinstance(evaluations, ColumnarEvaluations):
+        return _scoring_orme_columnar(evaluations)
+
     # count only the best (+1) and worst (-1)
     scorecnt = {}
     for combostates, stateids in evaluations:
@@ -66,3 +71,36 @@ def scoring_orme(evaluations: List[Tuple[List[ItemState], List[ItemID]]]):
 
     # done
     return indices, scores
+
+
+def _scoring_orme_columnar(evaluations: ColumnarEvaluations):
+    """Scoring based on Orme (2009) for `ColumnarEvaluations`"""
+    n_evals, n_dim = len(evaluations), len(evaluations.vocab)
+    states = np.asarray(evaluations.states)
+    ids = np.asarray(evaluations.ids)
+    setidx = np.repeat(np.arange(n_evals), np.diff(evaluations.offsets))
+
+    # lookup the first BEST and WORST item of each BWS set
+    id_best = _first_by_state(states, ids, setidx, n_evals, 1)
+    id_worst = _first_by_state(states, ids, setidx, n_evals, 2)
+
+    # increment/decrement, and average the scores
+    n_best = np.bincount(id_best, minlength=n_dim)
+    n_worst = np.bincount(id_worst, minlength=n_dim)
+    exists = np.flatnonzero((n_best + n_worst) > 0)
+    scores = (n_best - n_worst)[exists] / n_evals
+
+    # sort results
+    positions = np.argsort(-scores)
+    indices = np.array(evaluations.vocab.decode(exists))[positions]
+    scores = scores[positions]
+    return indices, scores
+
+
+def _first_by_state(states, ids, setidx, n_evals, state):
+    """Interned ID of the first item with the given state in each BWS set"""
+    pos = np.flatnonzero(states == state)
+    sets, first = np.unique(setidx[pos], return_index=True)
+    if len(sets) != n_evals:
+        raise ValueError(f"{state} is not in list")
+    return ids[pos[first]]
@@ -0,0 +1,176 @@
+import asyncio
+import collections
+import itertools
+import concurrent.futures
+from .sampling import sample_iter, _is_blockwise, _spawn_seed
+from typing import List, Optional
+
+# marks a failed refill in the queue
+_FAILED = object()
+
+
+class SamplePool(object):
+    """Bounded pool of ready-made BWS sets for asyncio applications
+
+    The pool hands out BWS sets from a queue, and refills the queue in the
+      background when it drops to `low_water` BWS sets. The BWS sets are
+      generated with `bws.sampling.sample_iter` in a thread (executor), i.e.
+      the event loop is not blocked. If the design is exhausted, a new
+      design is started (with a new random stream if `seed` is given).
+
+    Parameters:
+    -----------
+    examples : list
+        A list of examples
+
+    n_items : int
+        Number items per BWS set
+
+    maxsize : Optional[int] = 10000
+        The maximum number of BWS sets in the pool
+
+    low_water : Optional[int]
+        Refill the pool when it has `low_water` or less BWS sets
+          (Default: `maxsize // 4`)
+
+    executor : Optional[concurrent.futures.ThreadPoolExecutor]
+        The executor to generate BWS sets (Default: the event loop's
+          default executor)
+
+    **kwargs
+        Further arguments for `bws.sampling.sample_iter`, e.g. `method`,
+          `shuffle`, `seed`, or `return_indices`
+
+    Example:
+    --------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+
+        async def handler(pool):
+            return await pool.get()
+
+        async def main():
+            async with bws.SamplePool(examples, n_items=4) as pool:
+                bwssets = await asyncio.gather(
+                    *[handler(pool) for _ in range(100)])
+    """
+    def __init__(self, examples: list, n_items: int,
+                 maxsize: Optional[int] = 10000,
+                 low_water: Optional[int] = None,
+                 executor: Optional[
+                     concurrent.futures.ThreadPoolExecutor] = None,
+                 **kwargs):
+        self.examples = examples
+        self.n_items = n_items
+        self.maxsize = maxsize
+        self.low_water = maxsize // 4 if low_water is None else low_water
+        self.executor = executor
+        self.kwargs = kwargs
+        self.seed = kwargs.pop("seed", None)
+        self.n_designs = 0
+        self.error = None
+        self._iter = None
+        self._queue = None
+        self._waiters = None
+        self._low = None
+        self._task = None
+
+    def qsize(self) -> int:
+        """The number of ready-made BWS sets"""
+        return 0 if self._queue is None else len(self._queue)
+
+    def _new_design(self):
+        seed = self.seed
+        if _is_blockwise(seed):
+            seed = _spawn_seed(seed, self.n_designs)
+        self.n_designs += 1
+        return sample_iter(
+            self.examples, self.n_items, seed=seed, **self.kwargs)
+
+    def _next_batch(self, n: int) -> List[list]:
+        """Generate the next `n` BWS sets (runs in the executor)"""
+        batch = []
+        while len(batch) < n:
+            if self._iter is None:
+                self._iter = self._new_design()
+                fresh = True
+            else:
+                fresh = False
+            chunk = list(itertools.islice(self._iter, n - len(batch)))
+            if not chunk:
+                if fresh:
+                    raise Exception("No BWS sets can be sampled.")
+                self._iter = None
+            batch.extend(chunk)
+        return batch
+
+    async def start(self) -> 'SamplePool':
+        """Fill the pool, and start the background refill"""
+        if self._task is not None:
+            return self
+        self._queue = collections.deque()
+        self._waiters = collections.deque()
+        self._low = asyncio.Event()
+        self._low.set()
+        self._task = asyncio.get_running_loop().create_task(self._refill())
+        return self
+
+    async def close(self):
+        """Stop the background refill"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def __aenter__(self) -> 'SamplePool':
+        return await self.start()
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _refill(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._low.wait()
+            self._low.clear()
+            n = self.maxsize - len(self._queue) + len(self._waiters)
+            try:
+                batch = await loop.run_in_executor(
+                    self.executor, self._next_batch, n)
+            except Exception as err:
+                self.error = err
+                batch = itertools.repeat(_FAILED, len(self._waiters))
+            self._queue.extend(batch)
+            # serve pending requests first come, first served
+            while self._waiters and self._queue:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(self._queue.popleft())
+            if self.error is not None:
+                return
+
+    async def get(self):
+        """Return a BWS set, and wait if the pool is empty"""
+        if self._task is None:
+            await self.start()
+        if self.error is not None:
+            raise self.error
+        if len(self._queue) <= self.low_water:
+            self._low.set()
+        if self._queue:
+            bwsset = self._queue.popleft()
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            bwsset = await waiter
+        if bwsset is _FAILED:
+            raise self.error
+        return bwsset
+
+    async def get_many(self, n: int) -> List[list]:
+        """Return `n` BWS sets"""
+        return [await self.get() for _ in range(n)]
@@ -2,17 +2,18 @@ from typing import List, Dict, Tuple, Optional
 from .utils import to_scipy
 from .utils import adjustscore
 from .utils import minmax
+from .vocab import Vocabulary
 import numpy as np
 import scipy.sparse
 import scipy.sparse.linalg
 import scipy.linalg
-import scipy.stats
-import warnings
+import scipy.special
 
 
 def rank(dok: Dict[Tuple[str, str], int],
          method: Optional[str] = 'ratio',
          adjust: Optional[str] = None,
+         vocab: Optional[Vocabulary] = None,
          **kwargs) -> (np.array, np.array, np.array, dict):
     """Rank items based on pairwise comparison frequencies
 
@@ -30,6 +31,15 @@ def rank(dok: Dict[Tuple[str, str], int],
         - 'eigen'
         - 'trans'
 
+    vocab : Optional[Vocabulary]
+        Reuse the row/column indices of the sparse matrix across
+          successive calls (see `bwsample.utils.to_scipy`)
+
+    **kwargs
+        Further arguments of the selected method, e.g. `avg` for 'ratio'.
+          The method 'eigen' only uses `solver`, `tol`, `maxiter` and `v0`,
+          and ignores the other arguments.
+
     Returns:
     --------
     positions : np.array[uint64]
@@ -62,14 +72,13 @@ def rank(dok: Dict[Tuple[str, str], int],
             agg_dok, method='ratio', avg='exist', adjust='ordinal')
     """
     # convert to sparse matrix
-    cnt, indices = to_scipy(dok)
+    cnt, indices = to_scipy(dok, vocab=vocab)
 
     # compute the rankings
     if method in ('ratio'):
         positions, sortedids, metrics, info = maximize_ratio(
             cnt, indices, **kwargs)
     elif method in ('pvalue'):
-        warnings.warn("Use 'approx' because it's faster.", UserWarning)
         positions, sortedids, metrics, info = maximize_minuspvalue(
             cnt, indices, **kwargs)
     elif method in ('approx', 'hoaglin'):
@@ -79,8 +88,10 @@ def rank(dok: Dict[Tuple[str, str], int],
         positions, sortedids, metrics, info = bradley_terry_probability(
             cnt, indices, **kwargs)
     elif method in ('eigen', 'saaty'):
+        kwargs = {key: val for key, val in kwargs.items()
+                  if key in ('solver', 'tol', 'maxiter', 'v0')}
         positions, sortedids, metrics, info = eigenvector_estimation(
-            cnt, indices)
+            cnt, indices, **kwargs)
     elif method in ('trans'):
         positions, sortedids, metrics, info = transition_simulation(
             cnt, indices, **kwargs)
@@ -221,21 +232,20 @@ def maximize_minuspvalue(cnt: scipy.sparse.csr_matrix,
         positions, sortedids, metrics, info = bws.rank(
             agg_dok, method='pvalue', avg='exist')
     """
-    # compute p-values for Nij>Nji or 1
-    n, _ = cnt.shape
-    P = scipy.sparse.dok_matrix((n, n), dtype=np.float64)
-    for i in range(n):
-        for j in range(n):
-            if i > j:
-                f1, f2 = cnt[i, j], cnt[j, i]
-                fe = (f1 + f2) / 2  # E: Expected Frequency
-                if fe > 0 and f1 != f2:
-                    _, pval = scipy.stats.chisquare(
-                        f_obs=[f1, f2], f_exp=[fe, fe], ddof=0)
-                    if f1 > f2:
-                        P[i, j] = 1 - pval
-                    else:
-                        P[j, i] = 1 - pval
+    # Chi-Squared test with the expected frequency E=(Nij+Nji)/2, i.e.
+    #   X^2 = (Nij-Nji)^2 / (Nij+Nji) with DoF=1
+    cnt = cnt.tocsr().astype(np.float64)
+    X2 = cnt - cnt.T
+    X2.data = X2.data**2
+    N = cnt + cnt.T
+    N.data = 1.0 / N.data
+    X2 = X2.multiply(N)
+    # only if Nij>Nji
+    P = X2.multiply(cnt > cnt.T).tocsr()
+    P.eliminate_zeros()
+    # compute all p-values at once, and Q = 1-P, i.e. the CDF of the
+    #   Chi-Squared distribution with DoF=1 is `erf(sqrt(X^2 / 2))`
+    P.data = scipy.special.erf(np.sqrt(P.data / 2.))
 
     # sum rows in DoK matrix
     metrics = np.array(P.sum(axis=1).flatten())[0]
@@ -350,7 +360,11 @@ def maximize_hoaglinapprox(cnt: scipy.sparse.csr_matrix,
 
 
 def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
-                           indices: List[str]):
+                           indices: List[str],
+                           solver: Optional[str] = 'arpack',
+                           tol: Optional[float] = None,
+                           maxiter: Optional[int] = None,
+                           v0: Optional[np.array] = None):
     """Compute the eigenvectors of the pairwise comparison matrix, and
         calibrate eigenvectors as scores.
 
@@ -362,6 +376,24 @@ def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
     indices : List[str]
         Identifiers, e.g. UUID4, of each row/column of the `cnt` matrix.
 
+    solver : Optional[str] = 'arpack'
+        - 'arpack': `scipy.sparse.linalg.eigs`
+        - 'power': Power iteration
+
+    tol : Optional[float]
+        Termination criteria (Default: 0, i.e. machine precision, for
+          'arpack', and 1e-8 for 'power')
+
+    maxiter : Optional[int]
+        Maximum number of iterations (Default: `n * 10` for 'arpack', and
+          1000 for 'power')
+
+    v0 : Optional[np.array]
+        Initial vector, e.g. `info["eigenvec"]` of a previous run with the
+          same row/column indices (warm start). New items at the end are
+          filled with the mean. A ValueError is raised if `v0` has more
+          elements than `indices`.
+
     Returns:
     --------
     positions : np.array[uint64]
@@ -377,6 +409,9 @@ def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
         Further information depending on the selected `method`, e.g.
         - "eigval": Estimated eigenvalue
         - "eigenvec": Estimated eigenvector
+        - "n_iter": The number of power iterations (only 'power')
+        - "residual": The max. absolute change of the last power
+            iteration (only 'power')
 
     Example:
     --------
@@ -400,20 +435,41 @@ def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
     """
     # set diagonals to 1
     n = cnt.shape[0]
-    cnt = cnt.tolil()
-    for i in range(n):
-        cnt[i, i] = 1
+    cnt = cnt.tocsr().astype(np.float64)
+    cnt = cnt - scipy.sparse.diags(cnt.diagonal()) + scipy.sparse.eye(n)
+    cnt = cnt.tocsr()
+    cnt.eliminate_zeros()
 
     # Compute a sparse "positive reciprocal near consistent pairwise
     #   comparison matrix". Avoid accidental conversion into dense matrix
     #   by manipulating the value/data vector of the transposed sp matrix.
-    cnt = cnt.tocsr()
-    cntT = cnt.T
+    cntT = cnt.T.tocsr()
     cntT.data = 1.0 / cntT.data
-    ratios = cnt.multiply(cntT)
+    ratios = cnt.multiply(cntT).tocsr()
+
+    # initial vector
+    if v0 is not None:
+        v0 = np.abs(np.real(np.asarray(v0))).ravel()
+        if len(v0) > n:
+            raise ValueError(
+                f"v0 has {len(v0)} elements but there are {n} items.")
+        if len(v0) < n:
+            fill = v0.mean() if len(v0) > 0 else 1.0
+            v0 = np.concatenate([v0, np.full(n - len(v0), fill)])
 
     # compute eigenvectors as scores
-    eigval, eigenvec = scipy.sparse.linalg.eigs(ratios, k=1)
+    info = {}
+    if solver in ('arpack'):
+        eigval, eigenvec = scipy.sparse.linalg.eigs(
+            ratios, k=1, v0=v0, tol=0 if tol is None else tol,
+            maxiter=maxiter)
+    elif solver in ('power'):
+        eigval, eigenvec, info["n_iter"], info["residual"] = \
+            _power_iteration(
+                ratios, v0=v0, tol=1e-8 if tol is None else tol,
+                maxiter=1000 if maxiter is None else maxiter)
+    else:
+        raise Exception(f"solver='{solver}' not available.")
     metrics = np.abs(np.real(eigenvec[:, 0]))
 
     # sort, larger row sums are better
@@ -422,7 +478,6 @@ def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
     metrics = metrics[positions]
 
     # informations
-    info = {}
     info["eigval"] = eigval
     info["eigenvec"] = eigenvec
 
@@ -430,9 +485,48 @@ def eigenvector_estimation(cnt: scipy.sparse.csr_matrix,
     return positions, sortedids, metrics, info
 
 
-def transition_simulation(cnt: scipy.sparse.dok.dok_matrix,
+def _power_iteration(mat: scipy.sparse.csr_matrix,
+                     v0: Optional[np.array] = None,
+                     tol: Optional[float] = 1e-8,
+                     maxiter: Optional[int] = 1000
+                     ) -> (np.array, np.array, int, float):
+    """The dominant eigenvalue and eigenvector of a non-negative matrix
+
+    Returns:
+    --------
+    eigval : np.array with the shape (1,)
+        The dominant eigenvalue
+
+    eigenvec : np.array with the shape (n, 1)
+        The eigenvector (unit length)
+
+    n_iter : int
+        The number of matrix-vector products
+
+    residual : float
+        The max. absolute change of the last iteration
+    """
+    n = mat.shape[0]
+    v = np.ones(n) if v0 is None else np.asarray(v0, dtype=np.float64)
+    v = v / np.linalg.norm(v)
+    eigval, residual, k = 0.0, np.inf, 0
+    for k in range(1, maxiter + 1):
+        v1 = mat.dot(v)
+        eigval = np.linalg.norm(v1)
+        if eigval == 0:
+            break
+        v1 /= eigval
+        residual = np.linalg.norm(v1 - v, ord=np.inf)
+        v = v1
+        if residual < tol:
+            break
+    return np.array([eigval]), v.reshape(-1, 1), k, residual
+
+
+def transition_simulation(cnt: scipy.sparse.csr_matrix,
                           indices: List[str],
-                          n_rounds: Optional[int] = 2):
+                          n_rounds: Optional[int] = 2,
+                          return_transmat: Optional[bool] = False):
     """Estimate transition matrix of item_i>item_j, simulate the item
         probabilities that are calibrated to scores.
 
@@ -447,6 +541,12 @@ def transition_simulation(cnt: scipy.sparse.dok.dok_matrix,
     n_rounds: Optional[int] = 2
         Number of steps/rounds to simulate
 
+    return_transmat: Optional[bool] = False
+        Compute the transition matrix `expm(genmat)` explicitly. The matrix
+          is usually dense, i.e. only feasible for a small number of items.
+          Otherwise, only the simulated item probabilities are computed
+          with `scipy.sparse.linalg.expm_multiply`.
+
     Returns:
     --------
     positions : np.array[uint64]
@@ -461,7 +561,9 @@ def transition_simulation(cnt: scipy.sparse.dok.dok_matrix,
     info : dict
         Further information depending on the selected `method`, e.g.
         - "sim": The predicted/simulated item probability
-        - "transmat: The estimated transition probability matrix.
+        - "genmat": The generator matrix
+        - "transmat": The estimated transition probability matrix
+            (only if `return_transmat=True`)
 
     Example:
     --------
@@ -480,20 +582,26 @@ def transition_simulation(cnt: scipy.sparse.dok.dok_matrix,
     n = cnt.shape[0]
 
     # create generator matrix
-    genmat = cnt.T.tolil()
-    rowsum = genmat.sum(axis=1)
-    for i in range(n):
-        genmat[i, i] = -rowsum[i]  # set diagonals to -sum(row)
-        genmat[i, :] /= max(1, rowsum[i])
-
-    # compute transition matrix
-    transmat = scipy.sparse.linalg.expm(genmat.tocsc())
+    genmat = cnt.T.tocsr().astype(np.float64)
+    rowsum = np.asarray(genmat.sum(axis=1)).ravel()
+    # set diagonals to -sum(row)
+    genmat = genmat - scipy.sparse.diags(genmat.diagonal() + rowsum)
+    # divide each row by max(1, sum(row))
+    genmat = scipy.sparse.diags(1.0 / np.maximum(1, rowsum)) @ genmat
+    genmat = genmat.tocsr()
 
     # simulation: transition from an item1 to the next item2
-    #   that is most likely "item2 > item1"
+    #   that is most likely "item2 > item1", i.e.
+    #   x * expm(genmat)^n_rounds = x * expm(n_rounds * genmat)
     x = np.ones(n) / n
-    for i in range(n_rounds):
-        x = x * transmat
+    if return_transmat:
+        # compute transition matrix
+        transmat = scipy.sparse.linalg.expm(genmat.tocsc())
+        for i in range(n_rounds):
+            x = x * transmat
+    elif n > 0:
+        x = scipy.sparse.linalg.expm_multiply(
+            genmat.T.tocsr() * float(n_rounds), x)
 
     # sort, larger state probabilities are better
     positions = np.argsort(-x)  # maximize
@@ -503,7 +611,9 @@ def transition_simulation(cnt: scipy.sparse.dok.dok_matrix,
     # informations
     info = {}
     info["sim"] = x
-    info["transmat"] = transmat
+    info["genmat"] = genmat
+    if return_transmat:
+        info["transmat"] = transmat
 
     # done
     return positions, sortedids, metrics, info
@@ -539,66 +649,227 @@ def mle_btl_sparse(cnt: scipy.sparse.csr_matrix,
         True if solution was found within `max_iter` optimization steps.
         False if not.
 
+    Notes:
+    ------
+    Wrapper of `mle_btl_mm`
+
     References:
     -----------
     Hunter, D.R., 2004. MM algorithms for generalized Bradley-Terry models. The
       Annals of Statistics 32, 384–406. https://doi.org/10.1214/aos/1079120141
     """
+    x, flag, _, _ = mle_btl_mm(cnt, x0=x0, max_iter=max_iter, tol=tol)
+    return x, flag
+
+
+def _btl_init(x0: Optional[np.array], m: int) -> np.array:
+    """Normalized initial values. Missing values of new items are filled
+        with the mean, e.g. if `x0` are the weights of a previous run."""
+    if x0 is None:
+        return np.ones(m) / m
+    x = np.asarray(x0, dtype=np.float64).ravel()
+    if len(x) < m:
+        fill = x.mean() if len(x) > 0 else 1.0
+        x = np.concatenate([x, np.full(m - len(x), fill)])
+    return x / x.sum()
+
+
+def mle_btl_mm(cnt: scipy.sparse.csr_matrix,
+               x0: Optional[np.array] = None,
+               max_iter: Optional[int] = 50,
+               tol: Optional[float] = 1e-5
+               ) -> (np.array, bool, int, float):
+    """MLE by Hunter (2004, p.386-387) with in-place updates
+
+    Each step sets `x_i = W_i / SUM_j[(Nij + Nji) / (xi + xj)]`. The
+      sparse structure of `Nij + Nji` is computed once, and only its data
+      array is updated in each iteration.
+
+    Parameters:
+    -----------
+    cnt, x0, max_iter, tol
+        see `mle_btl_sparse`
+
+    Returns:
+    --------
+    gamma : np.array
+        Estimated gamma parameters. SUM[gammas]=1.
+
+    flag : bool
+        True if solution was found within `max_iter` optimization steps.
+
+    n_iter : int
+        The number of iterations
+
+    residual : float
+        The max. absolute change of the last iteration
+    """
     # ensure CSR format
     cnt = cnt.tocsr()
     m = cnt.shape[0]
 
     # set initial values
-    if x0 is None:
-        x = np.ones(m) / m
-    else:
-        x = np.array(x0)
-        x = x / x.sum()
+    x = _btl_init(x0, m)
 
     # rowsum, i.e. the number of wins `W_i`
-    rowsum = cnt.sum(axis=1)
-
-    # count zero rows
-    zrow = m - (cnt > 0).sum(axis=1)
+    rowsum = np.asarray(cnt.sum(axis=1), dtype=np.float64).ravel()
 
     # add `Nij + Nji`
-    cntij = (cnt + cnt.T)
-    # pseudo inverse `[(Nij + Nji) / (yi + yj)]^{-1}`
-    cntij.data = 1 / cntij.data
+    cntij = (cnt + cnt.T).tocsr()
+    cntij.eliminate_zeros()
+    nij = cntij.data.astype(np.float64)
 
-    # copy sparse structure for `yi + yj`
-    gamij = cntij.copy()
-    ridx, cidx = gamij.nonzero()
+    # copy sparse structure for `Nij / (xi + xj)`
+    gamij = cntij.astype(np.float64)
+    ridx = np.repeat(np.arange(m), np.diff(gamij.indptr))
+    cidx = gamij.indices
+    ones = np.ones(m)
 
+    residual = np.inf
     for k in range(max_iter):
-        # assign new weights
-        gamij[(ridx, cidx)] = x[ridx] + x[cidx]
-
-        # don't forget to use the inverse:
-        tmp = gamij.multiply(cntij)
+        # assign new weights, and divide the number of comparisons
+        np.add(x[ridx], x[cidx], out=gamij.data)
+        np.divide(nij, gamij.data, out=gamij.data,
+                  where=gamij.data > 0)
 
-        # sum up rows, and elementwise multiply
-        gamk = np.multiply(rowsum, zrow + tmp.sum(axis=1))
+        # `W_i / SUM_j [(Nij + Nji) / (xi + xj)]`
+        denom = gamij.dot(ones)
+        gamk = np.zeros(m)
+        np.divide(rowsum, denom, out=gamk, where=denom > 0)
 
         # normalize to `gam_i^(k)`
-        x1 = gamk / gamk.sum(axis=0)
+        x1 = gamk / gamk.sum()
 
         # abort
-        if np.linalg.norm(x1 - x, ord=np.inf) < tol:
-            return np.array(x1.flatten())[0], True
-
-        # update
+        residual = np.linalg.norm(x1 - x, ord=np.inf)
         x = x1
+        if residual < tol:
+            return x, True, k + 1, residual
+
+    # last result
+    return x, False, max_iter, residual
+
+
+def mle_btl_lsr(cnt: scipy.sparse.csr_matrix,
+                x0: Optional[np.array] = None,
+                max_iter: Optional[int] = 50,
+                tol: Optional[float] = 1e-5,
+                iterative: Optional[bool] = True,
+                max_inner: Optional[int] = 10
+                ) -> (np.array, bool, int, float):
+    """(Iterative) Luce Spectral Ranking (Maystre and Grossglauser, 2015)
+
+    The BTL parameters are the stationary distribution of a Markov chain
+      that moves from the loser `j` to the winner `i` with the rate
+      `Nij / (xi + xj)`. The iterative version (I-LSR) updates the rates
+      with the new parameters, and converges to the MLE.
+
+    The stationary distribution is computed by power iterations of the
+      lazy chain that is uniformized for each item separately, i.e. item
+      `i` keeps half of its mass and moves the other half with the rates
+      `Nji / (xi + xj) / SUM_j[Nji / (xi + xj)]`. The power iterations
+      start with the current parameters (warm start).
+
+    Parameters:
+    -----------
+    cnt : scipy.sparse.csr_matrix
+        Quadratic sparse matrix with frequency data. `cnt[i, j]` is the
+          number of times that `i` was preferred over `j`.
+
+    x0 : np.array
+        Initial values, e.g. the weights of a previous run (warm start).
+          LSR uses `x0` for the rates of its Markov chain.
+
+    max_iter : int
+        maximum number of I-LSR iterations. For LSR, the maximum number
+          of power iterations.
+
+    tol : float
+        termination criteria of the I-LSR iterations, and of the power
+          iterations
+
+    iterative : bool
+        I-LSR if True. LSR (one Markov chain) if False.
+
+    max_inner : int
+        maximum number of power iterations in each I-LSR iteration.
+          Not used for LSR.
+
+    Returns:
+    --------
+    gamma : np.array
+        Estimated gamma parameters. SUM[gammas]=1.
+
+    flag : bool
+        True if `residual < tol` within `max_iter` iterations.
+
+    n_iter : int
+        The number of I-LSR iterations, or LSR's power iterations
+
+    residual : float
+        The max. absolute change of the last iteration
+
+    References:
+    -----------
+    Maystre, L., Grossglauser, M., 2015. Fast and Accurate Inference of
+      Plackett-Luce Models. Advances in Neural Information Processing
+      Systems 28. https://arxiv.org/abs/1507.04722
+    """
+    # the comparisons `i>j` as COO arrays
+    cnt = cnt.tocoo()
+    cnt.sum_duplicates()
+    m = cnt.shape[0]
+    mask = (cnt.data > 0) & (cnt.row != cnt.col)
+    ridx, cidx = cnt.row[mask], cnt.col[mask]
+    wins = cnt.data[mask].astype(np.float64)
+
+    # set initial values
+    x = _btl_init(x0, m)
+    if not iterative:
+        max_inner = max_iter
+        max_iter = 1
+
+    residual = np.inf
+    for k in range(max_iter):
+        # transition rates from the loser to the winner (no mass moves
+        #   between items with zero weights, e.g. of a warm start)
+        xij = x[ridx] + x[cidx]
+        rates = np.zeros_like(wins)
+        np.divide(wins, xij, out=rates, where=xij > 0)
+        outflow = np.bincount(cidx, weights=rates, minlength=m)
+        # lazy chain, items without outflow are uniformized by the max. rate
+        c = 2.0 * np.where(outflow > 0, outflow, outflow.max(initial=0.0))
+        c[c == 0] = 1.0
+        pi, n_inner, delta = x, 0, np.inf
+        while n_inner < max_inner and delta >= tol:
+            inflow = np.bincount(ridx, weights=pi[cidx] * rates, minlength=m)
+            pi1 = pi + (inflow - pi * outflow) / c
+            pi1 /= pi1.sum()
+            delta = np.linalg.norm(pi1 - pi, ord=np.inf)
+            pi = pi1
+            n_inner += 1
+
+        # LSR: the power iterations are the iterations
+        if not iterative:
+            return pi, bool(delta < tol), n_inner, delta
+
+        # abort
+        residual = np.linalg.norm(pi - x, ord=np.inf)
+        x = pi
+        if residual < tol:
+            return x, True, k + 1, residual
 
     # last result
-    return np.array(x1.flatten())[0], False
+    return x, False, max_iter, residual
 
 
 def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
                               indices: List[str],
                               prefit: Optional[bool] = True,
                               max_iter: Optional[int] = 50,
-                              tol: Optional[float] = 1e-5):
+                              tol: Optional[float] = 1e-5,
+                              solver: Optional[str] = 'mm',
+                              x0: Optional[np.array] = None):
     """Bradley-Terry-Luce (BTL) probability model for pairwise comparisons
 
     Parameters:
@@ -619,6 +890,18 @@ def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
     tol : float  (see `mle_btl_sparse`)
         termination criteria
 
+    solver : str
+        The estimation algorithm
+        - 'mm': MM algorithm (Hunter, 2004), see `mle_btl_mm`
+        - 'ilsr': Iterative Luce Spectral Ranking, see `mle_btl_lsr`
+        - 'lsr': Luce Spectral Ranking (no iterations), i.e. an
+            approximation of the MLE with the rates of `x0`
+
+    x0 : np.array
+        Initial values, e.g. `info["weights"]` of a previous run with the
+          same row/column indices (warm start). New items at the end are
+          filled with the mean. Overrides `prefit`.
+
     Returns:
     --------
     positions : np.array[uint64]
@@ -633,6 +916,9 @@ def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
     info : dict
         Further information depending on the selected `method`, e.g.
         - "weights": The estimated MLE parameters that can be used for scoring
+        - "n_iter": The number of iterations
+        - "residual": The max. absolute change of the last iteration
+        - "converged": True if `residual < tol`
 
     Example:
     --------
@@ -649,8 +935,7 @@ def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
             agg_dok, method='btl', prefit=True, max_iter=100, tol=1e-5)
     """
     cnt = cnt.tocsr()
-    x0 = None
-    if prefit:
+    if x0 is None and prefit:
         ratios = cnt + cnt.T
         ratios.data = 1.0 / ratios.data
         ratios = ratios.multiply(cnt)
@@ -658,7 +943,15 @@ def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
         x0 = minmax(x0)
 
     # estimate Bradley-Terry-Luce model parameters as metric
-    x, flag = mle_btl_sparse(cnt, x0=x0, max_iter=max_iter, tol=tol)
+    if solver == 'mm':
+        x, flag, n_iter, residual = mle_btl_mm(
+            cnt, x0=x0, max_iter=max_iter, tol=tol)
+    elif solver in ('ilsr', 'lsr'):
+        x, flag, n_iter, residual = mle_btl_lsr(
+            cnt, x0=x0, max_iter=max_iter, tol=tol,
+            iterative=(solver == 'ilsr'))
+    else:
+        raise Exception(f"solver='{solver}' not available.")
 
     # sort, larger state probabilities are better
     positions = np.argsort(-x)  # maximize
@@ -668,6 +961,9 @@ def bradley_terry_probability(cnt: scipy.sparse.csr_matrix,
     # informations
     info = {}
     info["weights"] = x
+    info["n_iter"] = n_iter
+    info["residual"] = residual
+    info["converged"] = flag
 
     # done
     return positions, sortedids, metrics, info
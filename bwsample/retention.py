@@ -0,0 +1,169 @@
+import collections
+import numpy as np
+from typing import List, Optional
+
+
+def _check_positive(name: str, value: int):
+    if value < 1:
+        raise ValueError(f"{name}={value} must be 1 or greater.")
+
+
+class RetentionPolicy(object):
+    """Base class of policies that bound the logical database
+
+    A policy is notified about each BWS set that is added to the database
+      (see `CountingState`), and returns the slots of the BWS sets that
+      have to be removed from the database.
+    """
+    # call `touch` for each database entry that overlaps with a new BWS set
+    track_usage = False
+
+    def insert(self, slot: int, evaluation) -> List[int]:
+        """Register a new database entry
+
+        Parameters:
+        -----------
+        slot : int
+            The (increasing) key of the new BWS set in the database
+
+        evaluation : ParsedEvaluation
+            The new BWS set
+
+        Returns:
+        --------
+        evicted : List[int]
+            The slots to remove from the database. It might include the
+              new `slot` itself.
+        """
+        raise NotImplementedError
+
+    def touch(self, slot: int):
+        """Mark a database entry as used"""
+        pass
+
+
+class WindowRetention(RetentionPolicy):
+    """Keep the `max_size` most recent BWS sets (sliding window)
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.CountingState(
+            retention=bws.retention.WindowRetention(max_size=10000))
+    """
+    def __init__(self, max_size: int):
+        _check_positive("max_size", max_size)
+        self.max_size = max_size
+        self.slots = collections.deque()
+
+    def insert(self, slot, evaluation):
+        self.slots.append(slot)
+        if len(self.slots) > self.max_size:
+            return [self.slots.popleft()]
+        return []
+
+
+class LRURetention(RetentionPolicy):
+    """Keep the `max_size` BWS sets that were most recently inserted or
+        overlapped with a new BWS set (least recently used)
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.CountingState(
+            retention=bws.retention.LRURetention(max_size=10000))
+    """
+    track_usage = True
+
+    def __init__(self, max_size: int):
+        _check_positive("max_size", max_size)
+        self.max_size = max_size
+        self.slots = collections.OrderedDict()
+
+    def insert(self, slot, evaluation):
+        self.slots[slot] = None
+        if len(self.slots) > self.max_size:
+            return [self.slots.popitem(last=False)[0]]
+        return []
+
+    def touch(self, slot):
+        if slot in self.slots:
+            self.slots.move_to_end(slot)
+
+
+class ReservoirRetention(RetentionPolicy):
+    """Keep a uniform random sample of `max_size` BWS sets of all BWS sets
+        seen so far (Reservoir sampling, Algorithm R)
+
+    Parameters:
+    -----------
+    max_size : int
+        The reservoir size
+
+    seed : Optional[int]
+        Seed of the random number generator
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.CountingState(
+            retention=bws.retention.ReservoirRetention(max_size=10000))
+
+    References:
+    -----------
+    Vitter, J.S., 1985. Random sampling with a reservoir. ACM Transactions
+      on Mathematical Software 11, 37–57. https://doi.org/10.1145/3147.3165
+    """
+    def __init__(self, max_size: int, seed: Optional[int] = None):
+        _check_positive("max_size", max_size)
+        self.max_size = max_size
+        self.rng = np.random.default_rng(seed)
+        self.slots = []
+        self.n_seen = 0
+
+    def insert(self, slot, evaluation):
+        self.n_seen += 1
+        if len(self.slots) < self.max_size:
+            self.slots.append(slot)
+            return []
+        j = int(self.rng.integers(0, self.n_seen))
+        if j < self.max_size:
+            evicted, self.slots[j] = self.slots[j], slot
+            return [evicted]
+        return [slot]
+
+
+class ItemCapRetention(RetentionPolicy):
+    """Each item occurs in at most `max_sets` BWS sets of the database. The
+        oldest BWS sets of an item are removed first.
+
+    Example:
+    --------
+        import bwsample as bws
+        state = bws.CountingState(
+            retention=bws.retention.ItemCapRetention(max_sets=5))
+    """
+    def __init__(self, max_sets: int):
+        _check_positive("max_sets", max_sets)
+        self.max_sets = max_sets
+        self.items = {}
+        self.slotids = {}
+
+    def insert(self, slot, evaluation):
+        self.slotids[slot] = list(evaluation.pos)
+        evicted = []
+        for uid in self.slotids[slot]:
+            slots = self.items.setdefault(uid, collections.deque())
+            slots.append(slot)
+            while len(slots) > self.max_sets:
+                old = slots[0]
+                self._remove(old)
+                evicted.append(old)
+        return evicted
+
+    def _remove(self, slot):
+        for uid in self.slotids.pop(slot):
+            slots = self.items[uid]
+            slots.remove(slot)
+            if not slots:
+                del self.items[uid]
@@ -1,10 +1,19 @@
 import numpy as np
 import warnings
-from typing import List, Optional
+import collections
+import concurrent.futures
+import itertools
+import os
+from typing import List, Optional, Iterator, Union
+Seed = Union[None, int, np.random.SeedSequence, np.random.Generator]
 
 
 def sample(examples: list, n_items: int, method: str = 'overlap',
-           shuffle: bool = True, n_sets=None) -> List[list]:
+           shuffle: bool = True, n_sets=None,
+           return_indices: bool = False,
+           seed: Seed = None,
+           n_jobs: Optional[int] = None,
+           n_cover: Optional[int] = 3) -> List[list]:
     """Sample BWS sets from a list of examples
 
     Parameters:
@@ -16,16 +25,40 @@ def sample(examples: list, n_items: int, method: str = 'overlap',
         Number items per BWS set
 
     method : str='overlap'
-        'overlap' or 'twice'
+        'overlap', 'twice', or 'kcover'
 
     shuffle : bool=True
         Flag to permute/shuffle indices
 
+    return_indices : bool=False
+        Return the positions of the sampled examples instead of the
+          examples, i.e. `samples[k] = [examples[i] for i in indices[k]]`.
+          If there are fewer examples than `n_items`, the positions
+          overflow and repeat, but the repeated examples are dropped.
+
+    seed : Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling. An int or
+          `SeedSequence` shuffles each BWS set with counter-based random
+          numbers keyed by `(seed, k)` (see `indices_shard`). A
+          `Generator` is used as one stream. If None, the global
+          `np.random` state is used.
+
+    n_jobs : Optional[int]
+        (default: None) Number of worker processes that generate the BWS
+          sets (see `indices_parallel`). Use `n_jobs=-1` for all CPUs.
+
+    n_cover : Optional[int] = 3
+        The number of BWS sets of each example if `method='kcover'`
+          (see `indices_kcover_array`)
+
     Return:
     -------
     samples: List[List[DATA]]
         A list of BWS sets. Each BWS set is a list of n_items sampled examples
 
+    indices: np.ndarray[int64] with the shape (n_sets, n_items)
+        If `return_indices=True`. The positions of the sampled examples.
+
     Examples:
     ---------
         import bwsample as bws
@@ -39,31 +72,60 @@ def sample(examples: list, n_items: int, method: str = 'overlap',
 
     # Generate BWS sets
     n_sets = len(examples) // (n_items - 1)
-    if method in ('overlap'):
-        bwsindices, n_examples = indices_overlap(n_sets, n_items, shuffle)
+    if n_jobs is not None and method in ('overlap', 'twice'):
+        bwsindices, n_examples = indices_parallel(
+            n_sets, n_items, method, shuffle, seed=seed, n_jobs=n_jobs)
+    elif method in ('overlap'):
+        bwsindices, n_examples = indices_overlap_array(
+            n_sets, n_items, shuffle, seed=seed)
     elif method in ('twice'):
-        bwsindices, n_examples = indices_twice(n_sets, n_items, shuffle)
+        bwsindices, n_examples = indices_twice_array(
+            n_sets, n_items, shuffle, seed=seed)
+    elif method in ('kcover'):
+        bwsindices, n_examples = indices_kcover_array(
+            len(examples), n_items, n_cover, shuffle, seed=seed)
     else:
         raise Exception(f"method='{method}' not available.")
 
     # enforce overflow if `index>=n`
     n = len(examples)
-    oflowindices_ = [[idx % n for idx in indicies]
-                     for indicies in bwsindices]
-    # reshape data into BWS sets
-    reshaped = [[v for i, v in enumerate(examples) if i in indicies]
-                for indicies in oflowindices_]
+    oflowindices_ = bwsindices % max(n, 1)
+    if return_indices:
+        return oflowindices_
+    # gather the examples of each BWS set
+    reshaped = _gather(examples, oflowindices_)
     # done
     return reshaped
 
 
-def shuffle_subarrs(arrs, n_sets=None, n_items=None):
+def _gather(examples: list, bwsindices: np.ndarray) -> List[list]:
+    """The examples of each BWS set. The overflowed duplicates are dropped
+        if there are fewer examples than `n_items`."""
+    if len(examples) < bwsindices.shape[1]:
+        return [[examples[i] for i in dict.fromkeys(indicies)]
+                for indicies in bwsindices.tolist()]
+    return [[examples[i] for i in indicies]
+            for indicies in bwsindices.tolist()]
+
+
+def shuffle_subarrs(arrs, n_sets=None, n_items=None, rng=None):
     """Shuffle the sublists' items
 
+    Swaps a random item into the first position, and a random item into the
+      last position of each sublist.
+
     Parameter:
     ----------
-    arrs: List[List[int]] with the shape (n_sets, n_items)
-        A list of (sub)lists
+    arrs: np.ndarray or List[List[int]] with the shape (n_sets, n_items)
+        An integer matrix or a list of (sub)lists. A matrix is shuffled
+          in-place with vectorized operations.
+
+    n_sets: int
+        (default: None) Only shuffle the first `n_sets` rows
+
+    rng: Optional[np.random.Generator]
+        (default: None) The random number generator. If None, the global
+          `np.random` state is used.
 
     Example:
     --------
@@ -72,21 +134,56 @@ def shuffle_subarrs(arrs, n_sets=None, n_items=None):
         n_sets, n_items = 2, 3
         out = bws.sampling.shuffle_subarrs(arrs, n_sets, n_items)
     """
+    # list adapter
+    if not isinstance(arrs, np.ndarray):
+        out = shuffle_subarrs(np.array(arrs), n_sets, n_items, rng=rng)
+        arrs[:] = out.tolist()
+        return arrs
+
     if n_sets is None:
-        n_sets = len(arrs)
+        n_sets = arrs.shape[0]
     if n_items is None:
-        n_items = len(arrs[0])
-    rj = np.random.randint(1, n_items, n_sets)
-    rk = np.random.randint(0, n_items - 1, n_sets)
-    for i, (j, k) in enumerate(np.c_[rj, rk]):
-        arrs[i][j], arrs[i][0] = arrs[i][0], arrs[i][j]
-        if j != k:
-            arrs[i][k], arrs[i][-1] = arrs[i][-1], arrs[i][k]
+        n_items = arrs.shape[1]
+    rj, rk = _swap_draws(n_sets, n_items, rng)
+    cols = _swap_columns(rj, rk, n_items, arrs.shape[1])
+    arrs[:n_sets] = np.take_along_axis(arrs[:n_sets], cols, axis=1)
     return arrs
 
 
+def _swap_draws(n_sets: int, n_items: int, rng=None
+                ) -> (np.ndarray, np.ndarray):
+    """The random positions `rj` and `rk` of each row (see
+        `shuffle_subarrs`)"""
+    if rng is None:
+        rj = np.random.randint(1, n_items, n_sets)
+        rk = np.random.randint(0, n_items - 1, n_sets)
+    else:
+        rj = rng.integers(1, n_items, n_sets)
+        rk = rng.integers(0, n_items - 1, n_sets)
+    return rj, rk
+
+
+def _swap_columns(rj: np.ndarray, rk: np.ndarray, n_items: int,
+                  n_cols: int) -> np.ndarray:
+    """The column order of each row after swapping the j-th and the first
+        item, and then the k-th and the last item (if `j != k`)"""
+    cols = np.tile(np.arange(n_cols, dtype=np.int64), (len(rj), 1))
+    rows = np.arange(len(rj))
+    # swap the j-th and the first item
+    cols[rows, 0] = rj
+    cols[rows, rj] = 0
+    # swap the k-th and the last item
+    mask = rj != rk
+    rows, rk = rows[mask], rk[mask]
+    tmp = cols[rows, -1].copy()
+    cols[rows, -1] = cols[rows, rk]
+    cols[rows, rk] = tmp
+    return cols
+
+
 def indices_overlap(n_sets: int, n_items: int,
-                    shuffle: Optional[bool] = True) -> (List[List[int]], int):
+                    shuffle: Optional[bool] = True,
+                    seed: Seed = None) -> (List[List[int]], int):
     """Generate BWS set indices so that each example occur at least once,
         and exactly `1/(n_items - 1) * 100%` of examples occur twice across
         all generate BWS sets.
@@ -102,6 +199,9 @@ def indices_overlap(n_sets: int, n_items: int,
     shuffle: bool=True
         Flag to permute/shuffle indices
 
+    seed: Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling (see `sample`)
+
     Return:
     -------
     bwsindices: List[List[int]]
@@ -119,44 +219,68 @@ def indices_overlap(n_sets: int, n_items: int,
 
     Notes:
     ------
-    Using `@numba.jit(nopython=True)` doesn't seem to yield any performance
-      benefits.
+    List adapter of `indices_overlap_array`
+    """
+    bwsindices, n_examples = indices_overlap_array(
+        n_sets, n_items, shuffle, seed=seed)
+    return bwsindices.tolist(), n_examples
+
+
+def indices_overlap_array(n_sets: int, n_items: int,
+                          shuffle: Optional[bool] = True,
+                          seed: Seed = None) -> (np.ndarray, int):
+    """Generate BWS set indices so that each example occur at least once,
+        and exactly `1/(n_items - 1) * 100%` of examples occur twice across
+        all generate BWS sets. (see `indices_overlap`)
+
+    Return:
+    -------
+    bwsindices: np.ndarray[int64] with the shape (n_sets, n_items)
+        The indices of each BWS set
+
+    n_examples: int
+        The number of indices spread across the BWS sets.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        bwsindices, n_examples = bws.sampling.indices_overlap_array(
+            10**7, 4, shuffle=True)
     """
     # abort
     if n_items < 2:
         warnings.warn(f"No overlap possible with n_items={n_items}.")
-        return [], 0
+        return np.empty((0, max(n_items, 0)), dtype=np.int64), 0
     if n_sets < 1:
         warnings.warn("Zero BWS sets requested.")
-        return [], 0
+        return np.empty((0, n_items), dtype=np.int64), 0
     if n_sets == 1:
         warnings.warn("Only one BWS set requested.")
         if shuffle:
-            return [list(np.random.permutation(n_items))], n_items
+            rng = np.random if seed is None else np.random.default_rng(seed)
+            return rng.permutation(n_items).reshape(1, -1), n_items
         else:
-            return [list(range(0, n_items))], n_items
+            return np.arange(n_items).reshape(1, -1), n_items
 
     # compute required number of examples
     n_examples = n_sets * (n_items - 1)
 
-    # generate a `pool` of indices
-    pool = list(range(0, n_examples))
+    # shuffle block by block with counter-based random numbers
+    if _is_blockwise(seed):
+        return indices_shard(
+            n_sets, n_items, 'overlap', shuffle, seed=seed), n_examples
 
-    # copy from indices `pool`
-    bwsindices = [pool[k:(k + n_items)]
-                  for k in range(0, n_examples, n_items - 1)]
-    bwsindices[-1].append(bwsindices[0][0])
-
-    # shuffle each BWS set
-    if shuffle:
-        bwsindices = shuffle_subarrs(bwsindices, n_sets, n_items)
+    # generate all BWS sets, and shuffle each BWS set
+    bwsindices = _overlap_rows(
+        np.arange(n_sets), n_sets, n_items, shuffle=shuffle, seed=seed)
 
     # done
     return bwsindices, n_examples
 
 
 def indices_twice(n_sets: int, n_items: int,
-                  shuffle: Optional[bool] = True) -> (List[List[int]], int):
+                  shuffle: Optional[bool] = True,
+                  seed: Seed = None) -> (List[List[int]], int):
     """Sample each example at least twice across all generated BWS sets
 
     Parameters:
@@ -170,6 +294,9 @@ def indices_twice(n_sets: int, n_items: int,
     shuffle: bool=True
         Flag to permute/shuffle indices
 
+    seed: Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling (see `sample`)
+
     Return:
     -------
     bwsindices: List[List[int]]
@@ -184,30 +311,674 @@ def indices_twice(n_sets: int, n_items: int,
     ---------
         from bwsample import indices_twice
         bwsindices, n_examples = indices_twice(1000, 4, False)
+
+    Notes:
+    ------
+    List adapter of `indices_twice_array`
     """
-    # (A) Call `indices_overlap` without randomness!
-    bwsindices, n_examples = indices_overlap(n_sets, n_items, False)
+    bwsindices, n_examples = indices_twice_array(
+        n_sets, n_items, shuffle, seed=seed)
+    return bwsindices.tolist(), n_examples
+
+
+def indices_twice_array(n_sets: int, n_items: int,
+                        shuffle: Optional[bool] = True,
+                        seed: Seed = None) -> (np.ndarray, int):
+    """Sample each example at least twice across all generated BWS sets
+        (see `indices_twice`)
+
+    Return:
+    -------
+    bwsindices: np.ndarray[int64] with the shape (n_bwssets, n_items)
+        The indices of each BWS set
 
+    n_examples: int
+        The number of indices spread across the BWS sets.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        bwsindices, n_examples = bws.sampling.indices_twice_array(
+            10**7, 4, shuffle=True)
+    """
+    # small designs and warnings of `indices_overlap` without randomness!
     if n_items <= 2 or n_sets <= 1:
-        return bwsindices, n_examples
+        return indices_overlap_array(n_sets, n_items, False)
+    n_examples = n_sets * (n_items - 1)
+
+    # shuffle block by block with counter-based random numbers
+    if _is_blockwise(seed):
+        return indices_shard(
+            n_sets, n_items, 'twice', shuffle, seed=seed), n_examples
 
-    # (B) Add BWS sets so that every index is used twice --
-    # number of BWS sets to connect examples
-    n_btw = (n_examples * (n_items - 2)) // (n_items * (n_items - 1))
+    # (A) The shuffled 'overlap' BWS sets
+    bwsindices = _overlap_rows(
+        np.arange(n_sets), n_sets, n_items, shuffle=shuffle, seed=seed)
+
+    # (B) Add BWS sets so that every index is used twice
+    n_btw = _n_connectors(n_sets, n_items)
+    if n_btw > 0:
+        bwsindices = np.vstack([
+            bwsindices, _connector_rows(np.arange(n_btw), n_sets, n_items)])
+
+    # done
+    return bwsindices, n_examples
 
-    # which examples from the `pool` have not been used twice?
-    avail = [q for q in range(n_examples) if (q % (n_items - 1)) != 0]
-    n_avail = n_btw * (len(avail) // n_btw)
 
-    # generate BWS sets
-    grid = range(0, n_avail, n_btw)
-    grid = grid[:n_items]
-    for r in range(n_btw):
-        bwsindices.extend([[avail[k + r] for k in grid]])
+def _overlap_rows(ks: np.ndarray, n_sets: int, n_items: int,
+                  shuffle: Optional[bool] = False,
+                  seed: Seed = None) -> np.ndarray:
+    """Indices of the `ks`-th BWS sets of the 'overlap' design
 
-    # (C) Shuffle here
+    The k-th BWS set starts at `k * (n_items - 1)`, and the last index of
+      the last BWS set overflows to the first index `0`. If `shuffle=True`,
+      the BWS sets are shuffled like `shuffle_subarrs(..., rng=seed)`. An
+      int or `SeedSequence` shuffles each BWS set by its number k instead
+      (see `_counter_draws`).
+    """
+    ks = np.asarray(ks, dtype=np.int64)
     if shuffle:
-        bwsindices = shuffle_subarrs(bwsindices, n_sets, n_items)
+        if _is_blockwise(seed):
+            rj, rk = _counter_draws(ks, n_items, seed)
+        else:
+            rj, rk = _swap_draws(len(ks), n_items, seed)
+        bwsindices = _swap_columns(rj, rk, n_items, n_items)
+    else:
+        bwsindices = np.tile(np.arange(n_items, dtype=np.int64), (len(ks), 1))
+    bwsindices += (ks * (n_items - 1))[:, None]
+    # only the last BWS set overflows
+    last = np.flatnonzero(ks == n_sets - 1)
+    bwsindices[last] %= n_sets * (n_items - 1)
+    return bwsindices
+
+
+def _n_connectors(n_sets: int, n_items: int) -> int:
+    """Number of BWS sets that 'twice' adds to the 'overlap' design"""
+    if n_items <= 2 or n_sets <= 1:
+        return 0
+    n_examples = n_sets * (n_items - 1)
+    return (n_examples * (n_items - 2)) // (n_items * (n_items - 1))
+
+
+def _connector_rows(rs: np.ndarray, n_sets: int, n_items: int) -> np.ndarray:
+    """Indices of the `rs`-th connector BWS sets of the 'twice' design
+
+    The connectors combine the examples that occur only once in the
+      'overlap' design, i.e. the `t`-th index that is not a multiple of
+      `n_items - 1` is `t + t // (n_items - 2) + 1`. The r-th connector
+      picks every `n_btw`-th of these examples starting at `r`.
+    """
+    n_btw = _n_connectors(n_sets, n_items)
+    t = np.add.outer(np.asarray(rs, dtype=np.int64),
+                     np.arange(n_items, dtype=np.int64) * n_btw)
+    return t + t // (n_items - 2) + 1
+
+
+def indices_kcover(n_examples: int, n_items: int,
+                   n_cover: Optional[int] = 3,
+                   shuffle: Optional[bool] = True,
+                   seed: Seed = None) -> (List[List[int]], int):
+    """Sample each example `n_cover` times without repeating pairs of
+        examples (see `indices_kcover_array`)
+
+    Notes:
+    ------
+    List adapter of `indices_kcover_array`
+    """
+    bwsindices, n_examples = indices_kcover_array(
+        n_examples, n_items, n_cover, shuffle, seed=seed)
+    return bwsindices.tolist(), n_examples
+
+
+def indices_kcover_array(n_examples: int, n_items: int,
+                         n_cover: Optional[int] = 3,
+                         shuffle: Optional[bool] = True,
+                         seed: Seed = None) -> (np.ndarray, int):
+    """Sample each example `n_cover` times without repeating pairs of
+        examples
+
+    The design has `n_cover` rounds. The r-th round splits a permutation
+      `p -> (stride * p + offset) % n_examples` of all examples into
+      consecutive BWS sets, i.e. each example occurs once per round. The
+      examples of a BWS set differ by `j * stride` (`0 < j < n_items`).
+      The strides are chosen so that these differences do not overlap
+      between rounds, i.e. two examples share at most one BWS set. If
+      there are not enough such strides for `n_cover` rounds (e.g. small
+      `n_examples`), some pairs of examples repeat, and a warning is
+      raised.
+
+    If `n_examples` is not a multiple of `n_items`, the last BWS set of a
+      round is filled up with the first examples of the round, i.e. these
+      examples occur once more in the round, and might share two BWS sets.
+      The offsets `r * n_padded` move the filled up examples between
+      rounds.
+
+    Parameters:
+    -----------
+    n_examples: int
+        The number of examples
+
+    n_items: int
+        Number items per BWS set
+
+    n_cover: Optional[int] = 3
+        The number of BWS sets of each example
+
+    shuffle: bool=True
+        Flag to permute/shuffle indices
+
+    seed: Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling
+
+    Return:
+    -------
+    bwsindices: np.ndarray[int64] with the shape
+        (n_cover * ceil(n_examples / n_items), n_items)
+        The indices of each BWS set
+
+    n_examples: int
+        The number of indices spread across the BWS sets.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        bwsindices, n_examples = bws.sampling.indices_kcover_array(
+            10**6, 4, n_cover=5)
+    """
+    # abort
+    if n_items < 2:
+        warnings.warn(f"No overlap possible with n_items={n_items}.")
+        return np.empty((0, max(n_items, 0)), dtype=np.int64), 0
+    if n_cover < 1:
+        warnings.warn("Zero BWS sets requested.")
+        return np.empty((0, n_items), dtype=np.int64), 0
+    if n_examples < n_items:
+        warnings.warn((
+            f"Not enough examples (n_examples={n_examples}) for one BWS set "
+            f"with n_items={n_items}."))
+        return np.empty((0, n_items), dtype=np.int64), 0
+
+    # generate the BWS sets of all rounds
+    strides = np.array(_kcover_strides(n_examples, n_items, n_cover),
+                       dtype=np.int64)
+    n_per_round = -(-n_examples // n_items)
+    n_padded = n_per_round * n_items - n_examples
+    offsets = np.arange(n_cover, dtype=np.int64) * n_padded
+    pos = np.arange(n_per_round * n_items, dtype=np.int64) % n_examples
+    bwsindices = ((np.multiply.outer(strides, pos) + offsets[:, None])
+                  % n_examples).reshape(-1, n_items)
+
+    # shuffle each BWS set
+    if shuffle:
+        rng = None if seed is None else np.random.default_rng(seed)
+        bwsindices = shuffle_subarrs(bwsindices, rng=rng)
 
     # done
     return bwsindices, n_examples
+
+
+def _kcover_strides(n_examples: int, n_items: int,
+                    n_cover: int) -> List[int]:
+    """Strides of the rounds of `indices_kcover_array`
+
+    Each stride is coprime to `n_examples`, and the differences
+      `+/- j * stride % n_examples` (`0 < j < n_items`) of different strides
+      are disjoint. The smallest valid strides are chosen greedily. If there
+      are not enough valid strides, the remaining strides have the least
+      differences in common with the previous strides.
+    """
+    def differences(stride):
+        return {(sign * j * stride) % n_examples
+                for j in range(1, n_items) for sign in (1, -1)}
+
+    # the smallest strides without common differences
+    strides, used = [], collections.Counter()
+    stride = 1
+    while len(strides) < n_cover and stride < n_examples:
+        if np.gcd(stride, n_examples) == 1:
+            diffs = differences(stride)
+            if not any(d in used for d in diffs):
+                strides.append(stride)
+                used.update(diffs)
+        stride += 1
+
+    # the strides with the least repeated differences
+    if len(strides) < n_cover:
+        warnings.warn(f"Pairs of examples repeat with n_cover={n_cover}.")
+        candidates = [s for s in range(1, n_examples)
+                      if np.gcd(s, n_examples) == 1]
+        while len(strides) < n_cover:
+            stride = min(candidates, key=lambda s: sum(
+                used[d] for d in differences(s)))
+            strides.append(stride)
+            used.update(differences(stride))
+    return strides
+
+
+def indices_iter(n_sets: int, n_items: int, method: str = 'overlap',
+                 shuffle: Optional[bool] = True,
+                 chunk_size: Optional[int] = 10000,
+                 seed: Seed = None) -> Iterator[np.ndarray]:
+    """Generate the BWS set indices of `indices_overlap` or `indices_twice`
+        chunk by chunk
+
+    Parameters:
+    -----------
+    n_sets: int
+        Requested number of BWS sets
+
+    n_items: int
+        Number items per BWS set
+
+    method : str='overlap'
+        'overlap' or 'twice'
+
+    shuffle: bool=True
+        Flag to permute/shuffle indices
+
+    chunk_size: Optional[int] = 10000
+        The maximum number of BWS sets per chunk
+
+    seed: Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling. With an int or
+          `SeedSequence`, the chunks are the blocks of `indices_shard`
+          with `block_size=chunk_size`.
+
+    Yields:
+    -------
+    bwsindices: np.ndarray[int64] with the shape (chunk_size, n_items)
+        The indices of the next BWS sets. All chunks together are the
+          same design as `indices_overlap_array` or `indices_twice_array`
+          (apart from the random shuffling).
+
+    Examples:
+    ---------
+        import bwsample as bws
+        for bwsindices in bws.sampling.indices_iter(10**6, 4, 'twice'):
+            pass
+    """
+    if method not in ('overlap', 'twice'):
+        raise Exception(f"method='{method}' not available.")
+
+    # small designs and warnings
+    if n_items < 2 or n_sets <= 1:
+        bwsindices, _ = indices_overlap_array(
+            n_sets, n_items, shuffle, seed=seed)
+        if len(bwsindices) > 0:
+            yield bwsindices
+        return
+
+    # seeded blocks
+    if _is_blockwise(seed):
+        for b in range(_n_blocks(n_sets, n_items, method, chunk_size)):
+            yield _design_block(
+                b, n_sets, n_items, method, shuffle, seed, chunk_size)
+        return
+
+    # the 'overlap' BWS sets
+    for start in range(0, n_sets, chunk_size):
+        ks = np.arange(start, min(start + chunk_size, n_sets))
+        yield _overlap_rows(ks, n_sets, n_items, shuffle=shuffle, seed=seed)
+
+    # the connector BWS sets of 'twice'
+    n_btw = _n_connectors(n_sets, n_items) if method == 'twice' else 0
+    for start in range(0, n_btw, chunk_size):
+        rs = np.arange(start, min(start + chunk_size, n_btw))
+        yield _connector_rows(rs, n_sets, n_items)
+
+
+def sample_iter(examples: list, n_items: int, method: str = 'overlap',
+                shuffle: bool = True, chunk_size: Optional[int] = 10000,
+                return_indices: bool = False,
+                seed: Seed = None) -> Iterator[list]:
+    """Sample BWS sets from a list of examples on demand
+
+    Parameters:
+    -----------
+    examples : list
+        A list of examples (or any sequence with random access)
+
+    n_items : int
+        Number items per BWS set
+
+    method : str='overlap'
+        'overlap' or 'twice'
+
+    shuffle : bool=True
+        Flag to permute/shuffle indices
+
+    chunk_size: Optional[int] = 10000
+        The number of BWS set indices that are generated at once
+
+    return_indices : bool=False
+        Yield the positions of the sampled examples instead of the examples
+
+    seed : Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) Seed for reproducible shuffling (see `indices_iter`)
+
+    Yields:
+    -------
+    bwsset: List[DATA]
+        A BWS set with n_items sampled examples. The BWS sets follow the
+          same design as `sample`.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+        for bwsset in bws.sampling.sample_iter(examples, n_items=4):
+            pass
+    """
+    n = len(examples)
+    n_sets = n // (n_items - 1)
+    for bwsindices in indices_iter(n_sets, n_items, method=method,
+                                   shuffle=shuffle, chunk_size=chunk_size,
+                                   seed=seed):
+        bwsindices = bwsindices % max(n, 1)
+        if return_indices:
+            yield from bwsindices
+        else:
+            yield from _gather(examples, bwsindices)
+
+
+def _is_blockwise(seed: Seed) -> bool:
+    """An int or `SeedSequence` keys the random numbers of each BWS set,
+        i.e. the BWS sets can be generated block by block"""
+    return seed is not None and not isinstance(seed, np.random.Generator)
+
+
+def _spawn_seed(seed: Union[int, np.random.SeedSequence],
+                b: int) -> np.random.SeedSequence:
+    """The b-th child `SeedSequence` of an int or `SeedSequence`"""
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(
+            seed.entropy, spawn_key=tuple(seed.spawn_key) + (b,),
+            pool_size=seed.pool_size)
+    return np.random.SeedSequence(seed, spawn_key=(b,))
+
+
+def _mix64(z: np.ndarray) -> np.ndarray:
+    """The finalizer of SplitMix64, i.e. a bijective hash of uint64"""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return z ^ (z >> np.uint64(31))
+
+
+def _counter_draws(ks: np.ndarray, n_items: int,
+                   seed: Union[int, np.random.SeedSequence]
+                   ) -> (np.ndarray, np.ndarray):
+    """The random positions `rj` and `rk` of the `ks`-th BWS sets keyed by
+        `(seed, k)` (see `shuffle_subarrs`)
+
+    The k-th BWS set hashes its counter `k` with two 64-bit keys of `seed`,
+      and maps the upper 32 bits of each hash to a position with a
+      multiply-shift. Each BWS set is drawn in `O(1)` without the others.
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    key = seed.generate_state(2, dtype=np.uint64)
+    ks = np.asarray(ks, dtype=np.uint64) * np.uint64(0x9e3779b97f4a7c15)
+    n = np.uint64(n_items - 1)
+    uj = _mix64(ks + key[0]) >> np.uint64(32)
+    uk = _mix64(ks + key[1]) >> np.uint64(32)
+    rj = 1 + ((uj * n) >> np.uint64(32)).astype(np.int64)
+    rk = ((uk * n) >> np.uint64(32)).astype(np.int64)
+    return rj, rk
+
+
+def _n_blocks(n_sets: int, n_items: int, method: str,
+              block_size: int) -> int:
+    n_total = n_sets
+    if method == 'twice':
+        n_total += _n_connectors(n_sets, n_items)
+    return -(-n_total // block_size)
+
+
+def _design_block(b: int, n_sets: int, n_items: int, method: str,
+                  shuffle: bool, seed: Union[int, np.random.SeedSequence],
+                  block_size: int) -> np.ndarray:
+    """The b-th block of `block_size` BWS sets of a design
+
+    Each 'overlap' BWS set of the block is shuffled with the random
+      numbers of its number k (see `_counter_draws`). The connector BWS
+      sets of 'twice' are not shuffled (see `indices_twice_array`).
+    """
+    n_btw = _n_connectors(n_sets, n_items) if method == 'twice' else 0
+    start = b * block_size
+    stop = min(start + block_size, n_sets + n_btw)
+    bwsindices = _overlap_rows(
+        np.arange(start, min(stop, n_sets)), n_sets, n_items,
+        shuffle=shuffle, seed=seed)
+    if stop > n_sets:
+        rs = np.arange(max(start, n_sets), stop) - n_sets
+        bwsindices = np.vstack([
+            bwsindices, _connector_rows(rs, n_sets, n_items)])
+    return bwsindices
+
+
+def indices_shard(n_sets: int, n_items: int, method: str = 'overlap',
+                  shuffle: Optional[bool] = True,
+                  seed: Union[int, np.random.SeedSequence] = 0,
+                  shard: Optional[int] = 0,
+                  n_shards: Optional[int] = 1,
+                  block_size: Optional[int] = 10000) -> np.ndarray:
+    """Generate one shard of the BWS set indices of a design
+
+    The design is split into blocks of `block_size` BWS sets. Each BWS
+      set is shuffled with counter-based random numbers keyed by `seed`
+      and its number k, i.e. the design does not depend on `block_size`.
+      A shard consists of consecutive blocks, and all shards stacked in
+      order are identical to `n_shards=1` regardless of the number of
+      shards.
+
+    Parameters:
+    -----------
+    n_sets: int
+        Requested number of BWS sets
+
+    n_items: int
+        Number items per BWS set
+
+    method : str='overlap'
+        'overlap' or 'twice'
+
+    shuffle: bool=True
+        Flag to permute/shuffle indices
+
+    seed: Union[int, np.random.SeedSequence] = 0
+        The key of the counter-based random numbers
+
+    shard: Optional[int] = 0
+        The number of the shard, i.e. `0 <= shard < n_shards`
+
+    n_shards: Optional[int] = 1
+        The total number of shards
+
+    block_size: Optional[int] = 10000
+        The number of BWS sets per block
+
+    Return:
+    -------
+    bwsindices: np.ndarray[int64] with the shape (n_shard_sets, n_items)
+        The indices of the BWS sets of the shard
+
+    Examples:
+    ---------
+        import bwsample as bws
+        shards = [bws.sampling.indices_shard(10**6, 4, seed=42, shard=s,
+                                             n_shards=4) for s in range(4)]
+        bwsindices, _ = bws.sampling.indices_overlap_array(
+            10**6, 4, seed=42)  # same as `np.vstack(shards)`
+    """
+    if method not in ('overlap', 'twice'):
+        raise Exception(f"method='{method}' not available.")
+
+    # small designs are not split
+    if n_items < 2 or n_sets <= 1:
+        if shard > 0:
+            return np.empty((0, max(n_items, 0)), dtype=np.int64)
+        return indices_overlap_array(
+            n_sets, n_items, shuffle and method == 'overlap', seed=seed)[0]
+    if method == 'twice' and n_items <= 2:
+        shuffle = False
+
+    # the consecutive blocks of the shard
+    n_blocks = _n_blocks(n_sets, n_items, method, block_size)
+    blocks = np.array_split(np.arange(n_blocks), n_shards)[shard]
+    if len(blocks) == 0:
+        return np.empty((0, n_items), dtype=np.int64)
+    return np.vstack([
+        _design_block(b, n_sets, n_items, method, shuffle, seed, block_size)
+        for b in blocks.tolist()])
+
+
+def indices_parallel(n_sets: int, n_items: int, method: str = 'overlap',
+                     shuffle: Optional[bool] = True,
+                     seed: Seed = None,
+                     n_jobs: Optional[int] = None,
+                     block_size: Optional[int] = 10000) -> (np.ndarray, int):
+    """Generate the BWS set indices of a design in worker processes
+
+    Each worker process generates one shard (see `indices_shard`), and the
+      shards are merged in order. The result is identical to the serial
+      `indices_overlap_array` or `indices_twice_array` with the same
+      `seed` (int or `SeedSequence`).
+
+    Parameters:
+    -----------
+    n_sets, n_items, method, shuffle, block_size
+        see `indices_shard`
+
+    seed: Optional[int, np.random.SeedSequence, np.random.Generator]
+        (default: None) The root seed. A `Generator` draws the root seed.
+          If None, a fresh `SeedSequence` is used.
+
+    n_jobs: Optional[int]
+        (default: None) Number of worker processes. Use `n_jobs=-1` for
+          all CPUs.
+
+    Return:
+    -------
+    bwsindices: np.ndarray[int64] with the shape (n_bwssets, n_items)
+        The indices of each BWS set
+
+    n_examples: int
+        The number of indices spread across the BWS sets.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        bwsindices, n_examples = bws.sampling.indices_parallel(
+            10**7, 4, 'twice', seed=42, n_jobs=4)
+    """
+    if method not in ('overlap', 'twice'):
+        raise Exception(f"method='{method}' not available.")
+    if seed is None:
+        seed = np.random.SeedSequence()
+    elif isinstance(seed, np.random.Generator):
+        seed = int(seed.integers(2**63))
+    if n_jobs is None or n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+
+    # small designs and warnings
+    if n_items < 2 or n_sets <= 1:
+        return indices_overlap_array(
+            n_sets, n_items, shuffle and method == 'overlap', seed=seed)
+    n_examples = n_sets * (n_items - 1)
+
+    # generate the shards, and merge them in order
+    n_jobs = max(1, min(n_jobs, _n_blocks(n_sets, n_items, method,
+                                          block_size)))
+    if n_jobs == 1:
+        return indices_shard(n_sets, n_items, method, shuffle, seed=seed,
+                             block_size=block_size), n_examples
+    with concurrent.futures.ProcessPoolExecutor(n_jobs) as executor:
+        shards = list(executor.map(
+            indices_shard, itertools.repeat(n_sets), itertools.repeat(n_items),
+            itertools.repeat(method), itertools.repeat(shuffle),
+            itertools.repeat(seed), range(n_jobs), itertools.repeat(n_jobs),
+            itertools.repeat(block_size)))
+    return np.vstack(shards), n_examples
+
+
+def n_bwssets(n_examples: int, n_items: int, method: str = 'overlap') -> int:
+    """The number of BWS sets that `sample` generates for `n_examples`"""
+    n_sets = n_examples // (n_items - 1)
+    if method == 'overlap':
+        return n_sets
+    elif method == 'twice':
+        return n_sets + _n_connectors(n_sets, n_items)
+    else:
+        raise Exception(f"method='{method}' not available.")
+
+
+def get_set(k: int, seed: Union[int, np.random.SeedSequence],
+            n_examples: int, n_items: int,
+            method: str = 'overlap',
+            shuffle: bool = True) -> np.ndarray:
+    """Compute the k-th BWS set of a design without generating the others
+
+    Parameters:
+    -----------
+    k : int
+        The number of the BWS set, i.e. `0 <= k < n_bwssets(...)`
+
+    seed : Union[int, np.random.SeedSequence]
+        The seed to shuffle the BWS sets. The BWS set is shuffled like the
+          k-th BWS set of `sample(..., seed=seed)`, i.e. with the random
+          numbers keyed by `(seed, k)` (see `indices_shard`).
+
+    n_examples : int
+        The number of examples, i.e. `len(examples)`
+
+    n_items : int
+        Number items per BWS set
+
+    method : str='overlap'
+        'overlap' or 'twice'
+
+    shuffle : bool=True
+        Flag to permute/shuffle indices
+
+    Return:
+    -------
+    indices: np.ndarray[int64] with the shape (n_items,)
+        The positions of the examples of the k-th BWS set. Same indices as
+          the k-th BWS set of
+          `sample(..., seed=seed, return_indices=True)`.
+
+    Examples:
+    ---------
+        import bwsample as bws
+        examples = [chr(x) for x in range(ord('a'), ord('z')+1)]
+        n_total = bws.sampling.n_bwssets(len(examples), 4, 'twice')
+        indices = bws.sampling.get_set(
+            3, seed=42, n_examples=len(examples), n_items=4, method='twice')
+        bwsset = [examples[i] for i in indices]
+
+    Notes:
+    ------
+    The costs are `O(n_items)` because the random numbers of the k-th BWS
+      set are computed from `(seed, k)` without drawing the others.
+    """
+    if n_items < 2:
+        raise Exception(f"No overlap possible with n_items={n_items}.")
+    n_sets = n_examples // (n_items - 1)
+    n_total = n_bwssets(n_examples, n_items, method)
+    if not 0 <= k < n_total:
+        raise IndexError(f"BWS set k={k} not in range(0, {n_total})")
+
+    # 'twice' does not shuffle small designs (see `indices_twice_array`)
+    if method == 'twice' and (n_items <= 2 or n_sets <= 1):
+        shuffle = False
+
+    # compute the indices of the k-th BWS set
+    if n_sets == 1:
+        indices = np.arange(n_items, dtype=np.int64)
+        if shuffle:
+            indices = np.random.default_rng(seed).permutation(n_items)
+        return indices % n_examples
+    elif k >= n_sets:
+        return _connector_rows([k - n_sets], n_sets, n_items)[0] % n_examples
+    indices = _overlap_rows([k], n_sets, n_items, shuffle=shuffle, seed=seed)
+    return indices[0] % n_examples
@@ -0,0 +1,293 @@
+import csv
+import json
+import itertools
+import os
+import collections.abc
+import numpy as np
+from .vocab import Vocabulary
+from typing import List, Tuple, Iterable, Iterator, Optional
+ItemState = int
+ItemID = str
+
+
+def read_jsonl(path: str) -> Iterator[Tuple[List[ItemState], List[ItemID]]]:
+    """Read evaluated BWS sets from a JSONL file line by line
+
+    Each line is either a JSON object `{"states": [...], "ids": [...]}`
+      or a JSON array `[[...states], [...ids]]`.
+
+    Example:
+    --------
+        import bwsample as bws
+        for states, ids in bws.storage.read_jsonl("evaluations.jsonl"):
+            pass
+    """
+    with open(path, "r") as fp:
+        for line in fp:
+            line = line.strip()
+            if not line:
+                continue
+            yield _parse_row(json.loads(line))
+
+
+def read_json(path: str) -> Iterator[Tuple[List[ItemState], List[ItemID]]]:
+    """Read evaluated BWS sets from a JSON file with one JSON array
+
+    Each element is either a JSON object `{"states": [...], "ids": [...]}`
+      or a JSON array `[[...states], [...ids]]`. The whole file is loaded
+      into memory (see `read_jsonl` for large files).
+
+    Example:
+    --------
+        import bwsample as bws
+        for states, ids in bws.storage.read_json("evaluations.json"):
+            pass
+    """
+    with open(path, "r") as fp:
+        rows = json.load(fp)
+    for row in rows:
+        yield _parse_row(row)
+
+
+def _parse_row(row) -> Tuple[List[ItemState], List[ItemID]]:
+    if isinstance(row, dict):
+        return row["states"], row["ids"]
+    return row[0], row[1]
+
+
+def read_csv(path: str,
+             set_col: Optional[str] = "set",
+             id_col: Optional[str] = "id",
+             state_col: Optional[str] = "state",
+             **kwargs) -> Iterator[Tuple[List[ItemState], List[ItemID]]]:
+    """Read evaluated BWS sets from a CSV file with one row per item
+
+    The CSV file requires a header, and the rows of a BWS set must be
+      consecutive, e.g.
+
+        set,id,state
+        1,id1,0
+        1,id2,1
+        1,id3,2
+        2,id1,2
+        ...
+
+    Parameters:
+    -----------
+    path : str
+        The CSV file
+
+    set_col, id_col, state_col : Optional[str]
+        The column names of the BWS set identifier, the item ID, and the
+          item state.
+
+    **kwargs
+        Further arguments for `csv.DictReader`, e.g. `delimiter`
+    """
+    with open(path, "r", newline="") as fp:
+        rows = csv.DictReader(fp, **kwargs)
+        for _, items in itertools.groupby(rows, key=lambda r: r[set_col]):
+            states, ids = [], []
+            for row in items:
+                states.append(int(row[state_col]))
+                ids.append(row[id_col])
+            yield states, ids
+
+
+def read_evaluations(path: str, fmt: Optional[str] = None, **kwargs
+                     ) -> Iterator[Tuple[List[ItemState], List[ItemID]]]:
+    """Read evaluated BWS sets lazily from a file
+
+    Parameters:
+    -----------
+    path : str
+        The file path
+
+    fmt : Optional[str]
+        'jsonl', 'json' or 'csv'. Derived from the file extension if None.
+    """
+    if fmt is None:
+        fmt = path.rsplit(".", 1)[-1].lower()
+    if fmt in ('jsonl', 'ndjson'):
+        return read_jsonl(path)
+    elif fmt == 'json':
+        return read_json(path)
+    elif fmt == 'csv':
+        return read_csv(path, **kwargs)
+    else:
+        raise Exception(f"fmt='{fmt}' not available.")
+
+
+def chunked(evaluations: Iterable, chunk_size: int) -> Iterator[list]:
+    """Split an iterable of BWS sets into lists of `chunk_size` BWS sets"""
+    evaluations = iter(evaluations)
+    while True:
+        chunk = list(itertools.islice(evaluations, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_columnar(path: str,
+                   evaluations: Iterable[Tuple[List[ItemState], List[ItemID]]],
+                   vocab: Optional[Vocabulary] = None,
+                   chunk_size: Optional[int] = 10000) -> Vocabulary:
+    """Store evaluated BWS sets in a binary columnar format
+
+    The folder `path` contains the files
+      - `states.bin`: int8 item states of all BWS sets concatenated
+      - `ids.bin`: int32 interned item IDs of all BWS sets concatenated
+      - `offsets.bin`: int64 start position of each BWS set, and the end
+      - `vocab.json`: the item IDs of the interned item IDs
+      - `meta.json`: the number of BWS sets, items, and the set size
+
+    Parameters:
+    -----------
+    path : str
+        The folder to store the files
+
+    evaluations : Iterable[Tuple[List[ItemState], List[ItemID]]]
+        The BWS sets, e.g. a generator. A ValueError is raised if the
+          states and IDs of a BWS set have different lengths.
+
+    vocab : Optional[Vocabulary]
+        An existing vocabulary to intern the item IDs.
+
+    chunk_size : Optional[int] = 10000
+        The number of BWS sets that are converted at once.
+
+    Returns:
+    --------
+    vocab : Vocabulary
+        The vocabulary of the stored item IDs
+
+    Example:
+    --------
+        import bwsample as bws
+        evaluations = (
+            ([0, 0, 2, 1], ['id1', 'id2', 'id3', 'id4']),
+            ([0, 1, 0, 2], ['id4', 'id5', 'id6', 'id1']) )
+        bws.storage.write_columnar("data/evals", evaluations)
+        evaluations = bws.storage.ColumnarEvaluations("data/evals")
+    """
+    if vocab is None:
+        vocab = Vocabulary()
+    os.makedirs(path, exist_ok=True)
+    n_sets, n_values, sizes = 0, 0, set()
+    with open(os.path.join(path, "states.bin"), "wb") as fs, \
+            open(os.path.join(path, "ids.bin"), "wb") as fi, \
+            open(os.path.join(path, "offsets.bin"), "wb") as fo:
+        for chunk in chunked(evaluations, chunk_size):
+            lengths = [len(states) for states, _ in chunk]
+            for k, ((_, ids), n) in enumerate(zip(chunk, lengths)):
+                if len(ids) != n:
+                    raise ValueError((
+                        "IDs and states lists must have the same length "
+                        f"(BWS set {n_sets + k})"))
+            offsets = n_values + np.cumsum([0] + lengths[:-1])
+            fo.write(np.asarray(offsets, dtype=np.int64).tobytes())
+            fs.write(np.concatenate(
+                [np.asarray(states, dtype=np.int8) for states, _ in chunk]
+            ).tobytes())
+            fi.write(np.concatenate(
+                [vocab.encode(ids) for _, ids in chunk]).tobytes())
+            n_sets += len(chunk)
+            n_values += sum(lengths)
+            sizes.update(lengths)
+        fo.write(np.array([n_values], dtype=np.int64).tobytes())
+    vocab.save(os.path.join(path, "vocab.json"))
+    with open(os.path.join(path, "meta.json"), "w") as fp:
+        json.dump({"n_sets": n_sets, "n_values": n_values,
+                   "n_items": sizes.pop() if len(sizes) == 1 else None}, fp)
+    return vocab
+
+
+def _memmap(path: str, dtype, n: int) -> np.ndarray:
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n,))
+
+
+class ColumnarEvaluations(collections.abc.Sequence):
+    """Memory-mapped BWS sets stored by `write_columnar`
+
+    The object behaves like a read-only list of
+      `(List[ItemState], List[ItemID])` tuples, and can be passed to
+      `bws.count`, `bws.scoring_orme`, `bws.CountingState.update`, or as
+      `logical_database`. Only the accessed BWS sets are read from disk.
+
+    Parameters:
+    -----------
+    path : str
+        The folder with the files (see `write_columnar`)
+
+    Attributes:
+    -----------
+    states : np.memmap[int8]
+        The item states of all BWS sets concatenated
+
+    ids : np.memmap[int32]
+        The interned item IDs of all BWS sets concatenated
+
+    offsets : np.memmap[int64]
+        The start position of each BWS set, and the end position
+
+    vocab : Vocabulary
+        To decode the interned item IDs
+
+    n_items : Optional[int]
+        The number of items of each BWS set (None if sizes differ)
+
+    Example:
+    --------
+        import bwsample as bws
+        evaluations = bws.storage.ColumnarEvaluations("data/evals")
+        state = bws.count_stream(evaluations)
+        # vectorized counting without copying (same size BWS sets)
+        cnt, detail = bws.counting.direct_extract_matrix(
+            evaluations.state_matrix(), evaluations.id_matrix(),
+            n_dim=len(evaluations.vocab))
+    """
+    def __init__(self, path: str):
+        with open(os.path.join(path, "meta.json"), "r") as fp:
+            meta = json.load(fp)
+        self.n_items = meta["n_items"]
+        self.states = _memmap(
+            os.path.join(path, "states.bin"), np.int8, meta["n_values"])
+        self.ids = _memmap(
+            os.path.join(path, "ids.bin"), np.int32, meta["n_values"])
+        self.offsets = _memmap(
+            os.path.join(path, "offsets.bin"), np.int64, meta["n_sets"] + 1)
+        self.vocab = Vocabulary.load(os.path.join(path, "vocab.json"))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("BWS set index out of range")
+        a, b = self.offsets[k], self.offsets[k + 1]
+        return (self.states[a:b].tolist(),
+                self.vocab.decode(self.ids[a:b].tolist()))
+
+    def __iter__(self):
+        ids = self.vocab.ids
+        for a, b in zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()):
+            yield (self.states[a:b].tolist(),
+                   [ids[i] for i in self.ids[a:b].tolist()])
+
+    def state_matrix(self) -> np.ndarray:
+        """The (n_sets, n_items) int8 view of the item states"""
+        if self.n_items is None:
+            raise Exception("BWS sets have different sizes")
+        return self.states.reshape(-1, self.n_items)
+
+    def id_matrix(self) -> np.ndarray:
+        """The (n_sets, n_items) int32 view of the interned item IDs"""
+        if self.n_items is None:
+            raise Exception("BWS sets have different sizes")
+        return self.ids.reshape(-1, self.n_items)
@@ -5,11 +5,13 @@ import sklearn.linear_model  # adjustscore
 import sklearn.preprocessing  # adjustscore
 import scipy.special  # adjustscore
 from typing import Dict, Tuple, List, Optional
+from .vocab import Vocabulary  # to_scipy
 ItemID = str  # add_dok
 
 
-def to_scipy(dok: Dict[Tuple[str, str], int], dtype=np.float64) -> (
-        scipy.sparse.dok.dok_matrix, List[str]):
+def to_scipy(dok: Dict[Tuple[str, str], int], dtype=np.float64,
+             vocab: Optional[Vocabulary] = None) -> (
+        scipy.sparse.csr_matrix, List[str]):
     """Convert dictionary with pairwise comparison frequencies
         in a scipy sparse matrix
 
@@ -21,9 +23,15 @@ def to_scipy(dok: Dict[Tuple[str, str], int], dtype=np.float64) -> (
     dtype (Default: np.float64)
         Data type of the sparse matrix
 
+    vocab : Optional[Vocabulary]
+        An existing vocabulary that maps the identifiers to row/column
+          indices. Unknown identifiers are appended, i.e. the indices stay
+          stable across successive calls. If None, the identifiers are
+          sorted.
+
     Returns:
     --------
-    cnt : scipy.sparse.dok.dok_matrix
+    cnt : scipy.sparse.csr_matrix
         Quadratic sparse matrix with frequency data
 
     indices : List[str]
@@ -34,13 +42,20 @@ def to_scipy(dok: Dict[Tuple[str, str], int], dtype=np.float64) -> (
         import bwsample as bws
         dok = {('A', 'D'): 3, ('A', 'B'): 2}
         cnt, indices = bws.to_scipy(dok)
+        # reuse the row/column indices
+        vocab = bws.Vocabulary(indices)
+        dok = {('B', 'C'): 1, ('A', 'D'): 4}
+        cnt, indices = bws.to_scipy(dok, vocab=vocab)
     """
-    idx = sorted(list(set(itertools.chain(*dok.keys()))))
-    n_dim = len(idx)
-    cnt = scipy.sparse.dok_matrix((n_dim, n_dim), dtype=dtype)
-    for (i, j), v in dok.items():
-        cnt[idx.index(i), idx.index(j)] = v
-    return cnt, idx
+    if vocab is None:
+        vocab = Vocabulary(sorted(set(itertools.chain(*dok.keys()))))
+    rows = vocab.encode([i for i, _ in dok.keys()])
+    cols = vocab.encode([j for _, j in dok.keys()])
+    vals = np.fromiter(dok.values(), dtype=dtype, count=len(dok))
+    n_dim = len(vocab)
+    cnt = scipy.sparse.csr_matrix(
+        (vals, (rows, cols)), shape=(n_dim, n_dim), dtype=dtype)
+    return cnt, list(vocab.ids)
 
 
 def add_dok(a: Dict[Tuple[ItemID, ItemID], int],
@@ -84,6 +99,36 @@ def add_dok(a: Dict[Tuple[ItemID, ItemID], int],
     return out
 
 
+def add_dok_inplace(a: Dict[Tuple[ItemID, ItemID], int],
+                    b: Dict[Tuple[ItemID, ItemID], int]
+                    ) -> Dict[Tuple[ItemID, ItemID], int]:
+    """Add the counts of the DOK `b` to the DOK `a` without copying `a`
+
+    Parameters:
+    -----------
+    a : Dict[Tuple[ItemID, ItemID], int]
+        The Dictionary of Keys (DOK) object that is updated in-place.
+
+    b : Dict[Tuple[ItemID, ItemID], int]
+        The Dictionary of Keys (DOK) object which values are added to `a`.
+
+    Returns:
+    --------
+    a : Dict[Tuple[ItemID, ItemID], int]
+        The updated DOK object `a`
+
+    Example:
+    --------
+        import bwsample as bws
+        a = {("id1", "id2"): 7}
+        b = {("id1", "id2"): 1, ("id2", "id3"): 2}
+        bws.utils.add_dok_inplace(a, b)
+    """
+    for key, val in b.items():
+        a[key] = val + a.get(key, 0)
+    return a
+
+
 def minmax(arr: np.array) -> np.array:
     data = np.array(arr)
     xmin = data.min()
@@ -0,0 +1,271 @@
+import numpy as np
+import scipy.sparse
+import json
+from typing import Dict, Tuple, List, Optional, Iterable
+ItemID = str
+
+
+class Vocabulary(object):
+    """Intern item IDs as consecutive int32 indices
+
+    Parameters:
+    -----------
+    ids : Optional[Iterable[ItemID]]
+        Item IDs to intern in the given order.
+
+    Attributes:
+    -----------
+    ids : List[ItemID]
+        The item ID of each index, i.e. `ids[idx]`
+
+    lookup : Dict[ItemID, int]
+        The index of each item ID, i.e. `lookup[uid]`
+
+    Example:
+    --------
+        import bwsample as bws
+        vocab = bws.vocab.Vocabulary()
+        idx = vocab.encode(['A', 'B', 'C', 'A'])  # array([0, 1, 2, 0])
+        ids = vocab.decode(idx)  # ['A', 'B', 'C', 'A']
+    """
+    def __init__(self, ids: Optional[Iterable[ItemID]] = None):
+        self.ids = []
+        self.lookup = {}
+        if ids is not None:
+            for uid in ids:
+                self.add(uid)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, uid: ItemID) -> bool:
+        return uid in self.lookup
+
+    def add(self, uid: ItemID) -> int:
+        """Intern one item ID, and return its index"""
+        idx = self.lookup.get(uid)
+        if idx is None:
+            idx = len(self.ids)
+            self.lookup[uid] = idx
+            self.ids.append(uid)
+        return idx
+
+    def encode(self, ids: Iterable[ItemID],
+               add: Optional[bool] = True) -> np.ndarray:
+        """Convert item IDs into an int32 array of indices
+
+        Parameters:
+        -----------
+        ids : Iterable[ItemID]
+            The item IDs
+
+        add : Optional[bool] = True
+            Intern unknown item IDs. If False, unknown item IDs
+              raise a KeyError.
+        """
+        if add:
+            return np.array([self.add(uid) for uid in ids], dtype=np.int32)
+        return np.array([self.lookup[uid] for uid in ids], dtype=np.int32)
+
+    def decode(self, idx: Iterable[int]) -> List[ItemID]:
+        """Convert indices back into item IDs"""
+        return [self.ids[i] for i in idx]
+
+    def save(self, path: str):
+        """Store the item IDs as JSON array"""
+        with open(path, "w") as fp:
+            json.dump(self.ids, fp)
+
+    @classmethod
+    def load(cls, path: str) -> 'Vocabulary':
+        """Load the item IDs from a JSON array"""
+        with open(path, "r") as fp:
+            return cls(json.load(fp))
+
+
+class PairCounter(object):
+    """Array-backed counts of `i>j` pairs of interned item IDs
+
+    The pairs are stored as sorted, unique uint64 keys `i * 2^32 + j` with
+      uint64 counts (COO format). New pairs are appended to a buffer. When
+      the buffer is full or the counts are read, the buffer is sorted, and
+      merged into the sorted keys with `np.searchsorted`, i.e. the costs
+      of a merge are linear in the number of stored pairs.
+
+    Parameters:
+    -----------
+    buffer_size : Optional[int] = 1048576
+        Number of buffered pairs before merging
+
+    Example:
+    --------
+        import bwsample as bws
+        vocab = bws.vocab.Vocabulary()
+        pairs = bws.vocab.PairCounter.from_dok(
+            {('A', 'B'): 2, ('B', 'C'): 1}, vocab)
+        pairs.add(vocab.encode(['A']), vocab.encode(['B']))
+        pairs.get(*vocab.encode(['A', 'B']))  # 3
+        dok = pairs.to_dok(vocab)  # {('A', 'B'): 3, ('B', 'C'): 1}
+    """
+    def __init__(self, buffer_size: Optional[int] = 1048576):
+        self.buffer_size = buffer_size
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._counts = np.empty(0, dtype=np.uint64)
+        self._buf_keys = []
+        self._buf_counts = []
+        self._n_buf = 0
+
+    @staticmethod
+    def encode_keys(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Combine row and column indices into uint64 keys"""
+        rows = np.asarray(rows, dtype=np.uint64)
+        cols = np.asarray(cols, dtype=np.uint64)
+        return (rows << np.uint64(32)) | cols
+
+    @staticmethod
+    def decode_keys(keys: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Split uint64 keys into int32 row and column indices"""
+        rows = (keys >> np.uint64(32)).astype(np.int32)
+        cols = (keys & np.uint64(0xFFFFFFFF)).astype(np.int32)
+        return rows, cols
+
+    def add(self, rows: np.ndarray, cols: np.ndarray,
+            counts: Optional[np.ndarray] = None) -> 'PairCounter':
+        """Add `rows[k]>cols[k]` pairs
+
+        Parameters:
+        -----------
+        rows, cols : np.ndarray
+            Interned item IDs of each pair
+
+        counts : Optional[np.ndarray]
+            The count of each pair (Default: 1 per pair)
+        """
+        keys = self.encode_keys(rows, cols).reshape(-1)
+        if counts is None:
+            counts = np.ones(len(keys), dtype=np.uint64)
+        else:
+            counts = np.asarray(counts, dtype=np.uint64).reshape(-1)
+        self._buf_keys.append(keys)
+        self._buf_counts.append(counts)
+        self._n_buf += len(keys)
+        if self._n_buf >= self.buffer_size:
+            self.compact()
+        return self
+
+    def update(self, other: 'PairCounter') -> 'PairCounter':
+        """Add the counts of another `PairCounter` object"""
+        other.compact()
+        self._buf_keys.append(other._keys)
+        self._buf_counts.append(other._counts)
+        self._n_buf += len(other._keys)
+        if self._n_buf >= self.buffer_size:
+            self.compact()
+        return self
+
+    def compact(self) -> 'PairCounter':
+        """Merge the buffered pairs into the sorted key/count arrays"""
+        if self._n_buf == 0:
+            return self
+        # sort the buffer, and sum up the counts of duplicate keys
+        keys = np.concatenate(self._buf_keys)
+        counts = np.concatenate(self._buf_counts)
+        order = np.argsort(keys, kind="stable")
+        keys, counts = keys[order], counts[order]
+        first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        keys, counts = keys[first], np.add.reduceat(counts, first)
+        # add the counts of known keys, and insert the new keys
+        pos = np.searchsorted(self._keys, keys)
+        known = pos < len(self._keys)
+        known[known] = self._keys[pos[known]] == keys[known]
+        merged = self._counts.copy()
+        merged[pos[known]] += counts[known]
+        self._keys = np.insert(self._keys, pos[~known], keys[~known])
+        self._counts = np.insert(merged, pos[~known], counts[~known])
+        self._buf_keys, self._buf_counts, self._n_buf = [], [], 0
+        return self
+
+    def __len__(self) -> int:
+        self.compact()
+        return len(self._keys)
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self.compact()._keys
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self.compact()._counts
+
+    def coo(self) -> (np.ndarray, np.ndarray, np.ndarray):
+        """Return the row indices, column indices and counts"""
+        rows, cols = self.decode_keys(self.keys)
+        return rows, cols, self.counts
+
+    def get(self, i: int, j: int) -> int:
+        """Lookup the count of the `i>j` pair"""
+        key = self.encode_keys(i, j)
+        keys = self.keys
+        pos = np.searchsorted(keys, key)
+        if pos < len(keys) and keys[pos] == key:
+            return int(self._counts[pos])
+        return 0
+
+    def to_scipy(self, n_dim: Optional[int] = None,
+                 dtype=np.float64) -> scipy.sparse.csr_matrix:
+        """Convert to a quadratic scipy sparse matrix
+
+        Parameters:
+        -----------
+        n_dim : Optional[int]
+            The number of rows/columns, e.g. `len(vocab)`
+
+        dtype (Default: np.float64)
+            Data type of the sparse matrix
+        """
+        rows, cols, counts = self.coo()
+        if n_dim is None:
+            n_dim = int(max(rows.max(initial=-1), cols.max(initial=-1))) + 1
+        return scipy.sparse.csr_matrix(
+            (counts.astype(dtype), (rows, cols)), shape=(n_dim, n_dim))
+
+    def to_dok(self, vocab: Vocabulary) -> Dict[Tuple[ItemID, ItemID], int]:
+        """Convert to the Dictionary of Keys (DOK) format"""
+        rows, cols, counts = self.coo()
+        ids = vocab.ids
+        return {(ids[i], ids[j]): int(c)
+                for i, j, c in zip(rows.tolist(), cols.tolist(),
+                                   counts.tolist())}
+
+    @classmethod
+    def from_dok(cls, dok: Dict[Tuple[ItemID, ItemID], int],
+                 vocab: Vocabulary, **kwargs) -> 'PairCounter':
+        """Create from the Dictionary of Keys (DOK) format
+
+        Parameters:
+        -----------
+        dok : Dict[Tuple[ItemID, ItemID], int]
+            Count/Frequency data as Dictionary of Keys (DoK)
+
+        vocab : Vocabulary
+            The vocabulary that interns the item IDs. Unknown item IDs
+              are added to the vocabulary.
+        """
+        out = cls(**kwargs)
+        if len(dok) == 0:
+            return out
+        rows = vocab.encode([i for i, _ in dok.keys()])
+        cols = vocab.encode([j for _, j in dok.keys()])
+        counts = np.fromiter(dok.values(), dtype=np.uint64, count=len(dok))
+        return out.add(rows, cols, counts).compact()
+
+
+def detail_to_pairs(detail: dict, vocab: Vocabulary) -> dict:
+    """Convert each DOK of a `detail` dictionary into a `PairCounter`"""
+    return {key: PairCounter.from_dok(dok, vocab)
+            for key, dok in detail.items()}
+
+
+def pairs_to_detail(detail: dict, vocab: Vocabulary) -> dict:
+    """Convert each `PairCounter` of a `detail` dictionary into a DOK"""
+    return {key: pairs.to_dok(vocab) for key, pairs in detail.items()}
@@ -0,0 +1,62 @@
+import bwsample as bws
+
+
+def test1():
+    ids = [f"id{i}" for i in range(20)]
+    sampler = bws.adaptive.AdaptiveSampler(ids, n_items=4, seed=42)
+    samples = sampler.sample(n_sets=5)
+    assert len(samples) == 5
+    for bwsset in samples:
+        assert len(set(bwsset)) == 4
+    # the first BWS sets cover different items
+    assert len(set(sum(samples, []))) == 20
+
+
+def test2():
+    ids = [f"id{i}" for i in range(8)]
+    sampler = bws.adaptive.AdaptiveSampler(ids, n_items=3, window=1)
+    sampler.update_scores(ids, [0.0, 0.1, 0.2, 0.3, 0.6, 0.7, 0.8, 0.9])
+    sampler.update_counts({("id0", "id1"): 3, ("id2", "id3"): 3,
+                           ("id4", "id5"): 3, ("id6", "id7"): 2,
+                           ("id1", "id5"): 1})
+    # id7 has the fewest comparisons, and id5/id6 the closest scores
+    assert sorted(sampler.sample()[0]) == ["id5", "id6", "id7"]
+
+
+def test3():
+    evaluations = (
+        ([1, 0, 0, 2], ['A', 'B', 'C', 'D']),
+        ([1, 0, 0, 2], ['A', 'B', 'C', 'D']),
+        ([2, 0, 0, 1], ['A', 'B', 'C', 'D']),
+        ([0, 1, 2, 0], ['A', 'B', 'C', 'D']),
+        ([0, 1, 0, 2], ['A', 'B', 'C', 'D']),
+    )
+    state = bws.CountingState().update(evaluations)
+    sampler = bws.adaptive.AdaptiveSampler(['E', 'F'], n_items=3)
+    sampler.update_counts(state)
+    sampler.update_rank(bws.rank(state.agg_dok, method='ratio'))
+    assert len(sampler) == 6
+    bwsset = sampler.sample()[0]
+    assert 'E' in bwsset or 'F' in bwsset
+
+
+def test4():
+    counts = bws.adaptive.comparison_counts({("A", "B"): 2, ("B", "C"): 1})
+    assert counts == {"A": 2, "B": 3, "C": 1}
+
+
+def test5():
+    evaluations = (
+        ([1, 0, 0, 2], ['A', 'B', 'C', 'D']),
+        ([2, 0, 0, 1], ['A', 'B', 'C', 'D']),
+        ([0, 1, 2], ['D', 'E', 'F']),
+    )
+    target = bws.adaptive.comparison_counts(
+        bws.CountingState().update(evaluations))
+    state = bws.CountingState(backend='pairs').update(evaluations)
+    assert bws.adaptive.comparison_counts(state) == target
+    assert bws.adaptive.comparison_counts(
+        state.agg_dok, state.vocab) == target
+    sampler = bws.adaptive.AdaptiveSampler(['G'], n_items=3)
+    sampler.update_counts(state)
+    assert len(sampler) == 7
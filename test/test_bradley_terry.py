@@ -0,0 +1,90 @@
+import bwsample as bws
+import numpy as np
+import scipy.sparse
+import pytest
+
+
+def random_cnt(n=50, seed=42):
+    rng = np.random.default_rng(seed)
+    A = rng.integers(0, 5, (n, n)) * (rng.random((n, n)) < 0.3)
+    np.fill_diagonal(A, 0)
+    return A, scipy.sparse.csr_matrix(A.astype(float))
+
+
+def test1():
+    _, cnt = random_cnt()
+    x, flag = bws.ranking.mle_btl_sparse(cnt)
+    y, flag2, n_iter, residual = bws.ranking.mle_btl_mm(cnt)
+    assert np.allclose(x, y)
+    assert flag == flag2
+    assert residual < 1e-5 and n_iter <= 50
+    assert np.isclose(y.sum(), 1.0)
+
+
+def test2():
+    A, cnt = random_cnt()
+    x, flag, n_iter, _ = bws.ranking.mle_btl_lsr(cnt, tol=1e-10)
+    assert flag
+    assert np.isclose(x.sum(), 1.0)
+    # the MLE's score equations: W_i = SUM_j N_ij * x_i / (x_i + x_j)
+    W, N = A.sum(axis=1), A + A.T
+    expected = (N * x[:, None] / (x[:, None] + x[None, :])).sum(axis=1)
+    assert np.allclose(W, expected, atol=1e-5)
+    # warm start
+    _, _, n_iter2, _ = bws.ranking.mle_btl_lsr(cnt, x0=x, tol=1e-10)
+    assert n_iter2 < n_iter
+
+
+def test3():
+    _, cnt = random_cnt(n=6)
+    indices = list("ABCDEF")
+    for solver in ('mm', 'ilsr', 'lsr'):
+        _, _, metrics, info = bws.ranking.bradley_terry_probability(
+            cnt, indices, solver=solver, max_iter=500)
+        assert len(metrics) == 6
+        assert info["converged"]
+        assert info["n_iter"] >= 1
+    # warm start with a new item
+    _, cnt2 = random_cnt(n=7)
+    _, _, _, info2 = bws.ranking.bradley_terry_probability(
+        cnt2, indices + ['G'], solver='ilsr', x0=info["weights"])
+    assert len(info2["weights"]) == 7
+    with pytest.raises(Exception):
+        bws.ranking.bradley_terry_probability(cnt, indices, solver='xyz')
+
+
+def test4():
+    _, cnt = random_cnt()
+    # the flag reports the residual
+    for iterative in (True, False):
+        _, flag, n_iter, residual = bws.ranking.mle_btl_lsr(
+            cnt, max_iter=2, tol=1e-12, iterative=iterative)
+        assert not flag and residual >= 1e-12 and n_iter == 2
+    # LSR uses `x0` for the rates, i.e. the MLE is a fixed point
+    x, _, _, _ = bws.ranking.mle_btl_lsr(cnt, tol=1e-12, max_iter=500)
+    y, flag, _, _ = bws.ranking.mle_btl_lsr(
+        cnt, x0=x, tol=1e-10, max_iter=500, iterative=False)
+    assert flag
+    assert np.allclose(x, y, atol=1e-8)
+
+
+def test5():
+    A, cnt = random_cnt()
+    x, flag, _, _ = bws.ranking.mle_btl_mm(cnt, tol=1e-10, max_iter=500)
+    assert flag
+    # MM and I-LSR converge to the same MLE
+    y, _, _, _ = bws.ranking.mle_btl_lsr(cnt, tol=1e-10)
+    assert np.allclose(x, y, atol=1e-8)
+    # the MLE's score equations
+    W, N = A.sum(axis=1), A + A.T
+    expected = (N * x[:, None] / (x[:, None] + x[None, :])).sum(axis=1)
+    assert np.allclose(W, expected, atol=1e-5)
+    # LSR with the MLE as rates
+    z, _, _, _ = bws.ranking.mle_btl_lsr(
+        cnt, x0=x, tol=1e-12, max_iter=500, iterative=False)
+    assert np.allclose(x, z, atol=1e-8)
+    # the same ranking with all solvers
+    for solver in ('mm', 'ilsr'):
+        positions, _, _, _ = bws.ranking.bradley_terry_probability(
+            cnt, list(range(50)), solver=solver, tol=1e-10, max_iter=500)
+        assert (positions == np.argsort(-x)).all()
@@ -0,0 +1,64 @@
+import bwsample as bws
+import numpy as np
+import pytest
+
+
+EVALUATIONS = [
+    ([1, 0, 2], ['D', 'E', 'F']),
+    ([1, 0, 2], ['X', 'E', 'Z']),
+    ([2, 0, 1], ['E', 'Y', 'Z']),
+    ([0, 1, 2], ['D', 'Y', 'F']),
+]
+
+
+def test1(tmp_path):
+    path = str(tmp_path / "evals")
+    vocab = bws.storage.write_columnar(path, EVALUATIONS, chunk_size=3)
+    evaluations = bws.storage.ColumnarEvaluations(path)
+    assert len(evaluations) == 4
+    assert list(evaluations) == EVALUATIONS
+    assert evaluations[1] == EVALUATIONS[1]
+    assert evaluations[-1] == EVALUATIONS[-1]
+    assert evaluations.vocab.ids == vocab.ids
+    assert isinstance(evaluations.states, np.memmap)
+    assert evaluations.state_matrix().shape == (4, 3)
+    assert evaluations.id_matrix().dtype == np.int32
+
+
+def test2(tmp_path):
+    path = str(tmp_path / "evals")
+    bws.storage.write_columnar(path, EVALUATIONS)
+    evaluations = bws.storage.ColumnarEvaluations(path)
+    assert bws.count(evaluations) == bws.count(EVALUATIONS)
+    dok, _ = bws.counting.logical_infer_update(
+        EVALUATIONS[:1], database=evaluations)
+    target, _ = bws.counting.logical_infer_update(
+        EVALUATIONS[:1], database=EVALUATIONS)
+    assert dok == target
+
+
+def test3(tmp_path):
+    path = str(tmp_path / "evals")
+    bws.storage.write_columnar(path, EVALUATIONS)
+    evaluations = bws.storage.ColumnarEvaluations(path)
+    indices, scores = bws.scoring_orme(evaluations)
+    target_indices, target_scores = bws.scoring_orme(EVALUATIONS)
+    assert dict(zip(indices, scores)) == dict(
+        zip(target_indices, target_scores))
+
+
+def test4(tmp_path):
+    # BWS sets of different sizes
+    path = str(tmp_path / "evals")
+    evaluations = [([1, 2], ['A', 'B']), ([0, 1, 2], ['A', 'C', 'D'])]
+    bws.storage.write_columnar(path, evaluations)
+    stored = bws.storage.ColumnarEvaluations(path)
+    assert stored.n_items is None
+    assert list(stored) == evaluations
+
+
+def test5(tmp_path):
+    path = str(tmp_path / "evals")
+    evaluations = EVALUATIONS + [([1, 0, 2], ['A', 'B'])]
+    with pytest.raises(ValueError):
+        bws.storage.write_columnar(path, evaluations, chunk_size=3)
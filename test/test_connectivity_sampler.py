@@ -0,0 +1,43 @@
+import bwsample as bws
+
+
+def test1():
+    uf = bws.adaptive.UnionFind(5)
+    uf.union(0, 1)
+    uf.union(3, 4)
+    uf.union(1, 0)
+    assert uf.n_components == 3
+    assert uf.find(0) == uf.find(1)
+    assert uf.find(0) != uf.find(3)
+    uf.grow(6)
+    assert uf.n_components == 4
+
+
+def test2():
+    ids = [f"id{i}" for i in range(30)]
+    sampler = bws.adaptive.ConnectivitySampler(ids, n_items=4, seed=42)
+    assert sampler.n_components == 30
+    bridges = sampler.bridge()
+    # ceil(29 / 3) BWS sets
+    assert len(bridges) == 10
+    assert all(len(set(bwsset)) == 4 for bwsset in bridges)
+    assert sampler.n_components == 1
+    assert sampler.bridge() == []
+
+
+def test3():
+    evaluations = (
+        ([1, 0, 0, 2], ['A', 'B', 'C', 'D']),
+        ([0, 1, 2, 0], ['E', 'F', 'G', 'H']),
+        ([0, 1, 2], ['I', 'J', 'K']),
+    )
+    sampler = bws.adaptive.ConnectivitySampler(['L'], n_items=4)
+    sampler.update(evaluations)
+    assert sampler.n_components == 4
+    bridges = sampler.bridge()
+    assert len(bridges) == 1
+    # the bridging BWS sets connect the comparison graph
+    sampler2 = bws.adaptive.ConnectivitySampler([], n_items=4)
+    sampler2.update(evaluations)
+    sampler2.update([([0] * 4, bwsset) for bwsset in bridges])
+    assert sampler2.n_components == 1
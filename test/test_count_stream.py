@@ -0,0 +1,57 @@
+import bwsample as bws
+import json
+
+
+EVALUATIONS = [
+    ([1, 0, 2], ['D', 'E', 'F']),
+    ([1, 0, 2], ['X', 'E', 'Z']),
+    ([1, 0, 2], ['E', 'Y', 'Z']),
+    ([0, 1, 2], ['D', 'Y', 'F']),
+    ([2, 0, 1], ['A', 'B', 'C']),
+]
+
+
+def test1():
+    state = bws.count_stream(iter(EVALUATIONS), chunk_size=2)
+    target = bws.CountingState().update(EVALUATIONS)
+    assert state.counts() == target.counts()
+
+
+def test2(tmp_path):
+    path = str(tmp_path / "evaluations.jsonl")
+    with open(path, "w") as fp:
+        for states, ids in EVALUATIONS[:3]:
+            fp.write(json.dumps({"states": states, "ids": ids}) + "\n")
+        for states, ids in EVALUATIONS[3:]:
+            fp.write(json.dumps([states, ids]) + "\n")
+    assert list(bws.storage.read_evaluations(path)) == EVALUATIONS
+    state = bws.count_stream(path, chunk_size=3)
+    target = bws.CountingState().update(EVALUATIONS)
+    assert state.counts() == target.counts()
+
+
+def test3(tmp_path):
+    path = str(tmp_path / "evaluations.csv")
+    with open(path, "w") as fp:
+        fp.write("set,id,state\n")
+        for k, (states, ids) in enumerate(EVALUATIONS):
+            for uid, s in zip(ids, states):
+                fp.write(f"{k},{uid},{s}\n")
+    assert list(bws.storage.read_evaluations(path)) == EVALUATIONS
+    state = bws.count_stream(path, chunk_size=4, use_logical=False)
+    _, direct_dok, _, _, _ = bws.count(EVALUATIONS, use_logical=False)
+    assert state.direct_dok == direct_dok
+
+
+def test4():
+    chunks = list(bws.storage.chunked(range(5), 2))
+    assert chunks == [[0, 1], [2, 3], [4]]
+
+
+def test5(tmp_path):
+    path = str(tmp_path / "evaluations.json")
+    rows = [{"states": states, "ids": ids} for states, ids in EVALUATIONS]
+    rows[-1] = list(EVALUATIONS[-1])
+    with open(path, "w") as fp:
+        json.dump(rows, fp)
+    assert list(bws.storage.read_evaluations(path)) == EVALUATIONS
@@ -0,0 +1,82 @@
+import bwsample as bws
+
+
+EVALUATIONS = [
+    ([1, 0, 2], ['D', 'E', 'F']),
+    ([1, 0, 2], ['X', 'E', 'Z']),
+    ([1, 0, 2], ['E', 'Y', 'Z']),
+    ([0, 1, 2], ['D', 'Y', 'F']),
+]
+
+
+def test1():
+    state = bws.CountingState()
+    state.update(EVALUATIONS[:1])
+    state.update(EVALUATIONS[1:2])
+    assert state.logical_dok == {('D', 'Z'): 2, ('X', 'F'): 2}
+    assert state.logical_detail["nn"] == {('X', 'F'): 2, ('D', 'Z'): 2}
+    assert len(state.database) == 2
+    assert list(state.index['E']) == [0, 1]
+
+
+def test2():
+    # batching must not change the counts
+    state1 = bws.CountingState()
+    state1.update(EVALUATIONS)
+    state2 = bws.CountingState()
+    for evaluation in EVALUATIONS:
+        state2.update([evaluation])
+    assert state1.counts() == state2.counts()
+
+
+def test3():
+    # each new set is joined once with the previous sets
+    state = bws.CountingState(symmetric=False)
+    state.update(EVALUATIONS[:2])
+    state.update(EVALUATIONS[2:])
+    dok, direct_dok, _, logical_dok, _ = state.counts()
+    _, target_direct, _, _, _ = bws.count(EVALUATIONS, use_logical=False)
+    target_logical = {}
+    for k in range(1, len(EVALUATIONS)):
+        target_logical, _ = bws.counting.logical_infer_update(
+            EVALUATIONS[k:k + 1], database=EVALUATIONS[:k],
+            dok=target_logical)
+    assert direct_dok == target_direct
+    assert logical_dok == target_logical
+    assert dok == bws.add_dok(target_direct, target_logical)
+
+
+def test4():
+    state = bws.CountingState(use_logical=False)
+    state.update(EVALUATIONS)
+    assert state.logical_dok == {}
+    assert state.agg_dok == state.direct_dok
+
+
+def test5():
+    # same counts as the stateless `count`
+    state = bws.CountingState()
+    state.update(EVALUATIONS)
+    assert state.counts() == bws.count(EVALUATIONS)
+    state = bws.CountingState()
+    state.update(EVALUATIONS[:1])
+    state.update(EVALUATIONS[1:])
+    assert state.counts() == bws.count(EVALUATIONS)
+
+
+def test6():
+    # array-backed counts
+    state = bws.CountingState(backend='pairs')
+    state.update(EVALUATIONS[:1])
+    state.update(EVALUATIONS[1:])
+    assert isinstance(state.agg_dok, bws.PairCounter)
+    assert state.counts() == bws.count(EVALUATIONS)
+    dok = bws.count(EVALUATIONS[:2])[0]
+    state = bws.CountingState(
+        backend='pairs', direct_dok=dok,
+        logical_database=EVALUATIONS[:2])
+    state.update(EVALUATIONS[2:])
+    target = bws.CountingState(
+        direct_dok=dict(dok), logical_database=EVALUATIONS[:2])
+    target.update(EVALUATIONS[2:])
+    assert state.counts() == target.counts()
@@ -0,0 +1,41 @@
+import bwsample as bws
+import itertools
+
+
+def test1():
+    ids = [f"id{i}" for i in range(100)]
+    sampler = bws.adaptive.CoverageSampler(ids, n_items=4, seed=42)
+    samples = sampler.sample(n_sets=25)
+    # each item appears once
+    assert sampler.counts.tolist() == [1] * 100
+    samples += sampler.sample(n_sets=50)
+    # each item appears about 3 times
+    assert sampler.counts.min() >= 2
+    assert sampler.counts.max() <= 4
+    # no pair repeats
+    pairs = [tuple(sorted(p)) for bwsset in samples
+             for p in itertools.combinations(bwsset, 2)]
+    assert len(pairs) == len(set(pairs))
+
+
+def test2():
+    evaluations = (
+        ([1, 0, 0, 2], ['A', 'B', 'C', 'D']),
+        ([0, 1, 2, 0], ['A', 'B', 'E', 'F']),
+    )
+    sampler = bws.adaptive.CoverageSampler(['A', 'G', 'H'], n_items=3)
+    sampler.update(evaluations)
+    assert len(sampler) == 8
+    assert sampler.n_cooccur('A', 'B') == 2
+    assert sampler.n_cooccur('B', 'A') == 2
+    assert sampler.n_cooccur('C', 'E') == 0
+    # the least covered items first
+    bwsset = sorted(sampler.sample()[0])
+    assert bwsset[1:] == ['G', 'H']
+    assert bwsset[0] in ('C', 'D', 'E', 'F')
+
+
+def test3():
+    sampler = bws.adaptive.CoverageSampler(['A', 'B', 'C', 'D'], n_items=3)
+    samples = sampler.sample(n_sets=4)
+    assert all(len(set(bwsset)) == 3 for bwsset in samples)
@@ -0,0 +1,47 @@
+import bwsample as bws
+import numpy as np
+
+
+def to_dok(mat, vocab):
+    mat = mat.tocoo()
+    return {(vocab.ids[i], vocab.ids[j]): int(v)
+            for i, j, v in zip(mat.row, mat.col, mat.data) if v}
+
+
+def test1():
+    evaluations = (
+        ([0, 0, 2, 1], ['id1', 'id2', 'id3', 'id4']),
+        ([0, 1, 0, 2], ['id4', 'id5', 'id6', 'id1']),
+        ([0, 0, 0, 0], ['id4', 'id5', 'id6', 'id1']),
+        ([1, 1, 2, 0], ['id4', 'id5', 'id6', 'id1']))
+    states, ids, vocab = bws.counting.to_state_matrix(evaluations)
+    assert states.dtype == np.int8
+    assert ids.dtype == np.int32
+    cnt, detail = bws.counting.direct_extract_matrix(
+        states, ids, n_dim=len(vocab))
+    dok, target = bws.counting.direct_extract_batch(evaluations)
+    assert to_dok(cnt, vocab) == dok
+    for key in ("bw", "bn", "nw"):
+        assert to_dok(detail[key], vocab) == target[key]
+
+
+def test2():
+    np.random.seed(23)
+    evaluations = []
+    for _ in range(200):
+        stateids = [f"id{i}" for i in np.random.choice(50, 5, False)]
+        evaluations.append((list(np.random.permutation([1, 2, 0, 0, 0])),
+                            stateids))
+    # update in two batches with a growing vocabulary
+    states, ids, vocab = bws.counting.to_state_matrix(evaluations[:100])
+    cnt, detail = bws.counting.direct_extract_matrix(
+        states, ids, n_dim=len(vocab))
+    states, ids, vocab = bws.counting.to_state_matrix(
+        evaluations[100:], vocab=vocab)
+    cnt, detail = bws.counting.direct_extract_matrix(
+        states, ids, n_dim=len(vocab), cnt=cnt, detail=detail)
+    dok, target = bws.counting.direct_extract_batch(evaluations)
+    assert cnt.shape == (len(vocab), len(vocab))
+    assert to_dok(cnt, vocab) == dok
+    for key in ("bw", "bn", "nw"):
+        assert to_dok(detail[key], vocab) == target[key]
@@ -0,0 +1,50 @@
+import bwsample as bws
+import numpy as np
+import scipy.sparse
+import pytest
+
+
+def test1():
+    rng = np.random.default_rng(42)
+    A = rng.integers(0, 5, (40, 40)) * (rng.random((40, 40)) < 0.3)
+    cnt = scipy.sparse.csr_matrix(A.astype(float))
+    indices = [str(i) for i in range(40)]
+    positions, _, metrics, info = bws.ranking.eigenvector_estimation(
+        cnt, indices)
+    positions2, _, metrics2, info2 = bws.ranking.eigenvector_estimation(
+        cnt, indices, solver='power', tol=1e-12)
+    assert np.allclose(metrics, metrics2)
+    assert np.allclose(np.real(info["eigval"]), info2["eigval"])
+    assert info2["n_iter"] > 1
+    # warm start
+    _, _, metrics3, info3 = bws.ranking.eigenvector_estimation(
+        cnt, indices, solver='power', tol=1e-12, v0=info2["eigenvec"])
+    assert info3["n_iter"] <= 2
+    assert np.allclose(metrics2, metrics3)
+    # ARPACK with warm start
+    _, _, metrics4, _ = bws.ranking.eigenvector_estimation(
+        cnt, indices, v0=info["eigenvec"], tol=1e-10, maxiter=1000)
+    assert np.allclose(metrics, metrics4)
+
+
+def test2():
+    dok = {('A', 'B'): 2, ('B', 'C'): 1, ('A', 'C'): 3, ('C', 'D'): 1}
+    _, sortedids, _, _, info = bws.rank(
+        dok, method='eigen', solver='power', maxiter=5)
+    assert len(sortedids) == 4
+    assert info["n_iter"] <= 5
+    with pytest.raises(Exception):
+        bws.rank(dok, method='eigen', solver='xyz')
+
+
+def test3():
+    dok = {('A', 'B'): 2, ('B', 'C'): 1, ('A', 'C'): 3, ('C', 'D'): 1}
+    # arguments of other methods are ignored
+    _, sortedids, _, _, _ = bws.rank(dok, method='eigen', avg='exist')
+    assert len(sortedids) == 4
+    # warm start with a new item, and a too long initial vector
+    _, _, _, _, info = bws.rank(
+        dok, method='eigen', solver='power', v0=[0.5, 0.3, 0.2])
+    assert info["eigenvec"].shape == (4, 1)
+    with pytest.raises(ValueError):
+        bws.rank(dok, method='eigen', v0=np.ones(5))
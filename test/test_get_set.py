@@ -0,0 +1,52 @@
+import bwsample as bws
+import numpy as np
+import pytest
+
+
+def test1():
+    n_examples, n_items = 99, 4
+    target = bws.sample(
+        list(range(n_examples)), n_items, method='twice', shuffle=False)
+    n_total = bws.sampling.n_bwssets(n_examples, n_items, 'twice')
+    assert n_total == len(target)
+    for k in range(n_total):
+        indices = bws.sampling.get_set(
+            k, 0, n_examples, n_items, method='twice', shuffle=False)
+        assert indices.tolist() == target[k]
+
+
+def test2():
+    n_examples, n_items = 1000, 5
+    for k in (0, 17, 249):
+        a = bws.sampling.get_set(k, 42, n_examples, n_items)
+        b = bws.sampling.get_set(k, 42, n_examples, n_items)
+        c = bws.sampling.get_set(k, 0, n_examples, n_items, shuffle=False)
+        assert a.tolist() == b.tolist()
+        assert sorted(a.tolist()) == sorted(c.tolist())
+
+
+def test3():
+    with pytest.raises(IndexError):
+        bws.sampling.get_set(33, 42, 99, 4)
+    indices = bws.sampling.get_set(0, 42, 3, 4)
+    assert sorted(indices.tolist()) == [0, 0, 1, 2]
+
+
+def test4():
+    # same BWS sets as `sample` with the same seed
+    for n_examples, n_items in ((26, 4), (99, 4), (30, 2), (3, 4)):
+        for method in ('overlap', 'twice'):
+            target = bws.sample(
+                list(range(n_examples)), n_items, method=method, seed=42,
+                return_indices=True)
+            for k in range(len(target)):
+                indices = bws.sampling.get_set(
+                    k, 42, n_examples, n_items, method=method)
+                assert indices.tolist() == target[k].tolist()
+    # does not depend on the blocks
+    n_sets = bws.sampling.n_bwssets(60, 4, 'overlap')
+    target = bws.sampling.indices_shard(
+        n_sets, 4, 'overlap', seed=7, block_size=6) % 60
+    for k in range(n_sets):
+        indices = bws.sampling.get_set(k, 7, 60, 4)
+        assert indices.tolist() == target[k].tolist()
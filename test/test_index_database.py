@@ -0,0 +1,61 @@
+import bwsample as bws
+import numpy as np
+
+
+def test1():
+    database = (
+        ([0, 0, 2, 1], ['A', 'B', 'C', 'D']),
+        ([0, 1, 0, 2], ['D', 'E', 'F', 'A']))
+    index = bws.counting.index_database(database)
+    assert index == {
+        'A': [0, 1], 'B': [0], 'C': [0], 'D': [0, 1], 'E': [1], 'F': [1]}
+
+
+def test2():
+    database = [([0, 0, 2, 1], ['A', 'B', 'C', 'D'])]
+    index = bws.counting.index_database(database)
+    index = bws.counting.index_database(
+        [([0, 1, 0, 2], ['D', 'E', 'F', 'A'])], index=index, offset=1)
+    assert index['A'] == [0, 1]
+    assert index['E'] == [1]
+
+
+def test3():
+    # the index must not change the counts
+    np.random.seed(42)
+    ids = [f"id{i}" for i in range(30)]
+    evaluations = []
+    for _ in range(50):
+        stateids = list(np.random.choice(ids, 4, replace=False))
+        evaluations.append(([1, 0, 0, 2], stateids))
+    database = evaluations[:25]
+
+    dok, detail = bws.counting.logical_infer_update(
+        evaluations, database=database)
+
+    target, nn, nb, nw, bn, bw, wn, wb = {}, {}, {}, {}, {}, {}, {}, {}
+    for states1, ids1 in evaluations:
+        for states2, ids2 in database:
+            bws.counting.logical_infer(
+                ids1, ids2, states1, states2, dok=target,
+                dok_nn=nn, dok_nb=nb, dok_nw=nw, dok_bn=bn,
+                dok_bw=bw, dok_wn=wn, dok_wb=wb)
+    assert dok == target
+    assert detail["nn"] == nn
+    assert detail["wb"] == wb
+
+
+def test4():
+    # a dict database is indexed by its keys
+    database = {
+        7: ([0, 0, 2, 1], ['A', 'B', 'C', 'D']),
+        9: ([0, 1, 0, 2], ['D', 'E', 'F', 'A'])}
+    index = bws.counting.index_database(database)
+    assert index['A'] == [7, 9]
+    assert index['E'] == [9]
+    evaluations = [([1, 0, 2], ['A', 'X', 'F'])]
+    dok, _ = bws.counting.logical_infer_update(
+        evaluations, database=database, index=index)
+    target, _ = bws.counting.logical_infer_update(
+        evaluations, database=list(database.values()))
+    assert dok == target
@@ -0,0 +1,58 @@
+import bwsample as bws
+import numpy as np
+import itertools
+import collections
+import pytest
+
+
+def test1():
+    for n_examples, n_items, n_cover in [(1000, 4, 3), (120, 4, 5),
+                                         (600, 6, 4)]:
+        bwsindices, n = bws.sampling.indices_kcover_array(
+            n_examples, n_items, n_cover)
+        assert n == n_examples
+        assert bwsindices.shape == (
+            n_cover * n_examples // n_items, n_items)
+        # each example occurs n_cover times
+        assert np.bincount(bwsindices.ravel()).tolist() == \
+            [n_cover] * n_examples
+        # no pair of examples repeats
+        pairs = collections.Counter(
+            tuple(sorted(p)) for bwsset in bwsindices.tolist()
+            for p in itertools.combinations(bwsset, 2))
+        assert max(pairs.values()) == 1
+
+
+def test2():
+    # filled up BWS sets
+    bwsindices, _ = bws.sampling.indices_kcover_array(
+        997, 5, 5, shuffle=False)
+    assert bwsindices.shape == (1000, 5)
+    assert np.bincount(bwsindices.ravel()).min() == 5
+    assert all(len(set(bwsset)) == 5 for bwsset in bwsindices.tolist())
+
+
+def test3():
+    examples = [f"id{i}" for i in range(100)]
+    samples = bws.sample(examples, n_items=4, method='kcover', n_cover=3,
+                         seed=42)
+    assert len(samples) == 75
+    assert samples == bws.sample(
+        examples, n_items=4, method='kcover', n_cover=3, seed=42)
+    bwsindices, _ = bws.sampling.indices_kcover(100, 4, 3, shuffle=False)
+    assert len(bwsindices) == 75
+
+
+def test4():
+    # too few examples for 4 rounds without repeated pairs
+    with pytest.warns(UserWarning, match="repeat"):
+        bwsindices, _ = bws.sampling.indices_kcover_array(
+            30, 6, 4, shuffle=False)
+    pairs = collections.Counter(
+        tuple(sorted(p)) for bwsset in bwsindices.tolist()
+        for p in itertools.combinations(bwsset, 2))
+    assert max(pairs.values()) < 4
+    assert len(pairs) > 200
+    with pytest.warns(UserWarning, match="Not enough examples"):
+        bwsindices, _ = bws.sampling.indices_kcover_array(3, 4, 2)
+    assert bwsindices.shape == (0, 4)
@@ -1,4 +1,5 @@
 import bwsample as bws
+import numpy as np
 import itertools
 
 
@@ -100,3 +101,24 @@ def test11():
         assert i in idx2
     for i in idx2:
         assert i in idx1
+
+
+def test_array1():
+    bwsindices, n_examples = bws.sampling.indices_overlap_array(
+        1000, 4, shuffle=True)
+    assert isinstance(bwsindices, np.ndarray)
+    assert bwsindices.shape == (1000, 4)
+    assert n_examples == 3000
+    assert np.unique(bwsindices).size == 3000
+
+
+def test_array2():
+    # output of the former loop implementation with the same global seed
+    np.random.seed(42)
+    bwsindices, n_examples = bws.sampling.indices_overlap_array(
+        8, 5, shuffle=True)
+    assert n_examples == 32
+    assert bwsindices.tolist() == [
+        [3, 1, 4, 0, 2], [8, 4, 6, 7, 5], [9, 8, 12, 11, 10],
+        [15, 13, 16, 12, 14], [19, 17, 20, 16, 18], [24, 21, 20, 23, 22],
+        [25, 24, 26, 28, 27], [0, 28, 30, 31, 29]]
@@ -1,4 +1,5 @@
 import bwsample as bws
+import numpy as np
 import itertools
 from collections import Counter
 
@@ -52,3 +53,30 @@ def test6():
         n_sets, n_items, shuffle)
     for bwsset in bwsindices:
         assert len(bwsset) == 3
+
+
+def test_array1():
+    bwsindices, n_examples = bws.sampling.indices_twice_array(
+        1000, 4, shuffle=True)
+    assert bwsindices.shape == (1000 + 500, 4)
+    counts = Counter(bwsindices.reshape(-1).tolist())
+    assert all(c == 2 for c in counts.values())
+
+
+def test_array2():
+    # too few BWS sets for connectors
+    bwsindices, n_examples = bws.sampling.indices_twice_array(2, 3, False)
+    assert bwsindices.tolist() == [[0, 1, 2], [2, 3, 0]]
+
+
+def test_array3():
+    # output of the former loop implementation with the same global seed
+    np.random.seed(42)
+    bwsindices, n_examples = bws.sampling.indices_twice_array(
+        8, 4, shuffle=True)
+    assert n_examples == 24
+    assert bwsindices.tolist() == [
+        [3, 1, 0, 2], [4, 3, 6, 5], [9, 7, 6, 8], [12, 10, 9, 11],
+        [15, 12, 14, 13], [16, 15, 18, 17], [21, 18, 20, 19],
+        [0, 22, 21, 23], [1, 7, 13, 19], [2, 8, 14, 20], [4, 10, 16, 22],
+        [5, 11, 17, 23]]
@@ -0,0 +1,51 @@
+import bwsample as bws
+import numpy as np
+
+
+def brute_force(evaluations):
+    dok, nn, nb, nw, bn, bw, wn, wb = {}, {}, {}, {}, {}, {}, {}, {}
+    for k1, (states1, ids1) in enumerate(evaluations):
+        for k2, (states2, ids2) in enumerate(evaluations):
+            if k1 != k2:
+                bws.counting.logical_infer(
+                    ids1, ids2, states1, states2, dok=dok, dok_nn=nn,
+                    dok_nb=nb, dok_nw=nw, dok_bn=bn, dok_bw=bw, dok_wn=wn,
+                    dok_wb=wb)
+    detail = {"nn": nn, "nb": nb, "nw": nw, "bn": bn, "bw": bw, "wn": wn,
+              "wb": wb}
+    return dok, detail
+
+
+def test1():
+    np.random.seed(42)
+    evaluations = []
+    for _ in range(60):
+        stateids = [f"id{i}" for i in np.random.choice(30, 4, False)]
+        evaluations.append((list(np.random.permutation([1, 2, 0, 0])),
+                            stateids))
+    dok, detail = bws.counting.logical_infer_update(evaluations)
+    target_dok, target_detail = brute_force(evaluations)
+    assert dok == target_dok
+    for key in target_detail:
+        assert detail[key] == target_detail[key]
+
+
+def test2():
+    # no self-join of a BWS set
+    evaluations = [([1, 0, 2], ['D', 'E', 'F'])]
+    dok, detail = bws.counting.logical_infer_update(evaluations)
+    assert dok == {}
+
+
+def test3():
+    np.random.seed(23)
+    evaluations = []
+    for _ in range(40):
+        stateids = [f"id{i}" for i in np.random.choice(20, 4, False)]
+        evaluations.append((list(np.random.permutation([1, 2, 0, 0])),
+                            stateids))
+    dok, detail = bws.counting.logical_infer_update(evaluations)
+    dok2, detail2 = bws.counting.logical_infer_update(evaluations, n_jobs=4)
+    assert list(dok.items()) == list(dok2.items())
+    for key in detail:
+        assert list(detail[key].items()) == list(detail2[key].items())
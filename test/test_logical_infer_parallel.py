@@ -0,0 +1,42 @@
+import bwsample as bws
+import numpy as np
+
+
+def test1():
+    np.random.seed(42)
+    evaluations = []
+    for _ in range(60):
+        stateids = [f"id{i}" for i in np.random.choice(40, 4, False)]
+        evaluations.append(([1, 0, 0, 2], stateids))
+
+    dok, detail = bws.counting.logical_infer_update(evaluations)
+    dok2, detail2 = bws.counting.logical_infer_update(evaluations, n_jobs=3)
+    assert list(dok.items()) == list(dok2.items())
+    for key in detail:
+        assert list(detail[key].items()) == list(detail2[key].items())
+
+
+def test2():
+    evaluations = [
+        ([1, 0, 2], ['D', 'E', 'F']), ([1, 0, 2], ['X', 'E', 'Z'])]
+    res1 = bws.count(evaluations)
+    res2 = bws.count(evaluations, n_jobs=2)
+    assert res1 == res2
+
+
+def test3():
+    # the half-join's first BWS sets have more joins, i.e. smaller shards
+    evaluations = [([1, 0, 2], ['A', 'B', 'C'])] * 100
+    index = bws.counting.index_database(evaluations)
+    bounds = bws.counting._shard_bounds(evaluations, index, 2, True)
+    assert bounds[0] == 0 and bounds[-1] == 100
+    assert 25 <= bounds[1] <= 35
+    bounds = bws.counting._shard_bounds(evaluations, index, 2, False)
+    assert bounds == [0, 50, 100]
+    # with a database
+    database = evaluations[:50]
+    dok, _ = bws.counting.logical_infer_update(
+        evaluations[50:60], database=database)
+    dok2, _ = bws.counting.logical_infer_update(
+        evaluations[50:60], database=database, n_jobs=3)
+    assert dok == dok2
@@ -0,0 +1,28 @@
+import bwsample as bws
+import numpy as np
+import scipy.sparse
+import scipy.stats
+
+
+def test1():
+    dok = {('A', 'B'): 5, ('B', 'A'): 1, ('A', 'C'): 2, ('C', 'B'): 3,
+           ('B', 'C'): 3}
+    cnt, indices = bws.to_scipy(dok)
+    _, _, _, info = bws.ranking.maximize_minuspvalue(cnt, indices)
+    P = info["P"]
+    _, pval = scipy.stats.chisquare([5, 1], [3, 3])
+    assert np.isclose(P[0, 1], 1 - pval)
+    _, pval = scipy.stats.chisquare([2, 0], [1, 1])
+    assert np.isclose(P[0, 2], 1 - pval)
+    # no p-values for Nij<=Nji
+    assert P[1, 0] == 0 and P[2, 0] == 0
+    assert P[1, 2] == 0 and P[2, 1] == 0
+    assert P.nnz == 2
+
+
+def test2():
+    cnt = scipy.sparse.csr_matrix((3, 3))
+    _, _, metrics, info = bws.ranking.maximize_minuspvalue(
+        cnt, ['A', 'B', 'C'])
+    assert info["P"].nnz == 0
+    assert metrics.tolist() == [0, 0, 0]
@@ -0,0 +1,41 @@
+import bwsample as bws
+import pickle
+
+
+def test1():
+    parsed = bws.counting.ParsedEvaluation([1, 0, 2, 0], ['D', 'E', 'F', 'G'])
+    assert parsed.best == ['D']
+    assert parsed.worst == ['F']
+    assert parsed.notbest == ['E', 'F', 'G']
+    assert parsed.notworst == ['D', 'E', 'G']
+    assert parsed.pos == {'D': 0, 'E': 1, 'F': 2, 'G': 3}
+    states, ids = parsed
+    assert states == [1, 0, 2, 0]
+    assert ids == ['D', 'E', 'F', 'G']
+
+
+def test2():
+    parsed = bws.counting.ParsedEvaluation([1, 0, 2], ['D', 'E', 'F'])
+    assert bws.counting.parse_evaluation(parsed) is parsed
+    restored = pickle.loads(pickle.dumps(parsed))
+    assert restored.pos == parsed.pos
+    assert restored.notbest == parsed.notbest
+
+
+def test3():
+    # bw: X>E, X>F, Y>E, Y>F
+    e1 = bws.counting.ParsedEvaluation((1, 0, 2), ('D', 'E', 'F'))
+    e2 = bws.counting.ParsedEvaluation((1, 0, 2), ('X', 'Y', 'D'))
+    dok, nn, nb, nw, bn, bw, wn, wb = bws.counting.logical_infer_parsed(
+        e1, e2)
+    target = {('X', 'E'): 1, ('X', 'F'): 1, ('Y', 'E'): 1, ('Y', 'F'): 1}
+    assert dok == target
+    assert bw == target
+
+
+def test4():
+    state = bws.CountingState()
+    state.update([([1, 0, 2], ['D', 'E', 'F']), ([1, 0, 2], ['X', 'E', 'Z'])])
+    assert all(isinstance(e, bws.counting.ParsedEvaluation)
+               for e in state.database.values())
+    assert state.logical_dok == {('D', 'Z'): 2, ('X', 'F'): 2}
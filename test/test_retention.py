@@ -0,0 +1,70 @@
+import bwsample as bws
+import pytest
+
+
+EVALUATIONS = [
+    ([1, 0, 2], ['A', 'B', 'C']),
+    ([1, 0, 2], ['A', 'D', 'E']),
+    ([1, 0, 2], ['F', 'B', 'G']),
+    ([1, 0, 2], ['A', 'H', 'I']),
+    ([1, 0, 2], ['J', 'K', 'C']),
+]
+
+
+def test1():
+    state = bws.CountingState(
+        retention=bws.retention.WindowRetention(max_size=2))
+    state.update(EVALUATIONS)
+    assert list(state.database) == [3, 4]
+    assert set(state.index) == {'A', 'H', 'I', 'J', 'K', 'C'}
+
+
+def test2():
+    state = bws.CountingState(
+        retention=bws.retention.ItemCapRetention(max_sets=1))
+    state.update(EVALUATIONS)
+    # 'A' evicts sets 0 and 1, 'C' evicts set 0 (already gone)
+    assert list(state.database) == [2, 3, 4]
+    assert list(state.index['A']) == [3]
+
+
+def test3():
+    state = bws.CountingState(
+        retention=bws.retention.LRURetention(max_size=2))
+    state.update(EVALUATIONS[:2])
+    # set 2 uses set 0 via 'B', i.e. set 1 is evicted
+    state.update(EVALUATIONS[2:3])
+    assert list(state.database) == [0, 2]
+    # set 3 uses set 0 via 'A', i.e. set 2 is evicted
+    state.update(EVALUATIONS[3:4])
+    assert sorted(state.database) == [0, 3]
+
+
+def test4():
+    policy = bws.retention.ReservoirRetention(max_size=3, seed=42)
+    state = bws.CountingState(retention=policy)
+    state.update(EVALUATIONS * 20)
+    assert len(state.database) == 3
+    assert sorted(policy.slots) == sorted(state.database)
+    assert policy.n_seen == 100
+
+
+def test5():
+    # retention only bounds the joins, the counts are kept
+    state = bws.CountingState(
+        retention=bws.retention.WindowRetention(max_size=1))
+    state.update(EVALUATIONS[:2])
+    assert state.logical_dok == bws.CountingState().update(
+        EVALUATIONS[:2]).logical_dok
+    state.update(EVALUATIONS[2:3])
+    assert state.logical_dok == bws.CountingState().update(
+        EVALUATIONS[:2]).logical_dok
+
+
+def test6():
+    for policy in (bws.retention.WindowRetention,
+                   bws.retention.LRURetention,
+                   bws.retention.ReservoirRetention,
+                   bws.retention.ItemCapRetention):
+        with pytest.raises(ValueError):
+            policy(0)
@@ -1,4 +1,5 @@
 import bwsample
+import numpy as np
 import itertools
 from collections import Counter
 
@@ -50,3 +51,36 @@ def test5():
     counts = list(Counter(itertools.chain(*sample)).values())
     # assert sum([c == 2 for c in counts]) == len(sample)
     assert sum(counts) == ((len(examples) * 2) // n_items) * n_items
+
+
+def test6():
+    n_items, method = 4, 'overlap'
+    examples = [chr(x) for x in range(99)]
+    indices = bwsample.sample(
+        examples, n_items=n_items, method=method, return_indices=True)
+    assert indices.shape == (33, n_items)
+    counts = Counter(indices.reshape(-1).tolist())
+    assert len(counts) == len(examples)
+
+
+def test7():
+    n_items = 4
+    examples = [chr(x) for x in range(99)]
+    np.random.seed(42)
+    indices = bwsample.sample(examples, n_items=n_items, return_indices=True)
+    np.random.seed(42)
+    sample = bwsample.sample(examples, n_items=n_items)
+    assert sample == [[examples[i] for i in row] for row in indices]
+
+
+def test8():
+    # fewer examples than `n_items` do not repeat examples in a BWS set
+    examples = ['a', 'b', 'c']
+    sample = bwsample.sample(examples, n_items=4, shuffle=False)
+    assert sample == [['a', 'b', 'c']]
+    for method in ('overlap', 'twice'):
+        sample = bwsample.sample(examples, n_items=4, method=method, seed=42)
+        assert sorted(sample[0]) == examples
+        sample = list(bwsample.sampling.sample_iter(
+            examples, n_items=4, method=method, seed=42))
+        assert sorted(sample[0]) == examples
@@ -0,0 +1,36 @@
+import bwsample
+import itertools
+import numpy as np
+from collections import Counter
+
+
+def test1():
+    examples = [chr(x) for x in range(99)]
+    samples = list(bwsample.sample_iter(
+        examples, n_items=4, shuffle=False, chunk_size=5))
+    target = bwsample.sample(examples, n_items=4, shuffle=False)
+    assert samples == target
+
+
+def test2():
+    examples = [chr(x) for x in range(100)]
+    samples = list(bwsample.sample_iter(
+        examples, n_items=3, method='twice', chunk_size=7))
+    assert len(samples) == (len(examples) * 2) // 3
+    counts = Counter(itertools.chain(*samples))
+    assert sum(counts.values()) == len(samples) * 3
+    assert set(counts) == set(examples)
+
+
+def test3():
+    gen = bwsample.sample_iter(
+        list(range(10**6)), n_items=4, return_indices=True)
+    first = next(gen)
+    assert isinstance(first, np.ndarray)
+    assert len(first) == 4
+
+
+def test4(recwarn):
+    samples = list(bwsample.sample_iter(['a'], n_items=4))
+    assert samples == []
+    assert str(recwarn.pop(UserWarning).message) == "Zero BWS sets requested."
@@ -0,0 +1,50 @@
+import bwsample as bws
+import asyncio
+import pytest
+
+
+def test1():
+    examples = [f"id{i}" for i in range(30)]
+
+    async def main():
+        async with bws.SamplePool(examples, n_items=4, maxsize=8,
+                                  low_water=2, seed=42) as pool:
+            # concurrent requests
+            bwssets = await asyncio.gather(*[pool.get() for _ in range(50)])
+            # wait until the background task refilled the queue
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 10.0
+            while pool.qsize() <= 2 and loop.time() < deadline:
+                await asyncio.sleep(0.01)
+            return bwssets, pool.qsize(), pool.n_designs
+
+    bwssets, qsize, n_designs = asyncio.run(main())
+    assert len(bwssets) == 50
+    assert all(len(set(bwsset)) == 4 for bwsset in bwssets)
+    # one design has 10 BWS sets
+    assert n_designs >= 5
+    # refilled in the background
+    assert qsize > 2
+
+
+def test2():
+    # same BWS sets with the same seed
+    examples = list(range(100))
+
+    async def main():
+        pool = bws.SamplePool(examples, n_items=5, maxsize=16, seed=1,
+                              method='twice', return_indices=True)
+        bwssets = await pool.get_many(40)
+        await pool.close()
+        return [x.tolist() for x in bwssets]
+
+    assert asyncio.run(main()) == asyncio.run(main())
+
+
+def test3():
+    async def main():
+        async with bws.SamplePool(['a', 'b'], n_items=4) as pool:
+            await pool.get()
+
+    with pytest.raises(Exception):
+        asyncio.run(main())
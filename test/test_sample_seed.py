@@ -0,0 +1,64 @@
+import bwsample as bws
+import numpy as np
+
+
+def test1():
+    examples = list(range(1000))
+    for method in ('overlap', 'twice'):
+        a = bws.sample(examples, 4, method, return_indices=True, seed=42)
+        b = bws.sample(examples, 4, method, return_indices=True, seed=42)
+        c = bws.sample(examples, 4, method, return_indices=True, seed=43)
+        assert np.array_equal(a, b)
+        assert not np.array_equal(a, c)
+
+
+def test2():
+    # same indices as the unshuffled design, row by row
+    for method, fn in (('overlap', bws.sampling.indices_overlap_array),
+                       ('twice', bws.sampling.indices_twice_array)):
+        a, n_a = fn(1000, 5, shuffle=False)
+        b, n_b = fn(1000, 5, shuffle=True, seed=7)
+        assert n_a == n_b
+        assert a.shape == b.shape
+        assert np.array_equal(np.sort(a, axis=1), np.sort(b, axis=1))
+
+
+def test3():
+    # the stacked shards are identical to the serial run
+    for method in ('overlap', 'twice'):
+        serial = bws.sampling.indices_shard(
+            5000, 4, method, seed=42, block_size=300)
+        shards = [bws.sampling.indices_shard(
+            5000, 4, method, seed=42, shard=s, n_shards=7, block_size=300)
+            for s in range(7)]
+        assert np.array_equal(serial, np.vstack(shards))
+
+
+def test4():
+    for method in ('overlap', 'twice'):
+        serial = bws.sample(
+            list(range(60000)), 4, method, return_indices=True, seed=123)
+        merged = bws.sample(
+            list(range(60000)), 4, method, return_indices=True, seed=123,
+            n_jobs=3)
+        assert np.array_equal(serial, merged)
+
+
+def test5():
+    # chunks of `sample_iter` are the seeded blocks
+    examples = list(range(3000))
+    a = np.vstack(list(bws.sampling.sample_iter(
+        examples, 4, 'twice', chunk_size=10000, return_indices=True,
+        seed=np.random.SeedSequence(5))))
+    b = bws.sample(examples, 4, 'twice', return_indices=True,
+                   seed=np.random.SeedSequence(5))
+    assert np.array_equal(a, b)
+
+
+def test6():
+    # a Generator is used as one random stream
+    a, _ = bws.sampling.indices_overlap_array(
+        100, 4, seed=np.random.default_rng(1))
+    b, _ = bws.sampling.indices_overlap_array(
+        100, 4, seed=np.random.default_rng(1))
+    assert np.array_equal(a, b)
@@ -1,4 +1,5 @@
 import bwsample as bws
+import numpy as np
 
 
 def test1():
@@ -17,3 +18,10 @@ def test2():
     for i in range(len(out)):
         for v in out[i]:
             assert v in arrs[i]
+
+
+def test3():
+    arrs = np.arange(12).reshape(4, 3)
+    out = bws.sampling.shuffle_subarrs(arrs.copy())
+    assert out.shape == (4, 3)
+    assert (np.sort(out, axis=1) == arrs).all()
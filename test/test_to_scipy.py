@@ -8,3 +8,24 @@ def test1():
     assert len(indices) == 3
     assert cnt[0, 1] == 2  # A,B
     assert cnt[0, 2] == 3  # A,D
+
+
+def test2():
+    dok = {('A', 'D'): 3, ('A', 'B'): 2}
+    vocab = bws.Vocabulary(['D', 'C'])
+    cnt, indices = bws.to_scipy(dok, vocab=vocab)
+    assert indices == ['D', 'C', 'A', 'B']
+    assert cnt.shape == (4, 4)
+    assert cnt[2, 0] == 3  # A,D
+    assert cnt[2, 3] == 2  # A,B
+    # the indices are stable
+    cnt, indices = bws.to_scipy({('B', 'E'): 1}, vocab=vocab)
+    assert indices == ['D', 'C', 'A', 'B', 'E']
+    assert cnt[3, 4] == 1
+    assert cnt.nnz == 1
+
+
+def test3():
+    cnt, indices = bws.to_scipy({})
+    assert cnt.shape == (0, 0)
+    assert indices == []
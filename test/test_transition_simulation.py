@@ -0,0 +1,27 @@
+import bwsample as bws
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+
+
+def test1():
+    rng = np.random.default_rng(42)
+    A = rng.integers(0, 5, (30, 30)) * (rng.random((30, 30)) < 0.3)
+    cnt = scipy.sparse.csr_matrix(A.astype(float))
+    indices = [str(i) for i in range(30)]
+    # dense reference
+    rowsum = A.sum(axis=0)
+    G = A.T.astype(float)
+    np.fill_diagonal(G, -rowsum)
+    G = G / np.maximum(1, rowsum)[:, None]
+    T = scipy.linalg.expm(G)
+    x = np.ones(30) / 30 @ T @ T @ T
+    _, _, _, info = bws.ranking.transition_simulation(
+        cnt, indices, n_rounds=3)
+    assert np.allclose(info["genmat"].toarray(), G)
+    assert np.allclose(info["sim"], x)
+    assert "transmat" not in info
+    _, _, _, info = bws.ranking.transition_simulation(
+        cnt, indices, n_rounds=3, return_transmat=True)
+    assert np.allclose(info["transmat"].toarray(), T)
+    assert np.allclose(info["sim"], x)
@@ -0,0 +1,73 @@
+import bwsample as bws
+import numpy as np
+
+
+def test1():
+    vocab = bws.Vocabulary()
+    idx = vocab.encode(['A', 'B', 'C', 'A'])
+    assert idx.dtype == np.int32
+    assert idx.tolist() == [0, 1, 2, 0]
+    assert vocab.decode(idx) == ['A', 'B', 'C', 'A']
+    assert len(vocab) == 3
+    assert 'B' in vocab
+
+
+def test2():
+    dok = {('A', 'B'): 2, ('B', 'C'): 1, ('C', 'A'): 5}
+    vocab = bws.Vocabulary()
+    pairs = bws.PairCounter.from_dok(dok, vocab)
+    assert len(pairs) == 3
+    assert pairs.to_dok(vocab) == dok
+    assert pairs.counts.dtype == np.uint64
+
+
+def test3():
+    vocab = bws.Vocabulary(['A', 'B', 'C'])
+    pairs = bws.PairCounter(buffer_size=2)
+    pairs.add([0, 0, 1], [1, 1, 2])
+    pairs.add([0], [1], [3])
+    assert pairs.get(0, 1) == 5
+    assert pairs.get(1, 2) == 1
+    assert pairs.get(2, 1) == 0
+    other = bws.PairCounter().add([2], [0])
+    pairs.update(other)
+    assert pairs.to_dok(vocab) == {
+        ('A', 'B'): 5, ('B', 'C'): 1, ('C', 'A'): 1}
+
+
+def test4():
+    dok = {('A', 'D'): 3, ('A', 'B'): 2}
+    vocab = bws.Vocabulary(['A', 'B', 'D'])
+    cnt = bws.PairCounter.from_dok(dok, vocab).to_scipy(len(vocab))
+    assert cnt.shape == (3, 3)
+    assert cnt[0, 1] == 2
+    assert cnt[0, 2] == 3
+
+
+def test5():
+    detail = {"bw": {('A', 'B'): 1}, "bn": {}, "nw": {('B', 'C'): 4}}
+    vocab = bws.Vocabulary()
+    compact = bws.vocab.detail_to_pairs(detail, vocab)
+    assert bws.vocab.pairs_to_detail(compact, vocab) == detail
+
+
+def test6():
+    # many merges with known and new keys
+    rng = np.random.default_rng(42)
+    pairs = bws.PairCounter(buffer_size=50)
+    target = {}
+    for _ in range(20):
+        rows, cols = rng.integers(0, 10, 30), rng.integers(0, 10, 30)
+        pairs.add(rows, cols)
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            target[(i, j)] = target.get((i, j), 0) + 1
+    assert np.all(np.diff(pairs.keys.astype(np.int64)) > 0)
+    assert {(i, j): pairs.get(i, j) for i, j in target} == target
+    assert len(pairs) == len(target)
+
+
+def test7():
+    # counts beyond uint32
+    pairs = bws.PairCounter().add([0], [1], [2**32 - 1])
+    pairs.add([0], [1], [2])
+    assert pairs.get(0, 1) == 2**32 + 1